@@ -1,3 +1,13 @@
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def two_sum(numbers, target):
     num_to_index = {}
     for index, number in enumerate(numbers):
@@ -8,7 +18,146 @@ def two_sum(numbers, target):
     return []
 
 
+class TwoSumIndex:
+    # Индекс по массиву чисел: строится один раз и отвечает на пакеты целевых сумм.
+    # Если пар не больше pair_limit, хранится отсортированная таблица всех попарных сумм,
+    # иначе каждая цель проверяется векторно через searchsorted по отсортированной копии.
+    # Таблица занимает 24 байта на пару (сумма и два индекса), а при построении - около 70,
+    # поэтому по умолчанию она строится только до 2**20 пар (~1450 чисел, ~24 МБ, ~70 МБ в пике).
+    # Больший pair_limit ускоряет запросы ценой памяти: 2**24 пар - уже ~400 МБ и ~1.1 ГБ в пике.
+    def __init__(self, numbers, pair_limit=1 << 20, block_size=1 << 22):
+        if np is None:
+            raise ImportError("Для TwoSumIndex необходим numpy")
+        values = np.asarray(numbers)
+        self.order = np.argsort(values, kind="stable")
+        self.sorted_values = values[self.order]
+        self.block_size = block_size
+        self.pair_sums = None
+
+        n = len(values)
+        if n * (n - 1) // 2 <= pair_limit:
+            first, second = np.triu_indices(n, 1)
+            sums = values[first] + values[second]
+            by_sum = np.argsort(sums, kind="stable")
+            self.pair_sums = sums[by_sum]
+            self.pairs = np.stack([first[by_sum], second[by_sum]], axis=1)
+
+    def query(self, target):
+        found = self.query_batch([target])[0]
+        return found.tolist() if found[0] >= 0 else []
+
+    def query_batch(self, targets):
+        # Массив формы (len(targets), 2) с индексами пары (i < j) или -1, если пары нет
+        targets = np.asarray(targets)
+        pairs = np.full((len(targets), 2), -1, dtype=np.int64)
+        if self.pair_sums is not None:
+            if len(self.pair_sums):
+                pos = np.searchsorted(self.pair_sums, targets)
+                pos_clipped = np.minimum(pos, len(self.pair_sums) - 1)
+                hit = (pos < len(self.pair_sums)) & (self.pair_sums[pos_clipped] == targets)
+                pairs[hit] = self.pairs[pos_clipped[hit]]
+            return pairs
+
+        n = len(self.sorted_values)
+        step = max(1, self.block_size // max(n, 1))
+        for start in range(0, len(targets), step):
+            block = targets[start : start + step]
+            pairs[start : start + step] = self._scan_block(block)
+        return pairs
+
+    def _scan_block(self, block):
+        values = self.sorted_values
+        n = len(values)
+        complements = block[:, None] - values[None, :]
+        left = np.searchsorted(values, complements, side="left")
+        right = np.searchsorted(values, complements, side="right")
+        # Если дополнение равно самому числу, нужна вторая его копия
+        same = complements == values[None, :]
+        ok = (right - left) > same
+        positions = np.arange(n)[None, :]
+        partner = np.where(same & (left == positions), left + 1, left)
+
+        pairs = np.full((len(block), 2), -1, dtype=np.int64)
+        rows = np.flatnonzero(ok.any(axis=1))
+        first = ok[rows].argmax(axis=1)
+        pair = np.stack([self.order[first], self.order[partner[rows, first]]], axis=1)
+        pairs[rows] = np.sort(pair, axis=1)
+        return pairs
+
+
+def _two_pointer(values, start, remaining):
+    low, high = start, len(values) - 1
+    while low < high:
+        current = values[low] + values[high]
+        if current == remaining:
+            return [low, high]
+        if current < remaining:
+            low += 1
+        else:
+            high -= 1
+    return None
+
+
+def _k_sum_search(values, start, remaining, count):
+    if count == 1:
+        for pos in range(start, len(values)):
+            if values[pos] == remaining:
+                return [pos]
+        return None
+    if count == 2:
+        return _two_pointer(values, start, remaining)
+    for pos in range(start, len(values) - count + 1):
+        if pos > start and values[pos] == values[pos - 1]:
+            continue
+        rest = _k_sum_search(values, pos + 1, remaining - values[pos], count - 1)
+        if rest is not None:
+            return [pos] + rest
+    return None
+
+
+def k_sum(numbers, target, k):
+    # Индексы k различных элементов с суммой target (или [], если таких нет):
+    # сортировка и сведение к задаче двух сумм с двумя указателями, O(n^(k-1))
+    if k < 1:
+        raise ValueError("k должно быть положительным")
+    order = sorted(range(len(numbers)), key=lambda index: numbers[index])
+    values = [numbers[index] for index in order]
+    found = _k_sum_search(values, 0, target, k)
+    return sorted(order[pos] for pos in found) if found is not None else []
+
+
+def three_sum(numbers, target):
+    return k_sum(numbers, target, 3)
+
+
+def benchmark(size=2000, queries=20_000):
+    rng = random.Random(0)
+    numbers = [rng.randint(-(10**6), 10**6) for _ in range(size)]
+    targets = [rng.randint(-(2 * 10**6), 2 * 10**6) for _ in range(queries)]
+
+    start = time.perf_counter()
+    expected = [bool(two_sum(numbers, target)) for target in targets]
+    print(f"two_sum в цикле:          {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    index = TwoSumIndex(numbers, pair_limit=size * (size - 1) // 2)
+    print(f"Построение таблицы пар:   {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    found = index.query_batch(targets)
+    print(f"Пакетный запрос:          {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    scanned = TwoSumIndex(numbers, pair_limit=0).query_batch(targets)
+    print(f"Пакетный запрос (поиск): {time.perf_counter() - start:.3f} с")
+    assert (found[:, 0] >= 0).tolist() == expected == (scanned[:, 0] >= 0).tolist()
+
+
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+        sys.exit()
+
     N = int(input("Введите количество элементов в массиве: "))
 
     _numbers = []
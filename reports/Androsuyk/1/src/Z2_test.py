@@ -1,5 +1,5 @@
 import pytest
-from Z2 import two_sum
+from Z2 import TwoSumIndex, k_sum, three_sum, two_sum
 
 
 def test_two_sum_basic():
@@ -45,3 +45,47 @@ def test_invalid_input():
         two_sum(None, 5)
     with pytest.raises(TypeError):
         two_sum(123, 5)
+
+
+def test_k_sum():
+    assert three_sum([1, 2, 3, 4], 9) == [1, 2, 3]
+    assert three_sum([1, 2, 3], 10) == []
+    numbers = [-1, 0, 1, 2, -1, -4]
+    found = k_sum(numbers, 0, 4)
+    assert len(set(found)) == 4 and sum(numbers[i] for i in found) == 0
+    assert k_sum([5, 5], 10, 2) == [0, 1]
+    assert k_sum([], 0, 2) == []
+
+
+def test_k_sum_invalid_k():
+    with pytest.raises(ValueError):
+        k_sum([1, 2], 3, 0)
+
+
+@pytest.mark.parametrize("pair_limit", [0, 1 << 24])
+def test_two_sum_index_batch(pair_limit):
+    pytest.importorskip("numpy")
+    numbers = [2, 7, 11, 15, 7, -3]
+    index = TwoSumIndex(numbers, pair_limit=pair_limit)
+    targets = [9, 14, 26, 100, 4, -6]
+    pairs = index.query_batch(targets)
+    for target, (i, j) in zip(targets, pairs.tolist()):
+        if two_sum(numbers, target):
+            assert i < j and numbers[i] + numbers[j] == target
+        else:
+            assert i == j == -1
+
+
+def test_two_sum_index_query():
+    pytest.importorskip("numpy")
+    assert TwoSumIndex([2, 7, 11, 15]).query(9) == [0, 1]
+    assert TwoSumIndex([3, 3], pair_limit=0).query(6) == [0, 1]
+    assert TwoSumIndex([5]).query(10) == []
+
+
+def test_two_sum_index_pair_table_default_limit():
+    pytest.importorskip("numpy")
+    # Таблица пар по умолчанию строится только до 2**20 пар
+    assert TwoSumIndex(list(range(1000))).pair_sums is not None
+    assert TwoSumIndex(list(range(1500))).pair_sums is None
+    assert TwoSumIndex(list(range(1500)), pair_limit=1500 * 1499 // 2).pair_sums is not None
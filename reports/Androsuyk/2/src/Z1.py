@@ -1,4 +1,11 @@
 import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для TriangleBatch
+    np = None
 
 
 class IsoscelesTriangle:
@@ -66,6 +73,73 @@ class IsoscelesTriangle:
         self._side_c = value
 
 
+# Набор из N треугольников для тех же проверок, что и у IsoscelesTriangle, но сразу для всех:
+# стороны хранятся в трёх массивах numpy, в каждой строке side_a <= side_b <= side_c
+class TriangleBatch:
+    def __init__(self, sides):
+        sides = np.asarray(sides, dtype=np.float64)
+        if sides.ndim != 2 or sides.shape[1] != 3:
+            raise ValueError("Ожидается массив формы N x 3")
+        # Как сеттеры IsoscelesTriangle: любая неположительная сторона - ошибка
+        bad = np.flatnonzero(~np.all(sides > 0, axis=1))
+        if bad.size:
+            raise ValueError(f"Длина стороны должна быть положительной (строки {bad[:10].tolist()})")
+        ordered = np.sort(sides, axis=1)
+        self.side_a, self.side_b, self.side_c = (np.ascontiguousarray(ordered[:, i]) for i in range(3))
+
+    @classmethod
+    def from_triangles(cls, triangles):
+        return cls([(t.side_a, t.side_b, t.side_c) for t in triangles])
+
+    def __len__(self):
+        return len(self.side_a)
+
+    def is_isosceles(self):
+        # Точное сравнение, как в IsoscelesTriangle; после сортировки равные стороны стоят рядом
+        return (self.side_a == self.side_b) | (self.side_b == self.side_c)
+
+    def exists(self):
+        # Для упорядоченных сторон достаточно одного неравенства
+        return self.side_a + self.side_b > self.side_c
+
+    def perimeter(self):
+        # Для несуществующих треугольников - nan
+        return np.where(self.exists(), self.side_a + self.side_b + self.side_c, np.nan)
+
+    def area(self):
+        # Формула Герона в устойчивой форме; для несуществующих треугольников nan,
+        # а не 0, как в IsoscelesTriangle.area, чтобы их нельзя было спутать с настоящей площадью
+        a, b, c = self.side_a, self.side_b, self.side_c
+        product = (c + (b + a)) * (a - (c - b)) * (a + (c - b)) * (c + (b - a))
+        return np.where(self.exists(), 0.25 * np.sqrt(np.maximum(product, 0)), np.nan)
+
+    def equals(self, other):
+        # Как IsoscelesTriangle.__eq__: точное сравнение отсортированных сторон
+        if len(self) != len(other):
+            raise ValueError("Наборы должны быть одной длины")
+        return (self.side_a == other.side_a) & (self.side_b == other.side_b) & (self.side_c == other.side_c)
+
+
+def benchmark(count=10**6):
+    sides = np.random.default_rng(0).integers(1, 50, (count, 3)).astype(np.float64)
+
+    # Тот же отбор, что и в основной программе: существующие равнобедренные треугольники
+    start = time.perf_counter()
+    triangles = [IsoscelesTriangle(a, b, c) for a, b, c in sides.tolist()]
+    chosen = [t for t in triangles if t.exists() and t.is_isosceles()]
+    areas = [t.area() for t in chosen]
+    perimeters = [t.perimeter() for t in chosen]
+    print(f"{count} объектов IsoscelesTriangle: {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    batch = TriangleBatch(sides)
+    mask = batch.exists() & batch.is_isosceles()
+    batch_areas = batch.area()[mask]
+    batch_perimeters = batch.perimeter()[mask]
+    print(f"TriangleBatch: {time.perf_counter() - start:.3f} с")
+    assert np.allclose(areas, batch_areas) and np.allclose(perimeters, batch_perimeters)
+
+
 def input_positive_number(prompt):
     while True:
         try:
@@ -79,6 +153,10 @@ def input_positive_number(prompt):
 
 
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+        sys.exit()
+
     print("Введите длины сторон треугольника:")
     _side_a = input_positive_number("Введите длину первой стороны: ")
     _side_b = input_positive_number("Введите длину второй стороны: ")
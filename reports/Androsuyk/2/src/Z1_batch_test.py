@@ -0,0 +1,55 @@
+import math
+
+import pytest
+
+from Z1 import IsoscelesTriangle, TriangleBatch
+
+np = pytest.importorskip("numpy")
+
+# Равнобедренные (с равными сторонами на любых местах), разносторонние,
+# вырожденные (1, 2, 3), (2, 2, 4) и несуществующие (1, 1, 5) треугольники
+SIDES = [(3, 3, 3), (5, 5, 8), (8, 5, 5), (5, 8, 5), (3, 4, 5), (1, 2, 3), (2, 2, 4), (1, 1, 5), (0.1, 0.1, 0.1)]
+
+
+def test_isosceles_and_exists_match_objects():
+    triangles = [IsoscelesTriangle(*sides) for sides in SIDES]
+    batch = TriangleBatch(SIDES)
+    assert batch.is_isosceles().tolist() == [t.is_isosceles() for t in triangles]
+    assert batch.exists().tolist() == [t.exists() for t in triangles]
+
+
+def test_existing_triangles_match_objects():
+    triangles = [IsoscelesTriangle(*sides) for sides in SIDES]
+    batch = TriangleBatch.from_triangles(triangles)
+    mask = batch.exists()
+    existing = [t for t in triangles if t.exists()]
+    assert np.allclose(batch.perimeter()[mask], [t.perimeter() for t in existing])
+    assert np.allclose(batch.area()[mask], [t.area() for t in existing])
+
+
+def test_not_existing_gives_nan():
+    # IsoscelesTriangle.area возвращает 0, набор - nan и для площади, и для периметра
+    batch = TriangleBatch([(1, 2, 3), (2, 2, 4), (1, 1, 5)])
+    assert IsoscelesTriangle(2, 2, 4).area() == 0
+    assert np.isnan(batch.area()).all()
+    assert np.isnan(batch.perimeter()).all()
+
+
+def test_exact_comparison_like_class():
+    # 0.1 + 0.2 != 0.3: класс сравнивает стороны точно, и набор тоже
+    close = 0.1 + 0.2
+    assert not IsoscelesTriangle(0.3, close, 0.5).is_isosceles()
+    assert TriangleBatch([(0.3, close, 0.5)]).is_isosceles().tolist() == [False]
+    pairs = [((3, 3, 5), (5, 3, 3)), ((0.3, 0.4, 0.5), (close, 0.4, 0.5)), ((3, 4, 5), (3, 4, 6))]
+    left = TriangleBatch([first for first, _ in pairs])
+    right = TriangleBatch([second for _, second in pairs])
+    expected = [IsoscelesTriangle(*first) == IsoscelesTriangle(*second) for first, second in pairs]
+    assert left.equals(right).tolist() == expected == [True, False, False]
+    assert math.isclose(close, 0.3)
+
+
+def test_non_positive_sides():
+    with pytest.raises(ValueError):
+        IsoscelesTriangle(1, 0, 1)
+    with pytest.raises(ValueError, match=r"\[1\]"):
+        TriangleBatch([(1, 1, 1), (1, 0, 1)])
@@ -1,3 +1,17 @@
+import csv
+import math
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def process_sequence(seq):
     if not seq:
         return "The sequence is empty"
@@ -13,12 +27,202 @@ def process_sequence(seq):
     return max_value, min_value, sum_value, product_value
 
 
-N = int(input("Enter the number of elements in the sequence: "))
-sequence = [int(input(f"Enter element {i+1}: ")) for i in range(N)]
+class SequenceStats:
+    """Single-pass, mergeable accumulator of max, min, sum and product.
+
+    product_mode selects how the product is kept:
+    "exact" - Python int/float product, "log" - sign and logarithm of the absolute value,
+    "mod" - product modulo the given modulus (integers only).
+    """
+
+    PRODUCT_MODES = ("exact", "log", "mod")
+
+    def __init__(self, product_mode="exact", modulus=None):
+        if product_mode not in self.PRODUCT_MODES:
+            raise ValueError(f"Unknown product mode: {product_mode}")
+        if product_mode == "mod" and (modulus is None or modulus < 2):
+            raise ValueError("Modulus must be an integer greater than 1")
+        self.product_mode = product_mode
+        self.modulus = modulus
+        self.count = 0
+        self.max_value = None
+        self.min_value = None
+        self.sum_value = 0
+        self.product_value = 1
+        self.product_sign = 1
+        self.log_product = 0.0
+
+    def add(self, num):
+        """Add a single number."""
+        self.count += 1
+        if self.max_value is None or num > self.max_value:
+            self.max_value = num
+        if self.min_value is None or num < self.min_value:
+            self.min_value = num
+        self.sum_value += num
+        self._multiply(num)
+
+    def _multiply(self, num):
+        if self.product_mode == "exact":
+            self.product_value *= num
+        elif self.product_mode == "mod":
+            self.product_value = self.product_value * num % self.modulus
+        elif num == 0:
+            self.product_sign = 0
+        else:
+            if num < 0:
+                self.product_sign = -self.product_sign
+            self.log_product += math.log(abs(num))
+
+    def update(self, values):
+        """Add an iterable of numbers or a NumPy chunk in one pass."""
+        if np is not None and isinstance(values, np.ndarray):
+            self._update_array(values.ravel())
+        else:
+            for num in values:
+                self.add(num)
+        return self
+
+    def _update_array(self, chunk):
+        if chunk.size == 0:
+            return
+        chunk_max = chunk.max().item()
+        chunk_min = chunk.min().item()
+        self.count += chunk.size
+        self.max_value = chunk_max if self.max_value is None else max(self.max_value, chunk_max)
+        self.min_value = chunk_min if self.min_value is None else min(self.min_value, chunk_min)
+
+        bound = max(abs(chunk_max), abs(chunk_min)) * chunk.size
+        if chunk.dtype.kind in "iu" and bound >= 2**63:
+            self.sum_value += sum(chunk.tolist())  # int64 sum could overflow, stay exact
+        else:
+            self.sum_value += chunk.sum().item()
+
+        if self.product_mode == "log":
+            if self.product_sign and (chunk == 0).any():
+                self.product_sign = 0
+            elif self.product_sign:
+                if np.count_nonzero(chunk < 0) % 2:
+                    self.product_sign = -self.product_sign
+                self.log_product += float(np.log(np.abs(chunk.astype(np.float64))).sum())
+        elif self.product_mode == "mod" and chunk.dtype.kind in "iu" and self.modulus < 2**31:
+            self.product_value = self.product_value * _array_product_mod(chunk, self.modulus) % self.modulus
+        else:
+            for num in chunk.tolist():
+                self._multiply(num)
+
+    def merge(self, other):
+        """Combine with statistics collected over another part of the data."""
+        if (other.product_mode, other.modulus) != (self.product_mode, self.modulus):
+            raise ValueError("Cannot merge statistics with different product modes")
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.max_value = other.max_value if self.max_value is None else max(self.max_value, other.max_value)
+        self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        self.sum_value += other.sum_value
+        if self.product_mode == "exact":
+            self.product_value *= other.product_value
+        elif self.product_mode == "mod":
+            self.product_value = self.product_value * other.product_value % self.modulus
+        else:
+            self.product_sign *= other.product_sign
+            self.log_product += other.log_product
+        return self
+
+    @property
+    def product(self):
+        """Product of the elements (a float for the log mode, it may overflow to infinity)."""
+        if self.product_mode != "log":
+            return self.product_value
+        if self.product_sign == 0:
+            return 0.0
+        if self.log_product > math.log(sys.float_info.max):
+            return math.copysign(math.inf, self.product_sign)
+        return self.product_sign * math.exp(self.log_product)
+
+    def result(self):
+        """Return (max, min, sum, product) like process_sequence."""
+        if self.count == 0:
+            return "The sequence is empty"
+        return self.max_value, self.min_value, self.sum_value, self.product
+
+
+def _array_product_mod(chunk, modulus):
+    # Pairwise reduction: every partial product stays below modulus**2 < 2**62
+    if chunk.dtype.kind == "u":
+        # Reduce in the unsigned dtype first: uint64 values >= 2**63 would wrap in int64
+        values = np.remainder(chunk, np.uint64(modulus)).astype(np.int64)
+    else:
+        values = np.remainder(chunk.astype(np.int64), modulus)
+    while values.size > 1:
+        if values.size % 2:
+            values = np.append(values, 1)
+        values = values[0::2] * values[1::2] % modulus
+    return int(values[0])
+
+
+def _collect(args):
+    chunk, product_mode, modulus = args
+    return SequenceStats(product_mode, modulus).update(chunk)
+
+
+def process_chunks_parallel(chunks, product_mode="log", modulus=None, processes=None):
+    """Compute statistics of every chunk in a process pool and merge the results.
+
+    At most 2 * processes chunks are in flight: executor.map would pull the whole chunk
+    iterator (for example, read_csv_column over a large file) before returning anything.
+    Results are merged in chunk order, so float sums do not depend on scheduling.
+    """
+    stats = SequenceStats(product_mode, modulus)
+    window = 2 * (processes or os.cpu_count() or 1)
+    chunks = iter(chunks)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque(executor.submit(_collect, (chunk, product_mode, modulus)) for chunk in islice(chunks, window))
+        while pending:
+            stats.merge(pending.popleft().result())
+            for chunk in islice(chunks, 1):
+                pending.append(executor.submit(_collect, (chunk, product_mode, modulus)))
+    return stats
+
+
+def read_csv_column(path, column, chunk_rows=1 << 16):
+    """Yield a numeric CSV column (name or index) in chunks without loading the file."""
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        if isinstance(column, str):
+            column = next(reader, []).index(column)
+        chunk = []
+        for row in reader:
+            cell = row[column].strip()
+            if not cell:
+                continue
+            try:
+                chunk.append(int(cell))
+            except ValueError:
+                chunk.append(float(cell))
+            if len(chunk) >= chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def process_csv_column(path, column, product_mode="log", modulus=None, chunk_rows=1 << 16):
+    """Statistics of a CSV column too large for memory."""
+    stats = SequenceStats(product_mode, modulus)
+    for chunk in read_csv_column(path, column, chunk_rows):
+        stats.update(chunk)
+    return stats
+
+
+if __name__ == "__main__":
+    N = int(input("Enter the number of elements in the sequence: "))
+    sequence = [int(input(f"Enter element {i+1}: ")) for i in range(N)]
 
-max_val, min_val, sum_val, product_val = process_sequence(sequence)
+    max_val, min_val, sum_val, product_val = process_sequence(sequence)
 
-print(f"Maximum value: {max_val}")
-print(f"Minimum value: {min_val}")
-print(f"Sum of elements: {sum_val}")
-print(f"Product of elements: {product_val}")
+    print(f"Maximum value: {max_val}")
+    print(f"Minimum value: {min_val}")
+    print(f"Sum of elements: {sum_val}")
+    print(f"Product of elements: {product_val}")
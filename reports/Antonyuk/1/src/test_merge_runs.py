@@ -0,0 +1,63 @@
+import os
+import random
+
+import pytest
+
+from SPP_TASK_2 import merge_arrays, merge_files, merge_runs, read_binary_run, read_text_run, write_binary, write_text
+
+
+def make_runs(count, seed=0):
+    rng = random.Random(seed)
+    # Small value range for many duplicates, every third run is empty
+    return [[] if i % 3 == 0 else sorted(rng.randrange(20) for _ in range(rng.randrange(1, 30))) for i in range(count)]
+
+
+def test_merge_runs_empty_and_duplicates():
+    """Test merging with empty runs and repeated values"""
+    runs = make_runs(10)
+    assert list(merge_runs(*runs)) == sorted(value for run in runs for value in run)
+    assert not list(merge_runs())
+    assert not list(merge_runs([], []))
+    assert list(merge_runs([1, 1], [1], [])) == [1, 1, 1]
+
+
+def test_merge_runs_key():
+    """Test merging runs sorted by a key"""
+    assert list(merge_runs([1, -3], [2, -2], key=abs)) == [1, 2, -2, -3]
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("max_open", [2, 3, 64])
+def test_merge_files(tmp_path, binary, max_open):
+    """Test the external merge, including several passes when max_open is small"""
+    runs = make_runs(11)
+    paths = []
+    for i, run in enumerate(runs):
+        path = str(tmp_path / f"run{i}")
+        (write_binary if binary else write_text)(run, path)
+        paths.append(path)
+    out_path = str(tmp_path / "merged")
+    merge_files(paths, out_path, binary=binary, max_open=max_open)
+
+    merged = list(read_binary_run(out_path) if binary else read_text_run(out_path))
+    assert merged == sorted(value for run in runs for value in run)
+    # Temporary runs of the intermediate passes are removed
+    assert sorted(os.listdir(tmp_path)) == sorted([f"run{i}" for i in range(len(runs))] + ["merged"])
+
+
+def test_merge_files_no_runs(tmp_path):
+    """Test that merging no runs gives an empty file"""
+    out_path = str(tmp_path / "merged")
+    merge_files([], out_path)
+    assert not list(read_text_run(out_path))
+    with pytest.raises(ValueError):
+        merge_files([], out_path, max_open=1)
+
+
+def test_merge_arrays():
+    """Test the NumPy merge with duplicates and empty arrays"""
+    np = pytest.importorskip("numpy")
+    first, second = np.array([1, 2, 2, 5]), np.array([2, 3, 5, 5])
+    assert merge_arrays(first, second).tolist() == [1, 2, 2, 2, 3, 5, 5, 5]
+    assert merge_arrays(first, np.array([], dtype=first.dtype)).tolist() == first.tolist()
+    assert merge_arrays([0.5, 1.5], [1.0]).tolist() == [0.5, 1.0, 1.5]
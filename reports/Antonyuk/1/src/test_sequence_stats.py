@@ -0,0 +1,92 @@
+import pytest
+
+from SPP_TASK_1 import SequenceStats, process_chunks_parallel, process_sequence
+
+np = pytest.importorskip("numpy")
+
+SEQUENCES = [
+    [1, 2, 3, 4, 5],
+    [-1, 2, -3, 4, -5],
+    [0, 7, -7],
+    [42],
+    [2**40, -(2**40), 3, 2**62],
+]
+
+
+def expected_stats(seq, product_mode, modulus=None):
+    max_value, min_value, sum_value, product = process_sequence(seq)
+    if product_mode == "mod":
+        product %= modulus
+    return max_value, min_value, sum_value, product
+
+
+@pytest.mark.parametrize("seq", SEQUENCES)
+@pytest.mark.parametrize("as_array", [False, True])
+def test_exact_and_mod_modes_match_process_sequence(seq, as_array):
+    """Test exact and modular products on lists and NumPy arrays"""
+    values = np.array(seq, dtype=np.int64) if as_array else seq
+    assert SequenceStats("exact").update(values).result() == expected_stats(seq, "exact")
+    assert SequenceStats("mod", 97).update(values).result() == expected_stats(seq, "mod", 97)
+
+
+@pytest.mark.parametrize("seq", SEQUENCES)
+@pytest.mark.parametrize("as_array", [False, True])
+def test_log_mode_matches_process_sequence(seq, as_array):
+    """Test the log-space product against the exact one"""
+    values = np.array(seq, dtype=np.int64) if as_array else seq
+    max_value, min_value, sum_value, product = SequenceStats("log").update(values).result()
+    assert (max_value, min_value, sum_value) == expected_stats(seq, "log")[:3]
+    assert product == pytest.approx(float(process_sequence(seq)[3]), rel=1e-9)
+
+
+def test_uint64_mod_does_not_wrap():
+    """Test uint64 values above the int64 range in the modular mode"""
+    seq = [2**63 + 5, 3, 2**64 - 1]
+    values = np.array(seq, dtype=np.uint64)
+    assert SequenceStats("mod", 97).update(values).result() == expected_stats(seq, "mod", 97)
+    assert SequenceStats("mod", 97).update(np.array([2**63 + 5, 3], dtype=np.uint64)).product == 58
+
+
+def test_small_unsigned_dtypes():
+    """Test unsigned dtypes narrower than the modulus"""
+    seq = [255, 254, 3]
+    values = np.array(seq, dtype=np.uint8)
+    assert SequenceStats("mod", 1009).update(values).result() == expected_stats(seq, "mod", 1009)
+
+
+def test_chunks_merge():
+    """Test merging statistics of separate chunks"""
+    seq = [3, -1, 4, -1, 5, 9, -2, 6]
+    for mode, modulus in (("exact", None), ("mod", 97)):
+        left = SequenceStats(mode, modulus).update(np.array(seq[:3]))
+        right = SequenceStats(mode, modulus).update(seq[3:])
+        assert left.merge(right).result() == expected_stats(seq, mode, modulus)
+
+
+def test_empty_sequence():
+    """Test that an empty input gives the same message"""
+    assert SequenceStats().update([]).result() == process_sequence([])
+
+
+def test_parallel_chunks_bounded_window(monkeypatch):
+    """Test that process_chunks_parallel pulls at most 2 * processes chunks ahead of the merges"""
+    seq = list(range(-500, 1500))
+    pulled = []
+    pulled_at_merge = []
+
+    def chunks():
+        for start in range(0, len(seq), 100):
+            pulled.append(start)
+            yield seq[start : start + 100]
+
+    merge = SequenceStats.merge
+
+    def recording_merge(stats, other):
+        pulled_at_merge.append(len(pulled))
+        return merge(stats, other)
+
+    monkeypatch.setattr(SequenceStats, "merge", recording_merge)
+    stats = process_chunks_parallel(chunks(), "exact", processes=2)
+    assert stats.result() == expected_stats(seq, "exact")
+    assert len(pulled_at_merge) == 20
+    assert all(count <= merged + 4 for merged, count in enumerate(pulled_at_merge))
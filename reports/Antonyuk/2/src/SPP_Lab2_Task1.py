@@ -1,4 +1,11 @@
 import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для TriangleBatch
+    np = None
 
 
 class Triangle:
@@ -71,6 +78,76 @@ class Triangle:
         return math.isclose(self._a, other._a) and math.isclose(self._b, other._b) and math.isclose(self._c, other._c)
 
 
+class TriangleBatch:
+    """
+    Векторная версия Triangle: N равносторонних треугольников в одном массиве numpy формы N x 3.
+    Проверки сторон те же, что в Triangle.set_sides, только выполняются сразу для всех строк.
+    """
+
+    REL_TOL = 1e-9  # тот же допуск, что у math.isclose в Triangle
+
+    def __init__(self, sides):
+        self.sides = np.array(sides, dtype=np.float64)
+        if self.sides.ndim != 2 or self.sides.shape[1] != 3:
+            raise ValueError("Стороны задаются массивом формы N x 3")
+        first = self.sides[:, :1]
+        same = np.isclose(self.sides, first, rtol=self.REL_TOL, atol=0).all(axis=1)
+        if not same.all():
+            rows = np.flatnonzero(~same)[:10].tolist()
+            raise ValueError(f"Треугольник должен быть равносторонним (все стороны равны), строки {rows}")
+        positive = (self.sides > 0).all(axis=1)
+        if not positive.all():
+            rows = np.flatnonzero(~positive)[:10].tolist()
+            raise ValueError(f"Длины сторон должны быть положительными числами (строки {rows})")
+
+    @classmethod
+    def from_triangles(cls, triangles):
+        """Сборка набора из объектов Triangle"""
+        return cls([(t.a, t.b, t.c) for t in triangles])
+
+    def __len__(self):
+        return self.sides.shape[0]
+
+    def perimeter(self):
+        """Периметр каждого треугольника"""
+        return self.sides.sum(axis=1)
+
+    def area(self):
+        """Площадь каждого треугольника (формула Герона, как в Triangle.area)"""
+        a, b, c = self.sides.T
+        p = (a + b + c) / 2
+        return np.sqrt(p * (p - a) * (p - b) * (p - c))
+
+    def is_valid(self):
+        """Неравенство треугольника для каждой строки, как в Triangle.is_valid"""
+        doubled = 2 * self.sides
+        return (doubled < self.sides.sum(axis=1, keepdims=True)).all(axis=1)
+
+    def equals(self, other):
+        """Поэлементное сравнение с набором той же длины, как Triangle.__eq__"""
+        if len(self) != len(other):
+            raise ValueError("Наборы должны быть одной длины")
+        return np.isclose(self.sides, other.sides, rtol=self.REL_TOL, atol=0).all(axis=1)
+
+
+def benchmark(count=10**6):
+    """Сравнение TriangleBatch с созданием count объектов Triangle"""
+    sides = np.repeat(np.random.default_rng(0).uniform(1, 100, count)[:, None], 3, axis=1)
+
+    start = time.perf_counter()
+    triangles = [Triangle(a, b, c) for a, b, c in sides.tolist()]
+    areas = [t.area() for t in triangles]
+    same = [t == other for t, other in zip(triangles, reversed(triangles))]
+    print(f"{count} объектов Triangle: {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    batch = TriangleBatch(sides)
+    batch_areas = batch.area()
+    batch_same = batch.equals(TriangleBatch(sides[::-1]))
+    print(f"TriangleBatch: {time.perf_counter() - start:.3f} с")
+    assert np.allclose(areas, batch_areas) and batch_same.tolist() == same
+
+
 def validate_input(prompt):
     """Функция для валидации ввода чисел"""
     while True:
@@ -122,4 +199,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+import SPP_Lab2_Task1 as task1
+
+np = pytest.importorskip("numpy")
+
+
+def test_equilateral_formulas():
+    """Тест: периметр 3a и площадь sqrt(3) / 4 * a^2 совпадают с объектами Triangle"""
+    sides = np.random.default_rng(5).uniform(0.1, 1000, 200)
+    triangles = [task1.Triangle(side, side, side) for side in sides.tolist()]
+    batch = task1.TriangleBatch.from_triangles(triangles)
+    assert len(batch) == len(sides)
+    assert np.allclose(batch.perimeter(), 3 * sides, rtol=1e-12)
+    assert np.allclose(batch.area(), math.sqrt(3) / 4 * sides**2, rtol=1e-9)
+    assert np.allclose(batch.area(), [t.area() for t in triangles], rtol=1e-12)
+    assert batch.is_valid().all() and all(t.is_valid() for t in triangles)
+
+
+def test_equals_like_triangle_eq():
+    """Тест: маска equals совпадает с Triangle.__eq__ для каждой пары"""
+    first = [(1.0, 1.0, 1.0), (2.0, 2.0, 2.0), (5.0, 5.0, 5.0)]
+    second = [(1.0, 1.0, 1.0), (2.0 + 1e-12, 2.0, 2.0), (5.5, 5.5, 5.5)]
+    expected = [task1.Triangle(*x) == task1.Triangle(*y) for x, y in zip(first, second)]
+    assert task1.TriangleBatch(first).equals(task1.TriangleBatch(second)).tolist() == expected == [True, True, False]
+    with pytest.raises(ValueError):
+        task1.TriangleBatch(first).equals(task1.TriangleBatch(first[:2]))
+
+
+@pytest.mark.parametrize("row", [(3, 4, 5), (1, 1, 2), (2, 2, 2.001), (0, 0, 0), (-1, -1, -1)])
+def test_rejects_what_triangle_rejects(row):
+    """Тест: строки, которые не принимает Triangle, не принимает и набор (с тем же текстом ошибки)"""
+    with pytest.raises(ValueError) as expected:
+        task1.Triangle(*row)
+    with pytest.raises(ValueError) as error:
+        task1.TriangleBatch([(1, 1, 1), row])
+    assert str(error.value).startswith(str(expected.value).partition(" (")[0])
+    assert "[1]" in str(error.value)
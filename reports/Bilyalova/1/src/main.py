@@ -1,4 +1,8 @@
+import os
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
 
 
 def find_modes(input_sequence):
@@ -13,18 +17,140 @@ def find_modes(input_sequence):
     return modes_list
 
 
-try:
-    n = int(input("Введите количество чисел в последовательности: "))
-    sequence = []
-    for i in range(n):
-        num = int(input(f"Введите число {i + 1}: "))
-        sequence.append(num)
+class HeavyHitters:
+    """Сводка Мисры-Гриса: не более capacity счётчиков независимо от числа различных значений.
 
-    modes = find_modes(sequence)
+    Для любого значения оценка count(x) лежит в [истинное - error, истинное],
+    где error <= total / (capacity + 1).
+    """
 
-    if modes is None:
-        print("В последовательности нет моды")
-    else:
-        print("Мода последовательности:", ", ".join(map(str, modes)))
-except ValueError:
-    print("Ошибка: введите целые числа.")
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError("capacity должна быть положительной")
+        self.capacity = capacity
+        # Счётчики хранятся со сдвигом: оценка значения равна _counts[x] - _offset,
+        # поэтому уменьшение всех счётчиков сразу - это только увеличение _offset
+        self._counts: Dict[Hashable, int] = {}
+        self._offset = 0
+        self.total = 0
+        self.error = 0
+
+    @property
+    def counters(self) -> Dict[Hashable, int]:
+        return {key: value - self._offset for key, value in self._counts.items()}
+
+    def add(self, item: Hashable, count: int = 1):
+        self.total += count
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count + self._offset
+        else:
+            self._decrement(item, count)
+
+    def _decrement(self, item: Hashable, count: int):
+        # Уменьшаем все счётчики на минимум из них и count сдвигом, обнулившиеся удаляем на месте
+        counts = self._counts
+        step = min(count, min(counts.values()) - self._offset)
+        self.error += step
+        self._offset += step
+        for key in [key for key, value in counts.items() if value <= self._offset]:
+            del counts[key]
+        if count > step:
+            counts[item] = count - step + self._offset
+
+    def update(self, items: Iterable[Hashable]):
+        counts = self._counts
+        for item in items:
+            if item in counts:
+                counts[item] += 1
+                self.total += 1
+            else:
+                self.add(item)
+        return self
+
+    def merge(self, other: "HeavyHitters") -> "HeavyHitters":
+        # Складываем счётчики и оставляем capacity наибольших,
+        # вычитая из них (capacity + 1)-й по величине - погрешность остаётся той же
+        merged = Counter(self.counters)
+        merged.update(other.counters)
+        self.total += other.total
+        self.error += other.error
+        if len(merged) > self.capacity:
+            ordered = sorted(merged.values(), reverse=True)
+            step = ordered[self.capacity]
+            self.error += step
+            merged = Counter({key: value - step for key, value in merged.items() if value > step})
+        self._counts = dict(merged)
+        self._offset = 0
+        return self
+
+    def estimate(self, item: Hashable) -> int:
+        count = self._counts.get(item)
+        return 0 if count is None else count - self._offset
+
+    def top_k(self, k: int) -> List[Tuple[Hashable, int, int]]:
+        # (значение, нижняя граница частоты, верхняя граница частоты)
+        ranked = Counter(self.counters).most_common(k)
+        return [(item, count, count + self.error) for item, count in ranked]
+
+    def modes(self) -> Optional[List[Hashable]]:
+        # Приближённые моды: значения с наибольшей оценкой частоты
+        if not self.counters:
+            return None
+        max_count = max(self.counters.values())
+        if max_count + self.error <= 1:
+            return None
+        return [item for item, count in self.counters.items() if count == max_count]
+
+
+def _count_shard(args):
+    shard, capacity = args
+    return HeavyHitters(capacity).update(shard)
+
+
+def count_shards(shards: Iterable[Iterable[Hashable]], capacity: int = 1000, processes: Optional[int] = None):
+    # Каждый шард считается в своём процессе, сводки затем объединяются.
+    # Шарды передаются в процессы через pickle, поэтому генераторы и открытые файлы
+    # материализуются в списки. executor.map забрал бы весь поток шардов сразу,
+    # поэтому в работе держится не больше 2 * processes шардов: следующий шард
+    # берётся из потока только после того, как готова одна из сводок
+    result = HeavyHitters(capacity)
+    window = 2 * (processes or os.cpu_count() or 1)
+    picklable = (shard if isinstance(shard, (list, tuple)) else list(shard) for shard in shards)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = {executor.submit(_count_shard, (shard, capacity)) for shard in islice(picklable, window)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result.merge(future.result())
+            for shard in islice(picklable, len(done)):
+                pending.add(executor.submit(_count_shard, (shard, capacity)))
+    return result
+
+
+def find_modes_streaming(input_sequence: Iterable[Hashable], capacity: int = 1000):
+    return HeavyHitters(capacity).update(input_sequence).modes()
+
+
+def main():
+    try:
+        n = int(input("Введите количество чисел в последовательности: "))
+        sequence = []
+        for i in range(n):
+            num = int(input(f"Введите число {i + 1}: "))
+            sequence.append(num)
+
+        modes = find_modes(sequence)
+
+        if modes is None:
+            print("В последовательности нет моды")
+        else:
+            print("Мода последовательности:", ", ".join(map(str, modes)))
+    except ValueError:
+        print("Ошибка: введите целые числа.")
+
+
+if __name__ == "__main__":
+    main()
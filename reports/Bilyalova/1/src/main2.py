@@ -1,13 +1,140 @@
+import pickle
+import random
+import string
+import sys
+import time
+from collections import deque
+from typing import Dict, Iterable, List
+
+
 def find_first_occurrence(main_string, search_string):
     return main_string.find(search_string)
 
 
-haystack = input("Введите строку haystack: ")
-needle = input("Введите строку needle: ")
+class MultiPatternMatcher:
+    """Автомат Ахо-Корасик: строится один раз по набору needle и переиспользуется для любых haystack."""
+
+    def __init__(self, needles: Iterable[str]):
+        self.needles: List[str] = list(dict.fromkeys(needles))
+        # Состояние автомата - индекс в списках goto/fail/outputs, 0 - корень
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[int]] = [[]]
+
+        for needle_id, needle in enumerate(self.needles):
+            if not needle:
+                # Пустая строка обрабатывается отдельно в find_all/find_first
+                continue
+            state = 0
+            for char in needle:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append(needle_id)
+
+        self._build_fail_links()
+
+    def _build_fail_links(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def _scan(self, haystack: str):
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        lengths = [len(needle) for needle in self.needles]
+        state = 0
+        for position, char in enumerate(haystack):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for needle_id in outputs[state]:
+                yield needle_id, position - lengths[needle_id] + 1
+
+    def find_all(self, haystack: str) -> Dict[str, List[int]]:
+        result: Dict[str, List[int]] = {needle: [] for needle in self.needles}
+        if "" in result:
+            result[""] = list(range(len(haystack) + 1))
+        for needle_id, index in self._scan(haystack):
+            result[self.needles[needle_id]].append(index)
+        return result
+
+    def find_first(self, haystack: str) -> Dict[str, int]:
+        result = {needle: -1 for needle in self.needles}
+        if "" in result:
+            result[""] = 0
+        remaining = sum(1 for index in result.values() if index == -1)
+        if not remaining:
+            return result
+        for needle_id, index in self._scan(haystack):
+            needle = self.needles[needle_id]
+            if result[needle] == -1:
+                result[needle] = index
+                remaining -= 1
+                if not remaining:
+                    break
+        return result
+
+    def save(self, path: str):
+        with open(path, "wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(path: str) -> "MultiPatternMatcher":
+        with open(path, "rb") as file:
+            matcher = pickle.load(file)
+        if not isinstance(matcher, MultiPatternMatcher):
+            raise TypeError("Файл не содержит скомпилированный MultiPatternMatcher")
+        return matcher
+
+
+def benchmark(haystack_size=1_000_000, needles_count=2000):
+    rng = random.Random(0)
+    haystack = "".join(rng.choices(string.ascii_lowercase[:8], k=haystack_size))
+    needles = ["".join(rng.choices(string.ascii_lowercase[:8], k=rng.randint(6, 12))) for _ in range(needles_count)]
+
+    start = time.perf_counter()
+    expected = {needle: find_first_occurrence(haystack, needle) for needle in needles}
+    print(f"Цикл str.find:        {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    matcher = MultiPatternMatcher(needles)
+    print(f"Построение автомата:  {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    found = matcher.find_first(haystack)
+    print(f"Ахо-Корасик (первые): {time.perf_counter() - start:.3f} с")
+    assert found == expected
+
+
+def main():
+    haystack = input("Введите строку haystack: ")
+    needle = input("Введите строку needle: ")
+
+    index = find_first_occurrence(haystack, needle)
+
+    if index != -1:
+        print(f"Индекс первого вхождения: {index}")
+    else:
+        print("Подстрока не найдена")
 
-index = find_first_occurrence(haystack, needle)
 
-if index != -1:
-    print(f"Индекс первого вхождения: {index}")
-else:
-    print("Подстрока не найдена")
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,109 @@
+import random
+from collections import Counter
+
+import pytest
+
+from main import HeavyHitters, count_shards, find_modes, find_modes_streaming
+
+
+def make_stream(size, seed=0):
+    rng = random.Random(seed)
+    # Несколько частых значений на фоне длинного хвоста редких
+    return [rng.choice([1, 2, 3]) if rng.random() < 0.3 else rng.randint(10, 10_000) for _ in range(size)]
+
+
+class TestHeavyHitters:
+    def test_exact_when_capacity_is_enough(self):
+        sequence = [1, 2, 2, 3, 3, 3, 4]
+        assert find_modes_streaming(sequence) == find_modes(sequence)
+
+    def test_no_mode(self):
+        assert find_modes_streaming([1, 2, 3]) is None
+
+    def test_empty(self):
+        assert find_modes_streaming([]) is None
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            HeavyHitters(0)
+
+    def test_error_bounds_against_counter(self):
+        stream = make_stream(20_000)
+        exact = Counter(stream)
+        summary = HeavyHitters(capacity=50).update(stream)
+        assert summary.error <= len(stream) / 51
+        assert len(summary.counters) <= 50
+        for item, true_count in exact.items():
+            assert true_count - summary.error <= summary.estimate(item) <= true_count
+
+    def test_top_k_and_modes(self):
+        stream = make_stream(20_000)
+        exact = Counter(stream)
+        summary = HeavyHitters(capacity=50).update(stream)
+        top = summary.top_k(3)
+        assert {item for item, _, _ in top} == {1, 2, 3}
+        for item, lower, upper in top:
+            assert lower <= exact[item] <= upper
+        assert summary.modes() == find_modes(stream)
+
+    def test_merge_matches_bounds(self):
+        stream = make_stream(20_000)
+        exact = Counter(stream)
+        left = HeavyHitters(capacity=50).update(stream[:7_000])
+        right = HeavyHitters(capacity=50).update(stream[7_000:])
+        merged = left.merge(right)
+        assert merged.total == len(stream)
+        assert merged.error <= len(stream) / 51
+        assert len(merged.counters) <= 50
+        for item, true_count in exact.items():
+            assert true_count - merged.error <= merged.estimate(item) <= true_count
+
+    def test_count_shards(self):
+        stream = make_stream(12_000)
+        shards = [stream[i : i + 3_000] for i in range(0, len(stream), 3_000)]
+        summary = count_shards(shards, capacity=50, processes=2)
+        assert summary.total == len(stream)
+        assert summary.modes() == find_modes(stream)
+
+    def test_count_shards_generators(self):
+        stream = make_stream(12_000)
+        # Генераторы не передаются в процессы через pickle, count_shards материализует их сам
+        shards = ((item for item in stream[i : i + 3_000]) for i in range(0, len(stream), 3_000))
+        summary = count_shards(shards, capacity=50, processes=2)
+        assert summary.total == len(stream)
+        assert summary.modes() == find_modes(stream)
+
+    def test_count_shards_bounded_window(self, monkeypatch):
+        stream = make_stream(20_000)
+        pulled = []
+        pulled_at_merge = []
+
+        def shards():
+            for i in range(0, len(stream), 1_000):
+                pulled.append(i)
+                yield stream[i : i + 1_000]
+
+        merge = HeavyHitters.merge
+
+        def recording_merge(summary, other):
+            pulled_at_merge.append(len(pulled))
+            return merge(summary, other)
+
+        # Первая сводка объединяется, когда из потока взято не больше 2 * processes шардов
+        monkeypatch.setattr(HeavyHitters, "merge", recording_merge)
+        summary = count_shards(shards(), capacity=50, processes=2)
+        assert summary.total == len(stream)
+        assert len(pulled_at_merge) == 20
+        assert pulled_at_merge[0] <= 4
+
+    def test_weighted_add_and_eviction(self):
+        summary = HeavyHitters(capacity=2)
+        summary.add("a", 5)
+        summary.add("b", 3)
+        summary.add("c", 2)  # все счётчики уменьшаются на 2, новый не помещается
+        assert summary.counters == {"a": 3, "b": 1}
+        summary.add("d", 4)  # уменьшение на 1: "b" удаляется, "d" остаётся с 3
+        assert summary.counters == {"a": 2, "d": 3}
+        assert summary.error == 3
+        assert summary.estimate("b") == 0
+        assert summary.top_k(1) == [("d", 3, 6)]
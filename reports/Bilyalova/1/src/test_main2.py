@@ -0,0 +1,64 @@
+import pickle
+import random
+
+import pytest
+
+from main2 import MultiPatternMatcher, find_first_occurrence
+
+
+def find_all_brute_force(haystack, needle):
+    # Все вхождения, в том числе перекрывающиеся
+    return [i for i in range(len(haystack) - len(needle) + 1) if haystack[i : i + len(needle)] == needle]
+
+
+def random_case(rng, alphabet="abc"):
+    haystack = "".join(rng.choices(alphabet, k=rng.randint(0, 60)))
+    needles = ["".join(rng.choices(alphabet, k=rng.randint(1, 5))) for _ in range(rng.randint(1, 15))]
+    return haystack, needles
+
+
+class TestMultiPatternMatcher:
+    def test_find_first_matches_str_find(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            haystack, needles = random_case(rng)
+            matcher = MultiPatternMatcher(needles)
+            assert matcher.find_first(haystack) == {
+                needle: find_first_occurrence(haystack, needle) for needle in needles
+            }
+
+    def test_find_all_matches_brute_force(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            haystack, needles = random_case(rng)
+            matcher = MultiPatternMatcher(needles)
+            assert matcher.find_all(haystack) == {needle: find_all_brute_force(haystack, needle) for needle in needles}
+
+    def test_nested_and_overlapping_needles(self):
+        # Needle, являющиеся суффиксами и префиксами друг друга, находятся через fail-ссылки
+        haystack = "ushershehis"
+        needles = ["he", "she", "his", "hers", "s", "hershe"]
+        found = MultiPatternMatcher(needles).find_all(haystack)
+        assert found == {needle: find_all_brute_force(haystack, needle) for needle in needles}
+
+    def test_empty_and_duplicate_needles(self):
+        matcher = MultiPatternMatcher(["", "ab", "ab", "zz"])
+        assert matcher.needles == ["", "ab", "zz"]
+        assert matcher.find_first("cab") == {"": 0, "ab": 1, "zz": -1}
+        assert matcher.find_first("cab")[""] == find_first_occurrence("cab", "")
+        assert matcher.find_all("abab")[""] == [0, 1, 2, 3, 4]
+        assert MultiPatternMatcher([""]).find_first("") == {"": 0}
+
+    def test_save_and_load(self, tmp_path):
+        rng = random.Random(2)
+        haystack, needles = random_case(rng, "abcd")
+        path = tmp_path / "matcher.pkl"
+        MultiPatternMatcher(needles).save(str(path))
+        loaded = MultiPatternMatcher.load(str(path))
+        assert loaded.find_all(haystack) == MultiPatternMatcher(needles).find_all(haystack)
+
+        # В файле не автомат
+        with open(path, "wb") as file:
+            pickle.dump({"needles": needles}, file)
+        with pytest.raises(TypeError):
+            MultiPatternMatcher.load(str(path))
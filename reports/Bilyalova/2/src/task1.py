@@ -1,4 +1,12 @@
 import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для TriangleBatch
+    np = None
+
 
 class RightTriangle:
     def __init__(self, a, b, c):
@@ -59,6 +67,74 @@ class RightTriangle:
         # Сравниваем стороны, учитывая порядок
         return sorted([self.a, self.b, self.c]) == sorted([other.a, other.b, other.c])
 
+
+# Набор из N треугольников с правилами RightTriangle, но в трёх массивах numpy вместо N объектов.
+# Стороны в каждой строке упорядочены (a <= b <= c), так что a и b - катеты, c - гипотенуза.
+# Треугольник корректен, только если он прямоугольный (как RightTriangle.is_valid);
+# для некорректных площадь и периметр - nan, а не исключение, как в RightTriangle.
+class TriangleBatch:
+    # Допуск проверки a^2 + b^2 == c^2, как в RightTriangle.is_valid
+    REL_TOL = 1e-9
+
+    def __init__(self, sides):
+        sides = np.asarray(sides, dtype=np.float64)
+        if sides.ndim != 2 or sides.shape[1] != 3:
+            raise ValueError("Ожидается массив формы N x 3")
+        # Неположительную сторону не пропускают сеттеры RightTriangle
+        bad = np.flatnonzero(~np.all(sides > 0, axis=1))
+        if bad.size:
+            raise ValueError(f"Длина стороны должна быть положительной (строки {bad[:10].tolist()})")
+        ordered = np.sort(sides, axis=1)
+        self.a, self.b, self.c = (np.ascontiguousarray(ordered[:, i]) for i in range(3))
+
+    @classmethod
+    def from_triangles(cls, triangles):
+        return cls([(t.a, t.b, t.c) for t in triangles])
+
+    def __len__(self):
+        return len(self.a)
+
+    def is_valid(self):
+        return np.isclose(self.a**2 + self.b**2, self.c**2, rtol=self.REL_TOL, atol=0)
+
+    def area(self):
+        # Половина произведения катетов; RightTriangle.area берёт a * b в порядке ввода,
+        # поэтому совпадает с набором, только когда гипотенуза введена последней
+        return np.where(self.is_valid(), self.a * self.b / 2, np.nan)
+
+    def perimeter(self):
+        return np.where(self.is_valid(), self.a + self.b + self.c, np.nan)
+
+    def equals(self, other):
+        # Точное сравнение отсортированных сторон, как в RightTriangle.__eq__
+        if len(self) != len(other):
+            raise ValueError("Наборы должны быть одной длины")
+        return (self.a == other.a) & (self.b == other.b) & (self.c == other.c)
+
+
+def benchmark(count=10**6):
+    rng = np.random.default_rng(0)
+    scale = rng.integers(1, 100, count).astype(np.float64)
+    sides = scale[:, None] * np.array([3.0, 4.0, 5.0])
+    # Каждый второй треугольник - не прямоугольный
+    sides[::2, 2] += 1
+
+    start = time.perf_counter()
+    triangles = [RightTriangle(a, b, c) for a, b, c in sides.tolist()]
+    valid = [t for t in triangles if t.is_valid()]
+    areas = [t.area() for t in valid]
+    perimeters = [t.perimeter() for t in valid]
+    print(f"{count} объектов RightTriangle: {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    batch = TriangleBatch(sides)
+    mask = batch.is_valid()
+    batch_areas = batch.area()[mask]
+    batch_perimeters = batch.perimeter()[mask]
+    print(f"TriangleBatch: {time.perf_counter() - start:.3f} с")
+    assert np.allclose(areas, batch_areas) and np.allclose(perimeters, batch_perimeters)
+
+
 def input_triangle():
     try:
         a = float(input("Введите длину стороны a: "))
@@ -69,7 +145,12 @@ def input_triangle():
         print(f"Ошибка: {e}")
         return None
 
+
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+        sys.exit()
+
     print("Введите данные для первого треугольника:")
     triangle1 = input_triangle()
 
@@ -0,0 +1,60 @@
+import pytest
+
+from task1 import RightTriangle, TriangleBatch
+
+np = pytest.importorskip("numpy")
+
+RIGHT = [(3, 4, 5), (6, 8, 10), (5, 12, 13), (0.3, 0.4, 0.5)]
+# Равносторонний, вырожденный, несуществующий и почти прямоугольный треугольники
+NOT_RIGHT = [(1, 1, 1), (1, 2, 3), (1, 1, 5), (3, 4, 5.001)]
+
+
+def test_validity_mask_matches_objects():
+    sides = RIGHT + NOT_RIGHT + [(5, 3, 4), (13, 12, 5)]
+    batch = TriangleBatch(sides)
+    assert batch.is_valid().tolist() == [RightTriangle(*s).is_valid() for s in sides]
+
+
+def test_right_check_tolerance():
+    # Гипотенуза, отличающаяся меньше чем на REL_TOL, допустима - как math.isclose в классе
+    side = 5 * (1 + TriangleBatch.REL_TOL / 10)
+    batch = TriangleBatch([(3, 4, side), (3, 4, 5 * (1 + 1e-6))])
+    assert batch.is_valid().tolist() == [True, False]
+    assert RightTriangle(3, 4, side).is_valid()
+
+
+def test_area_and_perimeter_match_objects():
+    triangles = [RightTriangle(*s) for s in RIGHT]
+    batch = TriangleBatch.from_triangles(triangles)
+    assert np.allclose(batch.area(), [t.area() for t in triangles])
+    assert np.allclose(batch.perimeter(), [t.perimeter() for t in triangles])
+
+
+def test_area_uses_legs():
+    # Гипотенуза на любом месте: площадь - половина произведения катетов
+    batch = TriangleBatch([(5, 3, 4), (13, 5, 12)])
+    assert batch.area().tolist() == [6.0, 30.0]
+
+
+def test_not_right_gives_nan():
+    batch = TriangleBatch(NOT_RIGHT)
+    for sides in NOT_RIGHT:
+        with pytest.raises(ValueError):
+            RightTriangle(*sides).area()
+        with pytest.raises(ValueError):
+            RightTriangle(*sides).perimeter()
+    assert np.isnan(batch.area()).all()
+    assert np.isnan(batch.perimeter()).all()
+
+
+def test_equals_and_invalid_sides():
+    left = TriangleBatch([(3, 4, 5), (3, 4, 5)])
+    right = TriangleBatch([(5, 3, 4), (6, 8, 10)])
+    assert left.equals(right).tolist() == [
+        RightTriangle(3, 4, 5) == RightTriangle(5, 3, 4),
+        RightTriangle(3, 4, 5) == RightTriangle(6, 8, 10),
+    ]
+    with pytest.raises(ValueError):
+        RightTriangle(-3, 4, 5)
+    with pytest.raises(ValueError, match=r"\[1\]"):
+        TriangleBatch([(3, 4, 5), (-3, 4, 5)])
@@ -1,3 +1,10 @@
+import mmap
+import operator
+import sys
+import time
+from typing import Iterable, Optional, Tuple
+
+
 def is_valid(brackets: str) -> bool:
     """
     Проверяет, является ли последовательность скобок корректной.
@@ -22,6 +29,144 @@ def is_valid(brackets: str) -> bool:
     return not stack
 
 
+# Таблица классов байтов: 0 - посторонний символ, 1 - открывающая скобка,
+# иначе - код открывающей скобки, парной для данной закрывающей
+_OTHER = 0
+_OPENING = 1
+_BYTE_CLASSES = [_OTHER] * 256
+for _open, _close in ("()", "[]", "{}"):
+    _BYTE_CLASSES[ord(_open)] = _OPENING
+    _BYTE_CLASSES[ord(_close)] = ord(_open)
+
+
+class BracketValidator:
+    """
+    Потоковая (возобновляемая) проверка скобочной последовательности.
+
+    Данные подаются кусками байтов через feed(), стек хранится компактно
+    в bytearray (один байт на открытую скобку). Смещения считаются в байтах
+    от начала потока.
+
+    Args:
+        skip_other (bool): Пропускать посторонние символы вместо того,
+            чтобы считать их ошибкой (как это делает is_valid)
+    """
+
+    def __init__(self, skip_other: bool = False):
+        self._stack = bytearray()
+        self._skip_other = skip_other
+        self.offset = 0
+        self.error_offset: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Обрабатывает очередной кусок данных.
+
+        Args:
+            chunk (bytes): Кусок входных данных (bytes, bytearray, memoryview)
+
+        Returns:
+            bool: False, если ошибка уже найдена, True в противном случае
+        """
+        if self.error_offset is not None:
+            return False
+
+        if not isinstance(chunk, (bytes, bytearray)):
+            chunk = bytes(chunk)
+
+        stack = self._stack
+        push = stack.append
+        pop = stack.pop
+        classes = _BYTE_CLASSES
+        skip_other = self._skip_other
+
+        # Индекс не отслеживается в цикле: при ошибке он восстанавливается
+        # по числу оставшихся в итераторе байтов
+        codes = iter(chunk)
+        for code in codes:
+            kind = classes[code]
+            if kind == _OPENING:
+                push(code)
+            elif kind == _OTHER:
+                if not skip_other:
+                    break
+            elif not stack or pop() != kind:
+                break
+        else:
+            self.offset += len(chunk)
+            return True
+
+        self.error_offset = self.offset + len(chunk) - operator.length_hint(codes) - 1
+        return False
+
+    def finish(self) -> Tuple[bool, Optional[int]]:
+        """
+        Завершает проверку потока.
+
+        Returns:
+            tuple: (True, None) если последовательность корректна, иначе
+                (False, смещение первой ошибки). Для незакрытых скобок
+                смещением ошибки считается конец потока.
+        """
+        if self.error_offset is None and self._stack:
+            self.error_offset = self.offset
+        return self.error_offset is None, self.error_offset
+
+
+def validate_stream(chunks: Iterable[bytes], skip_other: bool = False) -> Tuple[bool, Optional[int]]:
+    """
+    Проверяет скобочную последовательность, заданную итерируемым набором кусков байтов.
+
+    Args:
+        chunks (Iterable[bytes]): Куски входных данных
+        skip_other (bool): Пропускать посторонние символы
+
+    Returns:
+        tuple: (корректна ли последовательность, смещение первой ошибки или None)
+    """
+    validator = BracketValidator(skip_other)
+    for chunk in chunks:
+        if not validator.feed(chunk):
+            break
+    return validator.finish()
+
+
+def validate_file(path: str, chunk_size: int = 1 << 20, skip_other: bool = False) -> Tuple[bool, Optional[int]]:
+    """
+    Проверяет скобочную последовательность в файле, отображённом в память (mmap).
+
+    Args:
+        path (str): Путь к файлу
+        chunk_size (int): Размер обрабатываемого за раз куска в байтах
+        skip_other (bool): Пропускать посторонние символы
+
+    Returns:
+        tuple: (корректна ли последовательность, смещение первой ошибки или None)
+    """
+    with open(path, "rb") as file:
+        file.seek(0, 2)
+        size = file.tell()
+        if size == 0:
+            return True, None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            chunks = (mapped[start : start + chunk_size] for start in range(0, size, chunk_size))
+            return validate_stream(chunks, skip_other)
+
+
+def benchmark(repeats: int = 1_000_000):
+    """Сравнивает время работы is_valid и потоковой проверки на одной и той же строке."""
+    brackets = "([{" * repeats + "}])" * repeats
+    data = brackets.encode("ascii")
+
+    start = time.perf_counter()
+    is_valid(brackets)
+    print(f"is_valid:        {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    validate_stream(data[i : i + (1 << 20)] for i in range(0, len(data), 1 << 20))
+    print(f"validate_stream: {time.perf_counter() - start:.3f} с")
+
+
 def main():
     input_string = input("Введите строку, содержащую только скобки: ")
     result = is_valid(input_string)
@@ -29,4 +174,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        main()
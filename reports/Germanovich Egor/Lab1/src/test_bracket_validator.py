@@ -0,0 +1,76 @@
+import itertools
+import random
+
+import pytest
+from Lab1_2 import BracketValidator, is_valid, validate_file, validate_stream
+
+PAIRS = {")": "(", "]": "[", "}": "{"}
+
+
+def reference(text, skip_other=False):
+    """Простая посимвольная проверка: (корректна ли строка, смещение первой ошибки или None)"""
+    stack = []
+    for offset, char in enumerate(text):
+        if char in "([{":
+            stack.append(char)
+        elif char in PAIRS:
+            if not stack or stack.pop() != PAIRS[char]:
+                return False, offset
+        elif not skip_other:
+            return False, offset
+    return (False, len(text)) if stack else (True, None)
+
+
+def random_strings(alphabet, count, seed):
+    rng = random.Random(seed)
+    strings = ["", "()", "([]{})", "(((", ")", "(]", "([)]", "a", "(a)"]
+    for _ in range(count):
+        # Половина строк - заведомо корректные, чтобы ошибка была не в начале
+        balanced = "".join(rng.choice(["()", "[]", "{}"]) for _ in range(rng.randint(0, 20)))
+        noise = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        strings.append(balanced[: len(balanced) // 2] + noise + balanced[len(balanced) // 2 :])
+        strings.append(balanced)
+    return strings
+
+
+def chunked(data, size):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+def test_all_short_strings_match_is_valid():
+    """Тест: на всех строках из скобок длины до 6 потоковая проверка совпадает с is_valid"""
+    for length in range(7):
+        for chars in itertools.product("()[]{}", repeat=length):
+            text = "".join(chars)
+            result = validate_stream([text.encode("ascii")])
+            assert result[0] == is_valid(text)
+            assert result == reference(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+def test_chunks_match_reference(chunk_size):
+    """Тест: результат и смещение ошибки не зависят от разбиения на куски"""
+    for text in random_strings("()[]{}x", 200, chunk_size):
+        data = text.encode("ascii")
+        assert validate_stream(chunked(data, chunk_size)) == reference(text)
+        assert validate_stream(chunked(data, chunk_size))[0] == is_valid(text)
+        assert validate_stream(chunked(data, chunk_size), skip_other=True) == reference(text, skip_other=True)
+
+
+def test_feed_after_error_and_memoryview():
+    """Тест: после ошибки feed возвращает False, memoryview принимается как bytes"""
+    validator = BracketValidator()
+    assert validator.feed(memoryview(b"(["))
+    assert not validator.feed(b"})")
+    assert not validator.feed(b"()")
+    assert validator.finish() == (False, 2)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_file_matches_reference(tmp_path, chunk_size):
+    """Тест: проверка файла через mmap совпадает с посимвольной проверкой"""
+    path = tmp_path / "brackets.txt"
+    for text in random_strings("()[]{} ", 50, 100 + chunk_size):
+        path.write_bytes(text.encode("ascii"))
+        assert validate_file(str(path), chunk_size) == reference(text)
+        assert validate_file(str(path), chunk_size, skip_other=True) == reference(text, skip_other=True)
@@ -1,7 +1,25 @@
+import sys
+import time
+import tracemalloc
+from typing import Iterable, Optional
+
+import numpy as np
+
+ERROR_MESSAGE = "Ошибка: Ширина и высота прямоугольника должны быть положительными числами."
+BATCH_ERROR_MESSAGE = (
+    "Ошибка: Ширина и высота прямоугольника должны быть положительными числами "
+    "(некорректных: {count}, индексы: {shown})."
+)
+
+
 class Rectangle:
+    # Без __dict__: объект хранит только два поля, что заметно экономит память на миллионах объектов
+    __slots__ = ("_width", "_height")
+
     def __init__(self, rect_width: float, rect_height: float):
-        if rect_width < 0 or rect_height < 0:
-            raise ValueError("Ошибка: Ширина и высота прямоугольника должны быть положительными числами.")
+        # Сравнение с nan всегда ложно, поэтому nan отклоняется так же, как в RectangleArray
+        if not (rect_width >= 0 and rect_height >= 0):
+            raise ValueError(ERROR_MESSAGE)
         self._width = rect_width
         self._height = rect_height
 
@@ -34,7 +52,119 @@ class Rectangle:
         return f"Rectangle(width={self._width}, height={self._height})"
 
 
+class RectangleArray:
+    # Много прямоугольников в двух массивах float64 (ширины и высоты):
+    # 16 байт на прямоугольник, все вычисления и проверки выполняются сразу для всего набора
+    def __init__(self, widths: Iterable[float], heights: Iterable[float]):
+        widths = np.array(widths, dtype=np.float64).ravel()
+        heights = np.array(heights, dtype=np.float64).ravel()
+        if widths.shape != heights.shape:
+            raise ValueError("Ошибка: Количество ширин и высот должно совпадать.")
+        # Одна проверка на весь набор; nan тоже считается ошибкой
+        bad = np.flatnonzero(~((widths >= 0) & (heights >= 0)))
+        if bad.size:
+            shown = ", ".join(map(str, bad[:20].tolist())) + (", ..." if bad.size > 20 else "")
+            raise ValueError(BATCH_ERROR_MESSAGE.format(count=bad.size, shown=shown))
+        self.widths = widths
+        self.heights = heights
+
+    @classmethod
+    def from_rectangles(cls, rectangles: Iterable[Rectangle]) -> "RectangleArray":
+        rectangles = list(rectangles)
+        return cls([rect.width for rect in rectangles], [rect.height for rect in rectangles])
+
+    @classmethod
+    def from_file(cls, path: str, delimiter: Optional[str] = None) -> "RectangleArray":
+        # Текстовый файл со строками "ширина высота" (или через delimiter), разбирается numpy целиком
+        data = np.loadtxt(path, dtype=np.float64, delimiter=delimiter, ndmin=2)
+        if data.size and data.shape[1] != 2:
+            raise ValueError("Ошибка: В каждой строке файла должно быть два числа.")
+        return cls(data[:, 0] if data.size else [], data[:, 1] if data.size else [])
+
+    @classmethod
+    def _from_valid(cls, widths, heights) -> "RectangleArray":
+        # Массивы уже проверены (срез или перестановка существующего набора)
+        result = cls.__new__(cls)
+        result.widths = widths
+        result.heights = heights
+        return result
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Rectangle(float(self.widths[index]), float(self.heights[index]))
+        return self._from_valid(self.widths[index], self.heights[index])
+
+    def area(self):
+        return self.widths * self.heights
+
+    def perimeter(self):
+        return 2 * (self.widths + self.heights)
+
+    def is_square(self):
+        return self.widths == self.heights
+
+    def is_valid(self):
+        return (self.widths > 0) & (self.heights > 0)
+
+    def equals(self, other: "RectangleArray"):
+        return (self.widths == other.widths) & (self.heights == other.heights)
+
+    def sorted_by_area(self, descending: bool = False) -> "RectangleArray":
+        order = np.argsort(self.area(), kind="stable")
+        return self[order[::-1] if descending else order]
+
+    def top_k_by_area(self, k: int) -> "RectangleArray":
+        # k наибольших по площади (по убыванию): argpartition за O(n), сортируются только k элементов
+        areas = self.area()
+        k = min(max(k, 0), len(areas))
+        if k == 0:
+            return self[:0]
+        candidates = np.argpartition(areas, len(areas) - k)[len(areas) - k :]
+        return self[candidates[np.argsort(-areas[candidates], kind="stable")]]
+
+    @property
+    def nbytes(self) -> int:
+        return self.widths.nbytes + self.heights.nbytes
+
+    def __str__(self) -> str:
+        return f"RectangleArray({len(self)} прямоугольников)"
+
+
+def benchmark(count: int = 10**6) -> None:
+    rng = np.random.default_rng(0)
+    widths, heights = rng.uniform(1, 100, count), rng.uniform(1, 100, count)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    rectangles = [Rectangle(w, h) for w, h in zip(widths.tolist(), heights.tolist())]
+    total = sum(rect.area() for rect in rectangles)
+    largest = sorted(rectangles, key=Rectangle.area, reverse=True)[:10]
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{count} объектов Rectangle: {elapsed:.3f} с, пик памяти {memory / 2**20:.1f} МиБ")
+    del rectangles
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    boxes = RectangleArray(widths, heights)
+    batch_total = boxes.area().sum()
+    batch_largest = boxes.top_k_by_area(10)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"RectangleArray: {elapsed:.3f} с, пик памяти {memory / 2**20:.1f} МиБ")
+    assert np.isclose(total, batch_total)
+    assert [rect.area() for rect in largest] == batch_largest.area().tolist()
+
+
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark()
+        sys.exit()
     try:
         width = float(input("Введите ширину прямоугольника: "))
         height = float(input("Введите высоту прямоугольника: "))
@@ -0,0 +1,66 @@
+import pytest
+from Lab2_1 import BATCH_ERROR_MESSAGE, ERROR_MESSAGE, Rectangle, RectangleArray
+
+SIZES = [(3.0, 4.0), (5.0, 5.0), (0.0, 2.0), (2.5, 0.5), (7.0, 1.0), (1.0, 7.0), (0.0, 0.0)]
+
+
+def rectangles():
+    return [Rectangle(width, height) for width, height in SIZES]
+
+
+def test_matches_rectangle():
+    """Тест: характеристики RectangleArray совпадают с объектами Rectangle"""
+    boxes = RectangleArray.from_rectangles(rectangles())
+    assert len(boxes) == len(SIZES)
+    assert boxes.area().tolist() == [rect.area() for rect in rectangles()]
+    assert boxes.perimeter().tolist() == [rect.perimeter() for rect in rectangles()]
+    assert boxes.is_square().tolist() == [rect.is_square() for rect in rectangles()]
+    assert boxes.is_valid().tolist() == [rect.is_valid() for rect in rectangles()]
+
+
+def test_getitem_returns_rectangle():
+    """Тест: элемент набора - обычный Rectangle, срез - RectangleArray"""
+    boxes = RectangleArray.from_rectangles(rectangles())
+    assert [boxes[i] for i in range(len(boxes))] == rectangles()
+    assert isinstance(boxes[1:3], RectangleArray)
+    assert boxes[1:3].area().tolist() == [25.0, 0.0]
+
+
+def test_equals():
+    """Тест: попарное сравнение совпадает с Rectangle.__eq__"""
+    first = RectangleArray.from_rectangles(rectangles())
+    other = [Rectangle(3.0, 4.0), Rectangle(5.0, 4.0), Rectangle(0.0, 2.0)] + rectangles()[3:]
+    second = RectangleArray.from_rectangles(other)
+    assert first.equals(second).tolist() == [a == b for a, b in zip(rectangles(), other)]
+
+
+def test_sorted_and_top_k():
+    """Тест: сортировка и k наибольших по площади совпадают с sorted для объектов"""
+    boxes = RectangleArray.from_rectangles(rectangles())
+    expected = sorted(rectangles(), key=Rectangle.area)
+    assert [boxes.sorted_by_area()[i] for i in range(len(boxes))] == expected
+    top = boxes.top_k_by_area(3)
+    assert top.area().tolist() == sorted((rect.area() for rect in rectangles()), reverse=True)[:3]
+    assert len(boxes.top_k_by_area(0)) == 0
+    assert len(boxes.top_k_by_area(100)) == len(boxes)
+
+
+def test_invalid_sizes():
+    """Тест: отрицательные размеры и nan отклоняются и Rectangle, и RectangleArray"""
+    for width, height in [(-1.0, 2.0), (1.0, float("nan")), (float("nan"), 1.0)]:
+        with pytest.raises(ValueError) as error:
+            Rectangle(width, height)
+        assert str(error.value) == ERROR_MESSAGE
+    with pytest.raises(ValueError) as error:
+        RectangleArray([1.0, -1.0, 2.0], [1.0, 1.0, float("nan")])
+    assert str(error.value) == BATCH_ERROR_MESSAGE.format(count=2, shown="1, 2")
+    with pytest.raises(ValueError):
+        RectangleArray([1.0, 2.0], [1.0])
+
+
+def test_from_file(tmp_path):
+    """Тест: чтение набора из текстового файла"""
+    path = tmp_path / "rectangles.txt"
+    path.write_text("\n".join(f"{width} {height}" for width, height in SIZES), encoding="utf-8")
+    boxes = RectangleArray.from_file(str(path))
+    assert [boxes[i] for i in range(len(boxes))] == rectangles()
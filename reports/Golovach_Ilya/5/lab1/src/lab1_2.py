@@ -1,16 +1,152 @@
+import pickle
+
+
 def longest_common_prefix(strs):
+    strs = list(strs)  # итератор можно пройти только один раз, а min и max проходят по данным дважды
     if not strs:
         return ""
 
-    prefix = ""
-    for chars in zip(*strs):
-        if len(set(chars)) == 1:
-            prefix += chars[0]
-        else:
+    # Общий префикс всех строк равен общему префиксу лексикографически
+    # наименьшей и наибольшей из них, поэтому сравниваются только две строки
+    low = min(strs)
+    high = max(strs)
+    length = 0
+    for low_char, high_char in zip(low, high):
+        if low_char != high_char:
             break
+        length += 1
+
+    return low[:length]
+
+
+class PrefixIndex:
+    # Сжатое префиксное дерево (radix trie) для повторных запросов LCP и группировки по префиксам.
+    # Узлы хранятся в плоских списках, поэтому индекс легко сохраняется на диск.
+    def __init__(self, strs=()):
+        self.strings = []
+        self.children = [{}]  # первая буква метки ребра -> номер дочернего узла
+        self.labels = [""]  # метка ребра, ведущего в узел
+        self.parents = [-1]
+        self.depths = [0]  # длина префикса, соответствующего узлу
+        self.terminals = [[]]  # номера строк, заканчивающихся в узле
+        self.nodes_of = []  # номер строки -> её конечный узел
+        for string in strs:
+            self.add(string)
+
+    def _new_node(self, parent, label):
+        self.children.append({})
+        self.labels.append(label)
+        self.parents.append(parent)
+        self.depths.append(self.depths[parent] + len(label))
+        self.terminals.append([])
+        return len(self.labels) - 1
+
+    def add(self, string):
+        string_id = len(self.strings)
+        self.strings.append(string)
+        node, pos = 0, 0
+        while pos < len(string):
+            child = self.children[node].get(string[pos])
+            if child is None:
+                leaf = self._new_node(node, string[pos:])
+                self.children[node][string[pos]] = leaf
+                node = leaf
+                break
+            label = self.labels[child]
+            if string.startswith(label, pos):
+                node, pos = child, pos + len(label)
+                continue
+            # Строка расходится с меткой ребра: разбиваем ребро промежуточным узлом
+            common = 1
+            while pos + common < len(string) and string[pos + common] == label[common]:
+                common += 1
+            middle = self._new_node(node, label[:common])
+            self.children[node][string[pos]] = middle
+            self.labels[child] = label[common:]
+            self.parents[child] = middle
+            self.children[middle][label[common]] = child
+            node, pos = middle, pos + common
+        self.terminals[node].append(string_id)
+        self.nodes_of.append(node)
+        return string_id
+
+    def _common_ancestor(self, first, second):
+        depths, parents = self.depths, self.parents
+        while first != second:
+            if depths[first] >= depths[second]:
+                first = parents[first]
+            else:
+                second = parents[second]
+        return first
+
+    def lcp(self, string_ids):
+        # Общий префикс подмножества строк, заданного их номерами
+        string_ids = list(string_ids)
+        if not string_ids:
+            return ""
+        node = self.nodes_of[string_ids[0]]
+        for string_id in string_ids[1:]:
+            node = self._common_ancestor(node, self.nodes_of[string_id])
+            if node == 0:
+                return ""
+        return self.strings[string_ids[0]][: self.depths[node]]
+
+    def _subtree_ids(self, node):
+        found = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            found.extend(self.terminals[current])
+            stack.extend(self.children[current].values())
+        return found
+
+    def with_prefix(self, prefix):
+        # Номера всех строк, начинающихся с prefix
+        node, pos = 0, 0
+        while pos < len(prefix):
+            child = self.children[node].get(prefix[pos])
+            if child is None:
+                return []
+            label = self.labels[child]
+            rest = prefix[pos : pos + len(label)]
+            if not label.startswith(rest):
+                return []
+            node, pos = child, pos + len(label)
+        return sorted(self._subtree_ids(node))
+
+    def group_by_prefix(self, length):
+        # Группы строк с одинаковыми первыми length символами (более короткие строки - отдельно)
+        groups = {}
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self.depths[node] >= length:
+                ids = self._subtree_ids(node)
+                if ids:
+                    groups[self.strings[ids[0]][:length]] = [self.strings[i] for i in sorted(ids)]
+                continue
+            for string_id in self.terminals[node]:
+                groups.setdefault(self.strings[string_id], []).append(self.strings[string_id])
+            stack.extend(self.children[node].values())
+        return groups
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            pickle.dump(self.__dict__, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+        with open(path, "rb") as file:
+            index.__dict__.update(pickle.load(file))
+        return index
+
+
+def main():
+    user_input = input("Введите строки через пробел: ")
+    strings_list = list(map(str, user_input.split()))
+    print(longest_common_prefix(strings_list))
 
-    return prefix
 
-user_input = input("Введите строки через пробел: ")
-strings_list = list(map(str, user_input.split()))
-print(longest_common_prefix(strings_list))
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from lab1_2 import PrefixIndex, longest_common_prefix
+
+
+def test_iterator_input():
+    assert longest_common_prefix(iter(["abc", "abd"])) == "ab"
+    assert longest_common_prefix(s for s in ["flower", "flow", "flight"]) == "fl"
+    assert longest_common_prefix(iter([])) == ""
+
+
+def test_subset_lcp():
+    index = PrefixIndex(["/api/v1/users", "/api/v1/items", "/api/v2/users", "/static/app.js"])
+    assert index.lcp([0, 1]) == "/api/v1/"
+    assert index.lcp([0, 1, 2]) == "/api/v"
+    assert index.lcp([0, 3]) == "/"
+    assert index.lcp([2]) == "/api/v2/users"
+    assert index.lcp([]) == ""
+
+
+def test_prefix_queries():
+    index = PrefixIndex(["car", "cart", "care", "dog", "car"])
+    assert index.with_prefix("car") == [0, 1, 2, 4]
+    assert index.with_prefix("x") == []
+    groups = index.group_by_prefix(3)
+    assert sorted(groups["car"]) == ["car", "car", "care", "cart"]
+    assert groups["dog"] == ["dog"]
+
+
+def test_save_load(tmp_path):
+    index = PrefixIndex(["alpha", "alphabet", "beta"])
+    index.save(str(tmp_path / "index.pkl"))
+    loaded = PrefixIndex.load(str(tmp_path / "index.pkl"))
+    assert loaded.lcp([0, 1]) == "alpha"
+    assert loaded.with_prefix("alp") == [0, 1]
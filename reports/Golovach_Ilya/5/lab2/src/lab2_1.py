@@ -1,46 +1,91 @@
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для LimitedIntSet
+    np = None
+
+OVERFLOW_MESSAGE = "Количество элементов превышает максимальную мощность множества"
+INTEGER_MESSAGE = "Элементы LimitedIntSet должны быть целыми числами"
+
+
 class LimitedPowerSet:
+    # Элементы хранятся в словаре (ключи, порядок вставки), поэтому add, remove и contains - O(1).
+    # Повторы в initial_elements отбрасываются до проверки max_size: [1, 1, 1] помещается в множество
+    # мощности 1 (раньше такой список отклонялся по длине вместе с повторами)
     def __init__(self, max_size, initial_elements=None):
         if initial_elements is None:
             initial_elements = []
 
-        if len(initial_elements) > max_size:
+        self.max_size = max_size
+        self._set_elements(initial_elements)
+        if len(self) > max_size:
             raise ValueError("Количество начальных элементов превышает максимальную мощность множества")
 
-        self.max_size = max_size
-        self.elements = list(set(initial_elements))
+    def _set_elements(self, values):
+        # Хранилище элементов; подкласс с другим хранилищем переопределяет только этот метод
+        self._elements = dict.fromkeys(values)
 
-    def add(self, value):
-        if value in self.elements:
-            print(f"Элемент {value} уже существует в множестве")
-            return False
+    @property
+    def elements(self):
+        return list(self._elements)
 
-        if len(self.elements) >= self.max_size:
-            print("Множество достигло максимальной мощности. Элемент не может быть добавлен")
+    def __len__(self):
+        return len(self._elements)
+
+    def __iter__(self):
+        return iter(self._elements)
+
+    def __contains__(self, value):
+        return value in self._elements
+
+    def add(self, value):
+        # False, если элемент уже есть или множество заполнено
+        if value in self._elements or len(self._elements) >= self.max_size:
             return False
 
-        self.elements.append(value)
-        print(f"Элемент {value} добавлен успешно")
+        self._elements[value] = None
         return True
 
     def remove(self, value):
-        if value not in self.elements:
-            print(f"Элемент {value} не найден в множестве")
+        if value not in self._elements:
             return False
 
-        self.elements.remove(value)
-        print(f"Элемент {value} удалён успешно")
+        del self._elements[value]
         return True
 
-    def union(self, other_set):
+    def update(self, values):
+        # Добавляет сразу много элементов: либо все новые, либо (при переполнении) ни одного
+        new_elements = [value for value in dict.fromkeys(values) if value not in self._elements]
+        if len(self._elements) + len(new_elements) > self.max_size:
+            raise ValueError(OVERFLOW_MESSAGE)
+        self._elements.update(dict.fromkeys(new_elements))
+        return len(new_elements)
+
+    def difference_update(self, values):
+        size = len(self._elements)
+        for value in values:
+            self._elements.pop(value, None)
+        return size - len(self._elements)
+
+    def _check_other(self, other_set, operation):
         if not isinstance(other_set, LimitedPowerSet):
-            raise TypeError("Объединение возможно только с объектами типа LimitedPowerSet")
+            raise TypeError(f"{operation} возможно только с объектами типа LimitedPowerSet")
 
+    def union(self, other_set):
+        self._check_other(other_set, "Объединение")
         new_max_size = self.max_size + other_set.max_size
-        new_elements = list(set(self.elements).union(other_set.elements))
-        return LimitedPowerSet(new_max_size, new_elements)
+        return LimitedPowerSet(new_max_size, {**self._elements, **dict.fromkeys(other_set)})
+
+    def intersection(self, other_set):
+        self._check_other(other_set, "Пересечение")
+        smaller, larger = sorted((self, other_set), key=len)
+        return LimitedPowerSet(self.max_size, [value for value in smaller if value in larger])
+
+    def difference(self, other_set):
+        self._check_other(other_set, "Разность")
+        return LimitedPowerSet(self.max_size, [value for value in self if value not in other_set])
 
     def contains(self, value):
-        return value in self.elements
+        return value in self._elements
 
     def __str__(self):
         return f"Множество: {self.elements}, Максимальная мощность: {self.max_size}"
@@ -48,7 +93,108 @@ class LimitedPowerSet:
     def __eq__(self, other):
         if not isinstance(other, LimitedPowerSet):
             return False
-        return set(self.elements) == set(other.elements)
+        return len(self) == len(other) and all(value in other for value in self)
+
+
+def _as_int64(values):
+    # Приведение к int64 без потерь: 2.0 становится 2, а дробное 1.5 отклоняется (а не обрезается до 1)
+    array = np.asarray(values).ravel()
+    if array.dtype.kind == "f":
+        if not np.all(np.isfinite(array) & (array == np.trunc(array))):
+            raise ValueError(INTEGER_MESSAGE)
+    elif array.dtype.kind not in "biu" and array.size:
+        raise ValueError(INTEGER_MESSAGE)
+    return array.astype(np.int64)
+
+
+def _sorted_unique(values):
+    # Сортировка и отбрасывание соседних повторов (быстрее np.unique для int64)
+    array = np.sort(_as_int64(values), kind="stable")
+    keep = np.ones(len(array), dtype=bool)
+    keep[1:] = array[1:] != array[:-1]
+    return array[keep]
+
+
+class LimitedIntSet(LimitedPowerSet):
+    # Множество целых чисел в отсортированном массиве numpy без повторов.
+    # Одиночные add/remove - O(n), зато операции над большими множествами выполняются векторно.
+    # Словарь базового класса не создаётся: всё состояние - max_size и array
+    def _set_elements(self, values):
+        self.array = _sorted_unique(values)
+
+    @classmethod
+    def _from_sorted(cls, max_size, array):
+        # Массив уже отсортирован и без повторов
+        result = cls(max_size)
+        result.array = array
+        return result
+
+    @property
+    def elements(self):
+        return self.array.tolist()
+
+    def __len__(self):
+        return len(self.array)
+
+    def __iter__(self):
+        return iter(self.array.tolist())
+
+    def __contains__(self, value):
+        position = np.searchsorted(self.array, value)
+        return bool(position < len(self.array) and self.array[position] == value)
+
+    def contains(self, value):
+        return value in self
+
+    def add(self, value):
+        value = _as_int64(value)[0]
+        position = np.searchsorted(self.array, value)
+        if position < len(self.array) and self.array[position] == value or len(self.array) >= self.max_size:
+            return False
+        self.array = np.insert(self.array, position, value)
+        return True
+
+    def remove(self, value):
+        if value not in self:
+            return False
+        self.array = np.delete(self.array, np.searchsorted(self.array, value))
+        return True
+
+    def update(self, values):
+        merged = _sorted_unique(np.concatenate((self.array, _as_int64(values))))
+        if len(merged) > self.max_size:
+            raise ValueError(OVERFLOW_MESSAGE)
+        added = len(merged) - len(self.array)
+        self.array = merged
+        return added
+
+    def difference_update(self, values):
+        size = len(self.array)
+        # Без приведения к int64: дробное 1.5 не совпадает ни с одним элементом и не удаляет 1
+        self.array = self.array[~np.isin(self.array, np.asarray(values).ravel())]
+        return size - len(self.array)
+
+    @staticmethod
+    def _as_array(other_set):
+        return other_set.array if isinstance(other_set, LimitedIntSet) else np.asarray(list(other_set))
+
+    def union(self, other_set):
+        self._check_other(other_set, "Объединение")
+        merged = _sorted_unique(np.concatenate((self.array, _as_int64(self._as_array(other_set)))))
+        return LimitedIntSet._from_sorted(self.max_size + other_set.max_size, merged)
+
+    def intersection(self, other_set):
+        self._check_other(other_set, "Пересечение")
+        return LimitedIntSet._from_sorted(self.max_size, self.array[np.isin(self.array, self._as_array(other_set))])
+
+    def difference(self, other_set):
+        self._check_other(other_set, "Разность")
+        return LimitedIntSet._from_sorted(self.max_size, self.array[~np.isin(self.array, self._as_array(other_set))])
+
+    def __eq__(self, other):
+        if isinstance(other, LimitedIntSet):
+            return np.array_equal(self.array, other.array)
+        return super().__eq__(other)
 
 
 def get_integer(prompt):
@@ -72,27 +218,33 @@ def add_element(set1, set2):
     set_num = input("В какое множество добавить элемент? (1 или 2): ")
     value = get_integer("Введите значение элемента: ")
     target_set = set1 if set_num == "1" else set2 if set_num == "2" else None
-    if target_set:
-        target_set.add(value)
-    else:
+    if target_set is None:
         print("Некорректный выбор множества.")
+    elif target_set.contains(value):
+        print(f"Элемент {value} уже существует в множестве")
+    elif target_set.add(value):
+        print(f"Элемент {value} добавлен успешно")
+    else:
+        print("Множество достигло максимальной мощности. Элемент не может быть добавлен")
 
 
 def remove_element(set1, set2):
     set_num = input("Из какого множества удалить элемент? (1 или 2): ")
     value = get_integer("Введите значение элемента: ")
     target_set = set1 if set_num == "1" else set2 if set_num == "2" else None
-    if target_set:
-        target_set.remove(value)
-    else:
+    if target_set is None:
         print("Некорректный выбор множества.")
+    elif target_set.remove(value):
+        print(f"Элемент {value} удалён успешно")
+    else:
+        print(f"Элемент {value} не найден в множестве")
 
 
 def check_element(set1, set2):
     set_num = input("В каком множестве проверить принадлежность? (1 или 2): ")
     value = get_integer("Введите значение элемента: ")
     target_set = set1 if set_num == "1" else set2 if set_num == "2" else None
-    if target_set:
+    if target_set is not None:
         print(f"Элемент {value} {'принадлежит' if target_set.contains(value) else 'не принадлежит'} множеству.")
     else:
         print("Некорректный выбор множества.")
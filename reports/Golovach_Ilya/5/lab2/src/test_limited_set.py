@@ -0,0 +1,93 @@
+import pytest
+
+import lab2_1
+from lab2_1 import LimitedIntSet, LimitedPowerSet
+
+# LimitedIntSet проверяется только при установленном numpy
+BACKENDS = [LimitedPowerSet] + ([LimitedIntSet] if lab2_1.np is not None else [])
+with_backends = pytest.mark.parametrize("backend", BACKENDS, ids=lambda cls: cls.__name__)
+
+
+@with_backends
+def test_duplicates_removed_before_max_size(backend):
+    # Повторы не считаются в мощности: [1, 1, 1] - одно значение
+    limited = backend(1, [1, 1, 1])
+    assert sorted(limited) == [1]
+    with pytest.raises(ValueError):
+        backend(2, [1, 2, 3, 3])
+
+
+@with_backends
+def test_add_remove_contains(backend):
+    limited = backend(3, [5, 1])
+    assert limited.add(3)
+    assert not limited.add(3)
+    assert not limited.add(7)  # множество заполнено
+    assert 3 in limited and limited.contains(5) and 7 not in limited
+    assert limited.remove(5)
+    assert not limited.remove(5)
+    assert sorted(limited.elements) == [1, 3]
+    assert len(limited) == 2
+
+
+@with_backends
+def test_update_is_all_or_nothing(backend):
+    limited = backend(4, [1, 2])
+    assert limited.update([2, 3, 3]) == 1
+    with pytest.raises(ValueError):
+        limited.update([10, 11])
+    assert sorted(limited) == [1, 2, 3]
+    assert limited.difference_update([1, 3, 99]) == 2
+    assert sorted(limited) == [2]
+
+
+@with_backends
+def test_set_algebra(backend):
+    first, second = backend(5, [1, 2, 3, 4]), backend(4, [3, 4, 5])
+    union = first.union(second)
+    assert sorted(union) == [1, 2, 3, 4, 5] and union.max_size == 9
+    assert sorted(first.intersection(second)) == [3, 4]
+    assert sorted(first.difference(second)) == [1, 2]
+    with pytest.raises(TypeError):
+        first.union({1, 2})
+
+
+def test_backends_agree():
+    if LimitedIntSet not in BACKENDS:
+        pytest.skip("numpy не установлен")
+    dict_backed, array_backed = LimitedPowerSet(5, [3, 1, 2]), LimitedIntSet(5, [2, 3, 1, 1])
+    assert dict_backed == array_backed
+    assert array_backed == dict_backed
+    assert sorted(array_backed.union(dict_backed)) == [1, 2, 3]
+    assert not hasattr(array_backed, "_elements")
+
+
+def test_int_set_rejects_fractions():
+    if LimitedIntSet not in BACKENDS:
+        pytest.skip("numpy не установлен")
+    limited = LimitedIntSet(5, [1, 2])
+    with pytest.raises(ValueError):
+        limited.add(1.5)
+    with pytest.raises(ValueError):
+        limited.update([3, 2.5])
+    with pytest.raises(ValueError):
+        LimitedIntSet(5, [1, 0.5])
+    with pytest.raises(ValueError):
+        limited.union(LimitedPowerSet(5, [1.5]))
+    assert limited.elements == [1, 2]
+    # Дробное значение не совпадает с целым: 1.5 не удаляет 1 и не попадает в пересечение
+    assert 1.5 not in limited and not limited.remove(1.5)
+    assert limited.difference_update([1.5]) == 0
+    assert limited.intersection(LimitedPowerSet(5, [1.5, 2])).elements == [2]
+
+
+def test_int_set_duplicates_after_cast():
+    if LimitedIntSet not in BACKENDS:
+        pytest.skip("numpy не установлен")
+    limited = LimitedIntSet(3, [1, 1.0, 2])
+    assert limited.elements == [1, 2]
+    assert not limited.add(2.0)
+    assert limited.update([1.0, 2]) == 0
+    assert limited.add(3.0)
+    assert limited.elements == [1, 2, 3]
+    assert all(isinstance(value, int) for value in limited)
@@ -1,6 +1,105 @@
+import argparse
+import os
 import random
+import shutil
+import sys
+import tempfile
+from contextlib import ExitStack
 
-def main():
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для shuffle_array
+    np = None
+
+try:
+    import resource
+except ImportError:  # модуля resource нет в Windows
+    resource = None
+
+# Накладные расходы на строку в памяти: пустой str и указатель на него в списке
+LINE_OVERHEAD = sys.getsizeof("") + 8
+
+
+def shuffle_numbers(numbers, seed=None):
+    # Перемешанная копия списка; одинаковый seed даёт одинаковый порядок
+    result = list(numbers)
+    random.Random(seed).shuffle(result)
+    return result
+
+
+def shuffle_array(array, seed=None):
+    # Перестановка массива numpy в памяти
+    if np is None:
+        raise ImportError("Для shuffle_array необходим numpy")
+    return np.random.default_rng(seed).permutation(array)
+
+
+def read_numbers(stream):
+    # Чтение всех чисел из файла или stdin целиком, без построчных запросов
+    return [int(token) for token in stream.read().split()]
+
+
+def _memory_per_byte(path, sample_size=1 << 20):
+    # Во сколько раз строки в памяти больше, чем на диске: у каждой строки str есть
+    # заголовок объекта и указатель в списке, для коротких строк чисел это в разы больше текста
+    with open(path, "rb") as file:
+        sample = file.read(sample_size)
+    lines = max(1, sample.count(b"\n"))
+    return (len(sample) + lines * LINE_OVERHEAD) / max(1, len(sample))
+
+
+def _max_open_files(reserve=32):
+    # Корзины открыты одновременно, поэтому их не больше лимита дескрипторов процесса
+    if resource is None:
+        return 512 - reserve  # лимит по умолчанию для файлов CRT в Windows
+    soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if soft_limit == resource.RLIM_INFINITY:
+        return 1 << 16
+    return max(2, soft_limit - reserve)
+
+
+def external_shuffle(input_path, output_path, seed=None, buckets=None, memory_limit=1 << 28):
+    # Перемешивание файла больше оперативной памяти в два прохода:
+    # 1) каждая строка отправляется в случайную корзину на диске,
+    # 2) каждая корзина перемешивается в памяти и дописывается в результат.
+    # Корзина, которая всё равно не помещается в memory_limit (например, когда число корзин
+    # ограничено лимитом дескрипторов), перемешивается так же рекурсивно
+    rng = random.Random(seed)
+    input_size = os.path.getsize(input_path)
+    scale = _memory_per_byte(input_path)
+    if buckets is None:
+        buckets = max(1, -(-int(input_size * scale) // memory_limit))
+    buckets = min(buckets, _max_open_files())
+
+    temp_dir = tempfile.mkdtemp(prefix="shuffle_", dir=os.path.dirname(os.path.abspath(output_path)))
+    try:
+        bucket_paths = [os.path.join(temp_dir, f"bucket_{i}.txt") for i in range(buckets)]
+        with ExitStack() as stack:
+            bucket_files = [stack.enter_context(open(path, "w", encoding="utf-8")) for path in bucket_paths]
+            with open(input_path, encoding="utf-8") as source:
+                for line in source:
+                    if line.strip():
+                        bucket_files[rng.randrange(buckets)].write(line if line.endswith("\n") else line + "\n")
+
+        with open(output_path, "w", encoding="utf-8") as target:
+            for path in bucket_paths:
+                size = os.path.getsize(path)
+                # Рекурсия только если корзина меньше входа, иначе делить больше нечего
+                if buckets > 1 and size * scale > memory_limit and size < input_size:
+                    shuffled_path = path + ".shuffled"
+                    external_shuffle(path, shuffled_path, rng.getrandbits(64), memory_limit=memory_limit)
+                    with open(shuffled_path, encoding="utf-8") as bucket:
+                        shutil.copyfileobj(bucket, target)
+                    continue
+                with open(path, encoding="utf-8") as bucket:
+                    lines = bucket.readlines()
+                rng.shuffle(lines)
+                target.writelines(lines)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def interactive(seed=None):
     # Запрашиваем у пользователя количество чисел N
     try:
         N = int(input("Введите количество чисел (N): "))
@@ -24,12 +123,32 @@ def main():
             except ValueError:
                 print("Пожалуйста, введите корректное целое число.")
 
-    # Перемешиваем числа в случайном порядке
-    random.shuffle(numbers)
+    # Перемешиваем числа в случайном порядке (с --seed - воспроизводимо)
+    numbers = shuffle_numbers(numbers, seed)
 
     # Выводим числа в случайном порядке
     print("Числа в случайном порядке:")
     print(*numbers, sep=", ")
 
+
+def main():
+    parser = argparse.ArgumentParser(description="Перемешивание чисел")
+    parser.add_argument("input", nargs="?", help="файл с числами (по одному в строке)")
+    parser.add_argument("output", nargs="?", help="файл для результата внешнего перемешивания")
+    parser.add_argument("--seed", type=int, default=None, help="зерно генератора для воспроизводимости")
+    parser.add_argument("--buckets", type=int, default=None, help="число корзин на диске")
+    args = parser.parse_args()
+
+    if args.input and args.output:
+        external_shuffle(args.input, args.output, seed=args.seed, buckets=args.buckets)
+    elif args.input:
+        with open(args.input, encoding="utf-8") as file:
+            print(*shuffle_numbers(read_numbers(file), args.seed), sep="\n")
+    elif not sys.stdin.isatty():
+        print(*shuffle_numbers(read_numbers(sys.stdin), args.seed), sep="\n")
+    else:
+        interactive(args.seed)
+
+
 if __name__ == "__main__":
     main()
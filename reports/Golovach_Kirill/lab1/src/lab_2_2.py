@@ -1,4 +1,16 @@
-def majority_element(nums):
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для массивов и файлов
+    np = None
+
+
+def majority_element(nums, verify=False):
+    if np is not None and isinstance(nums, np.ndarray):
+        return _array_majority(nums.ravel(), verify)
+
     # Инициализация переменных
     count = 0
     candidate = None
@@ -7,13 +19,119 @@ def majority_element(nums):
     for num in nums:
         if count == 0:
             candidate = num
-        count += (1 if num == candidate else -1)
+        count += 1 if num == candidate else -1
 
     # Второй проход: проверяем, действительно ли candidate является элементом большинства
-    # (в данной задаче гарантируется, что элемент большинства существует)
+    # (в данной задаче гарантируется, что элемент большинства существует,
+    # поэтому проверка выполняется только по запросу)
+    if verify and sum(1 for num in nums if num == candidate) * 2 <= len(nums):
+        return None
     return candidate
 
 
+def _array_majority(array, verify):
+    # Элемент большинства занимает больше половины упорядоченного массива,
+    # поэтому он обязательно стоит на средней позиции: np.partition находит её за O(n)
+    if array.size == 0:
+        return None
+    middle = array.size // 2
+    candidate = np.partition(array, middle)[middle]
+    if verify and np.count_nonzero(array == candidate) * 2 <= array.size:
+        return None
+    return candidate.item()
+
+
+def _list_candidates(values, k):
+    # Обобщение Бойера-Мура (Мисра-Грис): k - 1 счётчиков
+    counters = {}
+    for value in values:
+        if value in counters:
+            counters[value] += 1
+        elif len(counters) < k - 1:
+            counters[value] = 1
+        else:
+            counters = {key: count - 1 for key, count in counters.items() if count > 1}
+    return set(counters)
+
+
+def _array_candidates(array, k):
+    # Элемент, встречающийся более n / k раз, после упорядочивания занимает
+    # непрерывный отрезок длиннее n / k и обязательно накрывает одну из позиций j * n / k
+    n = len(array)
+    if n == 0:
+        return set()
+    positions = sorted({j * n // k for j in range(k)})
+    return set(np.partition(array, positions)[positions].tolist())
+
+
+def _array_counts(array, candidates):
+    if not candidates:
+        return Counter()
+    selected = array[np.isin(array, list(candidates))]
+    values, counts = np.unique(selected, return_counts=True)
+    return Counter(dict(zip(values.tolist(), counts.tolist())))
+
+
+def heavy_hitters(values, k=2):
+    # Все элементы, встречающиеся более len(values) / k раз, с их точными частотами
+    if k < 2:
+        raise ValueError("k должно быть не меньше 2")
+
+    if np is not None and isinstance(values, np.ndarray):
+        counts = _array_counts(values, _array_candidates(values, k))
+    else:
+        candidates = _list_candidates(values, k)
+        counts = Counter(value for value in values if value in candidates)
+
+    threshold = len(values) / k
+    return {value: count for value, count in counts.items() if count > threshold}
+
+
+def _open_shard(path, dtype, start, stop):
+    return np.memmap(path, dtype=dtype, mode="r")[start:stop]
+
+
+def _shard_candidates(args):
+    path, dtype, start, stop, k = args
+    return _array_candidates(np.array(_open_shard(path, dtype, start, stop)), k)
+
+
+def _shard_counts(args):
+    path, dtype, start, stop, candidates = args
+    return _array_counts(_open_shard(path, dtype, start, stop), candidates)
+
+
+def heavy_hitters_file(path, dtype="int64", k=2, processes=None, shard_size=1 << 24):
+    # То же для двоичного файла с числами: шарды обрабатываются в пуле процессов,
+    # каждый процесс сам отображает свой кусок файла в память
+    if np is None:
+        raise ImportError("Для обработки файлов необходим numpy")
+    if k < 2:
+        raise ValueError("k должно быть не меньше 2")
+
+    n = len(np.memmap(path, dtype=dtype, mode="r"))
+    bounds = [(start, min(start + shard_size, n)) for start in range(0, n, shard_size)]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        # Глобально частый элемент частый хотя бы в одном шарде,
+        # поэтому объединение кандидатов шардов содержит всех кандидатов
+        candidates = set()
+        for shard in executor.map(_shard_candidates, [(path, dtype, start, stop, k) for start, stop in bounds]):
+            candidates |= shard
+
+        counts = Counter()
+        for shard in executor.map(_shard_counts, [(path, dtype, start, stop, candidates) for start, stop in bounds]):
+            counts.update(shard)
+
+    threshold = n / k
+    return {value: count for value, count in counts.items() if count > threshold}
+
+
+def majority_element_file(path, dtype="int64", processes=None):
+    result = heavy_hitters_file(path, dtype, k=2, processes=processes)
+    return next(iter(result), None)
+
+
 # Примеры использования
 if __name__ == "__main__":
     # Тестовые случаи
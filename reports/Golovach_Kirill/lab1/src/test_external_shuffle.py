@@ -0,0 +1,46 @@
+import lab_1_1
+from lab_1_1 import external_shuffle
+
+
+def write_numbers(path, count):
+    path.write_text("".join(f"{i}\n" for i in range(count)), encoding="utf-8")
+
+
+def read_numbers(path):
+    return [int(line) for line in path.read_text(encoding="utf-8").split()]
+
+
+def test_external_shuffle_is_permutation(tmp_path):
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    write_numbers(source, 50_000)
+    external_shuffle(source, target, seed=1, memory_limit=1 << 18)
+    shuffled = read_numbers(target)
+    assert sorted(shuffled) == list(range(50_000))
+    assert shuffled != list(range(50_000))
+    # Временные корзины удалены
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.txt", "out.txt"]
+
+
+def test_external_shuffle_seed_is_reproducible(tmp_path):
+    source = tmp_path / "in.txt"
+    write_numbers(source, 10_000)
+    external_shuffle(source, tmp_path / "a.txt", seed=7, memory_limit=1 << 16)
+    external_shuffle(source, tmp_path / "b.txt", seed=7, memory_limit=1 << 16)
+    assert read_numbers(tmp_path / "a.txt") == read_numbers(tmp_path / "b.txt")
+
+
+def test_external_shuffle_with_few_file_descriptors(tmp_path, monkeypatch):
+    # Корзин меньше, чем нужно по памяти: слишком большие корзины перемешиваются рекурсивно
+    monkeypatch.setattr(lab_1_1, "_max_open_files", lambda: 2)
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    write_numbers(source, 20_000)
+    external_shuffle(source, target, seed=3, memory_limit=1 << 16)
+    assert sorted(read_numbers(target)) == list(range(20_000))
+
+
+def test_interactive_uses_seed(monkeypatch, capsys):
+    answers = iter(["5", "1", "2", "3", "4", "5"])
+    monkeypatch.setattr("builtins.input", lambda _prompt: next(answers))
+    lab_1_1.interactive(seed=42)
+    expected = ", ".join(map(str, lab_1_1.shuffle_numbers([1, 2, 3, 4, 5], 42)))
+    assert capsys.readouterr().out.splitlines()[-1] == expected
@@ -0,0 +1,78 @@
+import random
+from collections import Counter
+
+import pytest
+
+from lab_2_2 import heavy_hitters, heavy_hitters_file, majority_element, majority_element_file
+
+np = pytest.importorskip("numpy")
+
+
+def expected_heavy(values, k):
+    # Эталон: точные частоты Counter и строгий порог n / k
+    return {value: count for value, count in Counter(values).items() if count > len(values) / k}
+
+
+def boundary_stream(n, k, seed=0):
+    # Одно значение ровно n / k раз (не проходит), другое n / k + 1 раз (проходит)
+    rng = random.Random(seed)
+    share = n // k
+    values = [1] * share + [2] * (share + 1)
+    values += [rng.randint(100, 10**6) for _ in range(n - len(values))]
+    rng.shuffle(values)
+    return values
+
+
+@pytest.mark.parametrize("k", [2, 3, 4, 10])
+def test_heavy_hitters_boundary(k):
+    values = boundary_stream(1000, k, seed=k)
+    expected = expected_heavy(values, k)
+    assert 1 not in expected and 2 in expected
+    assert heavy_hitters(values, k) == expected
+    assert heavy_hitters(np.array(values), k) == expected
+
+
+def test_heavy_hitters_random_streams():
+    rng = random.Random(1)
+    for _ in range(50):
+        values = [
+            rng.choice([0, 1, 2]) if rng.random() < 0.6 else rng.randint(3, 50) for _ in range(rng.randint(1, 300))
+        ]
+        for k in (2, 3, 5):
+            assert heavy_hitters(values, k) == expected_heavy(values, k)
+            assert heavy_hitters(np.array(values), k) == expected_heavy(values, k)
+
+
+def test_heavy_hitters_invalid_k():
+    with pytest.raises(ValueError):
+        heavy_hitters([1, 2], k=1)
+
+
+@pytest.mark.parametrize("k", [2, 3, 7])
+def test_heavy_hitters_file_matches_counter(tmp_path, k):
+    values = boundary_stream(5000, k, seed=k)
+    path = tmp_path / "values.bin"
+    np.array(values, dtype=np.int64).tofile(path)
+    # Маленькие шарды: частое значение может быть частым не в каждом шарде
+    assert heavy_hitters_file(str(path), k=k, processes=2, shard_size=700) == expected_heavy(values, k)
+
+
+def test_majority_element_file(tmp_path):
+    path = tmp_path / "values.bin"
+    np.array([5, 1, 5, 2, 5, 5, 3], dtype=np.int32).tofile(path)
+    assert majority_element_file(str(path), dtype="int32", processes=1) == 5
+    # Ровно половина - не большинство
+    np.array([5, 1, 5, 2], dtype=np.int32).tofile(path)
+    assert majority_element_file(str(path), dtype="int32", processes=1) is None
+
+
+def test_majority_element_array_matches_list():
+    rng = random.Random(2)
+    for _ in range(100):
+        values = [rng.randint(0, 3) for _ in range(rng.randint(1, 40))]
+        expected = expected_heavy(values, 2)
+        result = majority_element(np.array(values), verify=True)
+        assert result == (next(iter(expected)) if expected else None)
+        assert majority_element(values, verify=True) == result
+    assert majority_element(np.array([], dtype=np.int64)) is None
+    assert isinstance(majority_element(np.array([2, 2, 1])), int)
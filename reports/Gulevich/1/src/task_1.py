@@ -1,3 +1,15 @@
+import heapq
+import math
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy необязателен, без него работает чистый Python
+    np = None
+
+
 def find_median(numbers):
     numbers.sort()  # Сортируем список чисел
     n = len(numbers)
@@ -8,5 +20,191 @@ def find_median(numbers):
     return (mid1 + mid2) / 2  # Возвращаем среднее двух средних элементов
 
 
-sequence = list(map(int, input("Введите последовательность чисел через пробел: ").split()))
-print("Медиана:", find_median(sequence))
+def _quickselect(values, k):
+    # Быстрый выбор k-й порядковой статистики без изменения исходных данных.
+    # Как в introselect: при слишком глубокой рекурсии переходим на сортировку.
+    depth = 2 * len(values).bit_length()
+    while len(values) > 32 and depth > 0:
+        depth -= 1
+        pivot = sorted(random.sample(values, 3))[1]
+        lows = [x for x in values if x < pivot]
+        if k < len(lows):
+            values = lows
+            continue
+        highs = [x for x in values if x > pivot]
+        equal = len(values) - len(lows) - len(highs)
+        if k < len(lows) + equal:
+            return pivot
+        k -= len(lows) + equal
+        values = highs
+    return sorted(values)[k]
+
+
+def select_median(numbers):
+    # Точная медиана за O(n) без сортировки и без изменения входных данных
+    n = len(numbers)
+    if n == 0:
+        raise IndexError("Медиана пустой последовательности не определена")
+
+    if np is not None:
+        array = np.asarray(numbers)
+        if array.dtype.kind in "iuf":
+            if n % 2 == 1:
+                return np.partition(array, n // 2)[n // 2].item()
+            part = np.partition(array, [n // 2 - 1, n // 2])
+            return (part[n // 2 - 1].item() + part[n // 2].item()) / 2
+
+    values = list(numbers)
+    upper = _quickselect(values, n // 2)
+    if n % 2 == 1:
+        return upper
+    # Нижний средний элемент - максимум среди меньших, если таких ровно n // 2
+    smaller = [x for x in values if x < upper]
+    lower = max(smaller) if len(smaller) == n // 2 else upper
+    return (lower + upper) / 2
+
+
+class RunningMedian:
+    # Точная текущая медиана потока на двух кучах
+    def __init__(self, numbers=()):
+        self._low = []  # max-куча (хранятся числа со знаком минус)
+        self._high = []  # min-куча
+        for x in numbers:
+            self.add(x)
+
+    def add(self, x):
+        if self._low and x > -self._low[0]:
+            heapq.heappush(self._high, x)
+        else:
+            heapq.heappush(self._low, -x)
+        # Балансируем: в нижней половине столько же элементов или на один больше
+        if len(self._low) > len(self._high) + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+        elif len(self._high) > len(self._low):
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+
+    def __len__(self):
+        return len(self._low) + len(self._high)
+
+    def median(self):
+        if not self._low:
+            raise IndexError("Медиана пустой последовательности не определена")
+        if len(self._low) > len(self._high):
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+
+class QuantileSketch:
+    # Приближённые квантили с ограниченной памятью (упрощённый t-digest).
+    # compression задаёт точность: после compress() центроидов не больше compression.
+    # Размер центроида ограничен шкалой k(q) = compression / (2 pi) * asin(2q - 1):
+    # центроид занимает не больше единицы шкалы, поэтому к краям (q около 0 и 1) они мельче.
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._centroids = []  # пары [среднее, вес], упорядоченные по среднему
+        self._buffer = []
+        self._buffer_limit = 10 * compression
+
+    def add(self, x, weight=1):
+        self._buffer.append((x, weight))
+        self.count += weight
+        self.min = x if self.min is None else min(self.min, x)
+        self.max = x if self.max is None else max(self.max, x)
+        if len(self._buffer) >= self._buffer_limit:
+            self.compress()
+
+    def update(self, numbers):
+        for x in numbers:
+            self.add(x)
+
+    def merge(self, other):
+        # Объединение скетчей, посчитанных по разным частям данных
+        if other.count == 0:
+            return self
+        # Сначала снимок центроидов: при other is self compress() заменяет self._buffer
+        centroids = other.compress()
+        self._buffer.extend(centroids)
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.compress()
+        return self
+
+    def _scale(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * min(q, 1.0) - 1)
+
+    def compress(self):
+        # Вливает буфер в центроиды и возвращает их списком пар (среднее, вес)
+        if self._buffer:
+            items = sorted(self._centroids + [list(item) for item in self._buffer])
+            self._buffer = []
+            merged = [items[0]]
+            total = self.count
+            passed = 0.0
+            k_left = self._scale(0.0)
+            for mean, weight in items[1:]:
+                last = merged[-1]
+                if self._scale((passed + last[1] + weight) / total) - k_left <= 1:
+                    last[0] += (mean - last[0]) * weight / (last[1] + weight)
+                    last[1] += weight
+                else:
+                    passed += last[1]
+                    k_left = self._scale(passed / total)
+                    merged.append([mean, weight])
+            self._centroids = merged
+        return [tuple(centroid) for centroid in self._centroids]
+
+    def quantile(self, q):
+        self.compress()
+        if not self._centroids:
+            raise IndexError("Квантиль пустой последовательности не определена")
+        if not 0 <= q <= 1:
+            raise ValueError("Уровень квантили должен лежать в [0, 1]")
+
+        target = q * self.count
+        # Центр каждого центроида - середина занимаемого им отрезка рангов
+        points = [(0.0, self.min)]
+        passed = 0.0
+        for mean, weight in self._centroids:
+            points.append((passed + weight / 2, mean))
+            passed += weight
+        points.append((float(self.count), self.max))
+
+        for (rank1, value1), (rank2, value2) in zip(points, points[1:]):
+            if target <= rank2:
+                if rank2 == rank1:
+                    return value2
+                return value1 + (value2 - value1) * (target - rank1) / (rank2 - rank1)
+        return self.max
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+def benchmark(size=10**7):
+    if np is None:
+        numbers = [random.random() for _ in range(size)]
+        array = numbers
+    else:
+        array = np.random.default_rng(0).random(size)
+        numbers = array.tolist()
+
+    start = time.perf_counter()
+    expected = find_median(list(numbers))
+    print(f"find_median (сортировка): {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    result = select_median(array)
+    print(f"select_median (выбор):    {time.perf_counter() - start:.3f} с")
+    assert result == expected
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        sequence = list(map(int, input("Введите последовательность чисел через пробел: ").split()))
+        print("Медиана:", find_median(sequence))
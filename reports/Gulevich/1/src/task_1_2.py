@@ -1,13 +1,221 @@
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy необязателен, без него работает чистый Python
+    np = None
+
+DIGIT_DTYPE = "int8"
+
+
+def _is_array(digits):
+    return np is not None and isinstance(digits, np.ndarray)
+
+
+def to_digit_array(number):
+    # Число (int, строка цифр или список цифр) -> массив int8 цифр
+    if isinstance(number, int):
+        number = str(number)
+    if isinstance(number, str):
+        return (np.frombuffer(number.encode("ascii"), dtype=np.uint8) - ord("0")).astype(DIGIT_DTYPE)
+    return np.asarray(number, dtype=DIGIT_DTYPE)
+
+
+def _last_not(digits, end, value):
+    # Индекс последней цифры в digits[:end], не равной value, или -1.
+    # Хвост просматривается блоками удвоенной длины, поэтому время пропорционально длине серии.
+    block = 64
+    while True:
+        start = max(end - block, 0)
+        found = np.flatnonzero(digits[start:end] != value)
+        if found.size:
+            return start + int(found[-1])
+        if start == 0:
+            return -1
+        block *= 2
+
+
+def _increment_prefix(digits, end):
+    # Прибавляет 1 к числу, записанному цифрами digits[:end], на месте
+    if _is_array(digits):
+        pos = _last_not(digits, end, 9)
+        digits[pos + 1 : end] = 0
+        if pos >= 0:
+            digits[pos] += 1
+            return digits
+        # Все цифры были 9: массив приходится расширить на одну цифру
+        return np.concatenate((np.ones(1, dtype=digits.dtype), digits))
+    for i in range(end - 1, -1, -1):
+        if digits[i] < 9:
+            digits[i] += 1
+            return digits
+        digits[i] = 0
+    # Все цифры были 9: вместо копии [1] + digit_list меняем список на месте
+    if end:
+        digits[0] = 1
+        digits.insert(end, 0)
+    else:
+        digits.insert(0, 1)
+    return digits
+
+
+def _decrement_prefix(digits, end):
+    # Вычитает 1 из числа digits[:end] на месте; число должно быть положительным
+    if _is_array(digits):
+        pos = _last_not(digits, end, 0)
+        digits[pos + 1 : end] = 9
+        digits[pos] -= 1
+        return digits
+    i = end - 1
+    while digits[i] == 0:
+        digits[i] = 9
+        i -= 1
+    digits[i] -= 1
+    return digits
+
+
 def plus_one(digit_list):
-    n = len(digit_list)
-    for i in range(n - 1, -1, -1):
-        if digit_list[i] < 9:
-            digit_list[i] += 1
-            return digit_list
-        digit_list[i] = 0
-    return [1] + digit_list  # Если все цифры были 9, добавляем 1 в начало
-
-
-# Пример использования
-example_digit_list = list(map(int, input("Введите цифры числа через пробел: ").split()))
-print("Результат:", plus_one(example_digit_list))
+    # Для списка цифр и для массива numpy; список изменяется на месте,
+    # массив тоже, кроме случая, когда все цифры равны 9
+    if _is_array(digit_list) and digit_list.size and digit_list[-1] < 9:
+        digit_list[-1] += 1  # самый частый случай - без поиска серии девяток
+        return digit_list
+    return _increment_prefix(digit_list, len(digit_list))
+
+
+def _carry_in(generate, propagate):
+    # Векторный перенос: в разряд i перенос приходит, если ближайший справа разряд,
+    # не пропускающий перенос (propagate), его порождает (generate).
+    # Возвращает переносы в каждый разряд и перенос из старшего разряда.
+    size = generate.shape[-1]
+    index = np.where(propagate, size, np.arange(size))
+    nearest = np.minimum.accumulate(index[..., ::-1], axis=-1)[..., ::-1]
+    source = np.concatenate((nearest[..., 1:], np.full(nearest.shape[:-1] + (1,), size)), axis=-1)
+    padded = np.concatenate((generate, np.zeros(generate.shape[:-1] + (1,), dtype=bool)), axis=-1)
+    return np.take_along_axis(padded, source, axis=-1), np.take_along_axis(padded, nearest[..., :1], axis=-1)[..., 0]
+
+
+def _compare(digits, other):
+    # Сравнение двух чисел без ведущих нулей: -1, 0 или 1
+    if len(digits) != len(other):
+        return -1 if len(digits) < len(other) else 1
+    if _is_array(digits):
+        differ = np.flatnonzero(digits != other)
+        if not differ.size:
+            return 0
+        return -1 if digits[differ[0]] < other[differ[0]] else 1
+    return (list(digits) > list(other)) - (list(digits) < list(other))
+
+
+def _strip_zeros(digits):
+    if len(digits) == 0 or digits[0] != 0:
+        return digits
+    if _is_array(digits):
+        nonzero = np.flatnonzero(digits)
+        return digits[nonzero[0] :] if nonzero.size else digits[-1:]  # срез - представление, без копии
+    count = 0
+    while count < len(digits) - 1 and digits[count] == 0:
+        count += 1
+    del digits[:count]
+    return digits
+
+
+def add_number(digits, value):
+    # Прибавляет к числу из цифр произвольное целое value (int или последовательность цифр).
+    # Меняются только младшие разряды длины value и цепочка переноса.
+    # Отрицательное value вычитается; результат меньше нуля - ValueError.
+    negative = isinstance(value, int) and value < 0
+    if isinstance(value, int):
+        value = str(abs(value))
+    addend = to_digit_array(value) if _is_array(digits) else [int(d) for d in value]
+    if negative:
+        if _compare(digits, addend) < 0:
+            raise ValueError("Результат не может быть отрицательным")
+    elif len(addend) > len(digits):
+        zeros = [0] * (len(addend) - len(digits))
+        digits = (
+            np.concatenate((np.zeros(len(zeros), dtype=digits.dtype), digits)) if _is_array(digits) else zeros + digits
+        )
+    start = len(digits) - len(addend)
+    if _is_array(digits):
+        tail = digits[start:].astype(np.int16)
+        if negative:
+            tail -= addend
+            borrow, carry = _carry_in(tail < 0, tail == 0)
+            digits[start:] = (tail - borrow) % 10
+        else:
+            tail += addend
+            carry_in, carry = _carry_in(tail >= 10, tail == 9)
+            digits[start:] = (tail + carry_in) % 10
+        carry = bool(carry)
+    else:
+        carry = 0
+        for i in range(len(addend) - 1, -1, -1):
+            total = digits[start + i] + (-addend[i] - carry if negative else addend[i] + carry)
+            carry = total < 0 if negative else total >= 10
+            digits[start + i] = total % 10
+    if carry:
+        digits = _decrement_prefix(digits, start) if negative else _increment_prefix(digits, start)
+    return _strip_zeros(digits) if negative else digits
+
+
+def add_batch(numbers, amounts=1):
+    # Прибавляет amounts (число или массив int64) сразу ко многим числам.
+    # numbers - матрица цифр (строка - число, выровненное вправо ведущими нулями).
+    # Возвращает новую матрицу; если какое-то число удлинилось, добавляется старший столбец.
+    # Числа больше int64 не переполняются молча: для них ValueError, их прибавляет add_number.
+    numbers = np.asarray(numbers, dtype=DIGIT_DTYPE)
+    amounts = np.asarray(amounts)
+    if amounts.dtype.kind not in "iub" or (amounts.dtype.kind == "u" and np.any(amounts > np.iinfo(np.int64).max)):
+        raise ValueError("Прибавляемые числа должны помещаться в int64, большие прибавляйте через add_number")
+    amounts = np.broadcast_to(amounts.astype(np.int64), numbers.shape[:1])
+    if np.any(amounts < 0):
+        raise ValueError("Прибавляемые числа должны быть неотрицательными")
+    amount_width = len(str(int(amounts.max(initial=0))))
+    width = max(numbers.shape[1], amount_width)
+    # Степени десяти только для разрядов amounts: 10**19 и выше в int64 уже не помещаются
+    powers = 10 ** np.arange(amount_width - 1, -1, -1, dtype=np.int64)
+    totals = np.zeros((len(numbers), width), dtype=np.int16)
+    totals[:, width - amount_width :] = amounts[:, None] // powers % 10
+    totals[:, width - numbers.shape[1] :] += numbers
+    carry_in, carry = _carry_in(totals >= 10, totals == 9)
+    result = ((totals + carry_in) % 10).astype(DIGIT_DTYPE)
+    if carry.any():
+        result = np.concatenate((carry[:, None].astype(DIGIT_DTYPE), result), axis=1)
+    return result
+
+
+def benchmark(num_digits=10**6, repeat=1000):
+    digits = [9] * num_digits
+    start = time.perf_counter()
+    _ = [1] + digits
+    print(f"копия [1] + list, {num_digits} цифр: {time.perf_counter() - start:.5f} с")
+    if np is None:
+        return
+    counter = to_digit_array("1" + "0" * (num_digits - 1))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        counter = plus_one(counter)
+    print(f"plus_one(int8-массив) x{repeat}: {time.perf_counter() - start:.5f} с")
+    counter[1:] = 9
+    start = time.perf_counter()
+    counter = plus_one(counter)
+    print(f"plus_one с переносом через {num_digits - 1} девяток: {time.perf_counter() - start:.5f} с")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        counter = add_number(counter, 987654321)
+    print(f"add_number(987654321) x{repeat}: {time.perf_counter() - start:.5f} с")
+    batch = np.full((100000, 20), 9, dtype=DIGIT_DTYPE)
+    start = time.perf_counter()
+    add_batch(batch, np.arange(100000))
+    print(f"add_batch 100000 x 20 цифр: {time.perf_counter() - start:.5f} с")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        # Пример использования
+        example_digit_list = list(map(int, input("Введите цифры числа через пробел: ").split()))
+        print("Результат:", plus_one(example_digit_list))
@@ -0,0 +1,48 @@
+import random
+import statistics
+
+import pytest
+
+import task_1
+from task_1 import RunningMedian, select_median
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(task_1, "np", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("backend")
+@pytest.mark.parametrize("size", [1, 2, 3, 10, 33, 34, 1000, 1001])
+def test_select_median_matches_statistics(size):
+    rng = random.Random(size)
+    for numbers in (
+        [rng.randint(-50, 50) for _ in range(size)],
+        [rng.uniform(-1, 1) for _ in range(size)],
+        [7] * size,
+    ):
+        original = list(numbers)
+        assert select_median(numbers) == statistics.median(numbers)
+        assert numbers == original
+
+
+def test_select_median_empty():
+    with pytest.raises(IndexError):
+        select_median([])
+
+
+def test_running_median_matches_statistics():
+    rng = random.Random(3)
+    stream = [rng.randint(0, 20) for _ in range(500)] + [rng.uniform(-100, 100) for _ in range(500)]
+    running = RunningMedian()
+    for i, x in enumerate(stream, 1):
+        running.add(x)
+        assert len(running) == i
+        assert running.median() == statistics.median(stream[:i])
+    assert RunningMedian(stream).median() == statistics.median(stream)
+    with pytest.raises(IndexError):
+        RunningMedian().median()
@@ -0,0 +1,67 @@
+import bisect
+import random
+
+import pytest
+
+from task_1 import QuantileSketch, find_median
+
+
+def rank_error(sorted_data, value, q):
+    return abs(bisect.bisect_left(sorted_data, value) / len(sorted_data) - q)
+
+
+@pytest.mark.parametrize("compression", [20, 100, 300])
+def test_centroid_count_bounded_by_compression(compression):
+    rng = random.Random(compression)
+    sketch = QuantileSketch(compression)
+    sketch.update(rng.gauss(0, 1) for _ in range(100_000))
+    centroids = sketch.compress()
+    assert len(centroids) <= compression
+    assert sum(weight for _, weight in centroids) == 100_000
+
+
+def test_quantiles_match_sorted_data():
+    rng = random.Random(0)
+    data = [rng.expovariate(1.0) for _ in range(200_000)]
+    sketch = QuantileSketch(100)
+    sketch.update(data)
+    data.sort()
+    for q in (0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999):
+        assert rank_error(data, sketch.quantile(q), q) < 0.005
+    assert sketch.quantile(0) == data[0]
+    assert sketch.quantile(1) == data[-1]
+
+
+def test_merge_matches_single_sketch():
+    rng = random.Random(1)
+    data = [rng.uniform(-5, 5) for _ in range(60_000)]
+    parts = [QuantileSketch(100) for _ in range(3)]
+    for i, part in enumerate(parts):
+        part.update(data[i::3])
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    assert merged.count == len(data)
+    assert len(merged.compress()) <= 100
+    assert rank_error(sorted(data), merged.median(), 0.5) < 0.005
+
+
+def test_small_and_empty_input():
+    sketch = QuantileSketch()
+    with pytest.raises(IndexError):
+        sketch.median()
+    sketch.update([5, 1, 3, 2, 4])
+    assert sketch.median() == find_median([5, 1, 3, 2, 4])
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+def test_merge_with_itself_doubles_weights():
+    rng = random.Random(2)
+    data = [rng.gauss(0, 1) for _ in range(5_500)]
+    sketch = QuantileSketch(100)
+    # 500 значений остаются в буфере и не должны потеряться при слиянии
+    sketch.update(data)
+    sketch.merge(sketch)
+    assert sketch.count == 2 * len(data)
+    assert sum(weight for _, weight in sketch.compress()) == 2 * len(data)
+    assert rank_error(sorted(data), sketch.median(), 0.5) < 0.005
+    assert rank_error(sorted(data), sketch.quantile(0.9), 0.9) < 0.005
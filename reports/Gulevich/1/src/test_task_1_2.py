@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from task_1_2 import add_batch, add_number, plus_one, to_digit_array
+
+np = pytest.importorskip("numpy")
+
+
+def as_int(digits):
+    return int("".join(str(int(d)) for d in digits))
+
+
+def digits_of(number):
+    return [int(d) for d in str(number)]
+
+
+@pytest.mark.parametrize("number", [0, 1, 8, 9, 99, 109, 1999, 10**30 - 1, 123456789012345678901234567890])
+def test_plus_one_matches_int(number):
+    # Список меняется на месте, массив - тоже, кроме случая из одних девяток
+    assert as_int(plus_one(digits_of(number))) == number + 1
+    assert as_int(plus_one(to_digit_array(number))) == number + 1
+
+
+def test_add_number_matches_int():
+    rng = random.Random(0)
+    for _ in range(300):
+        number = rng.choice([rng.randrange(10**30), 10 ** rng.randrange(1, 30) - 1])
+        value = rng.choice([rng.randrange(10**35), -rng.randrange(number + 1), 10 ** rng.randrange(40)])
+        expected = number + value
+        assert as_int(add_number(digits_of(number), value)) == expected
+        assert as_int(add_number(to_digit_array(number), value)) == expected
+
+
+def test_add_number_digit_sequences():
+    # value можно передать строкой цифр или списком цифр
+    assert as_int(add_number(digits_of(999), "1")) == 1000
+    assert as_int(add_number(to_digit_array(999), [2, 5])) == 1024
+
+
+def test_add_number_negative_result():
+    with pytest.raises(ValueError):
+        add_number(digits_of(5), -6)
+    with pytest.raises(ValueError):
+        add_number(to_digit_array(5), -6)
+
+
+def test_add_batch_matches_int():
+    rng = random.Random(1)
+    values = [rng.randrange(10**25) for _ in range(50)] + [10**25 - 1, 0]
+    amounts = [rng.randrange(2**63) for _ in range(len(values) - 1)] + [2**63 - 1]
+    matrix = np.array([[int(d) for d in str(value).zfill(25)] for value in values])
+    result = add_batch(matrix, amounts)
+    assert [as_int(row) for row in result] == [value + amount for value, amount in zip(values, amounts)]
+
+
+def test_add_batch_rejects_amounts_beyond_int64():
+    matrix = np.zeros((1, 3), dtype=np.int8)
+    with pytest.raises(ValueError):
+        add_batch(matrix, [2**63])
+    with pytest.raises(ValueError):
+        add_batch(matrix, np.array([2**64 - 1], dtype=np.uint64))
@@ -55,6 +55,130 @@ class LimitedCharSet:
         return self.capacity
 
 
+class _FilterTable(dict):
+    # Таблица для str.translate: члены множества отображаются сами в себя, остальные символы удаляются.
+    # Отсутствующий символ запоминается в таблице, поэтому __missing__ вызывается один раз на символ.
+    def __missing__(self, code):
+        self[code] = None
+
+
+class LimitedCharBitSet:
+    # То же ограниченное множество символов, но в виде битовой маски (целое число):
+    # бит i соответствует символу chr(first + i). Для ASCII (по умолчанию) это 128-битное число,
+    # объединение, пересечение и сравнение - одна операция над числом.
+    def __init__(self, capacity, initial_elements=None, first=0, last=128):
+        if not 0 <= first < last:
+            raise ValueError("Некорректный диапазон символов")
+        self.capacity = capacity
+        self.first = first
+        self.last = last
+        self.bits = 0
+        self._table = None
+        if initial_elements:
+            for elem in initial_elements:
+                self.add(elem)
+
+    def _index(self, char):
+        if not isinstance(char, str) or len(char) != 1 or not self.first <= ord(char) < self.last:
+            return None
+        return ord(char) - self.first
+
+    def add(self, char):
+        index = self._index(char)
+        if index is None:
+            print(f"'{char}' не является символом из диапазона множества.")
+        elif self.bits >> index & 1:
+            print(f"'{char}' уже есть в множестве.")
+        elif self.size >= self.capacity:
+            print(f"Невозможно добавить '{char}': превышена мощность множества.")
+        else:
+            self.bits |= 1 << index
+            self._table = None
+
+    def remove(self, char):
+        index = self._index(char)
+        if index is not None and self.bits >> index & 1:
+            self.bits &= ~(1 << index)
+            self._table = None
+        else:
+            print(f"'{char}' нет в множестве.")
+
+    def contains(self, char):
+        index = self._index(char)
+        return index is not None and bool(self.bits >> index & 1)
+
+    def __contains__(self, char):
+        return self.contains(char)
+
+    def __str__(self):
+        return "{" + ", ".join(self.get_elements()) + "}"
+
+    @staticmethod
+    def _aligned_bits(other, first, last):
+        # Маска множества other, пересчитанная на диапазон [first, last)
+        shift = other.first - first
+        bits = other.bits << shift if shift >= 0 else other.bits >> -shift
+        return bits & ((1 << (last - first)) - 1)
+
+    def __eq__(self, other):
+        if not isinstance(other, LimitedCharBitSet):
+            return False
+        if (self.first, self.last) == (other.first, other.last):
+            return self.bits == other.bits
+        return self.get_elements() == other.get_elements()
+
+    def _check_other(self, other):
+        if not isinstance(other, LimitedCharBitSet):
+            raise TypeError("Операция возможна только с объектом LimitedCharBitSet")
+
+    def union(self, other):
+        self._check_other(other)
+        first, last = min(self.first, other.first), max(self.last, other.last)
+        new_set = LimitedCharBitSet(max(self.capacity, other.capacity), first=first, last=last)
+        new_set.bits = self._aligned_bits(self, first, last)
+        bits = new_set.bits | self._aligned_bits(other, first, last)
+        if bits.bit_count() <= new_set.capacity:
+            new_set.bits = bits
+        else:
+            for char in other.get_elements():
+                new_set.add(char)
+        return new_set
+
+    def intersection(self, other):
+        self._check_other(other)
+        new_set = LimitedCharBitSet(self.capacity, first=self.first, last=self.last)
+        new_set.bits = self.bits & self._aligned_bits(other, self.first, self.last)
+        return new_set
+
+    def get_elements(self):
+        elements = []
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            elements.append(chr(self.first + low.bit_length() - 1))
+            bits ^= low
+        return elements
+
+    def filter_text(self, text):
+        # Оставляет в строке только символы множества (str.translate по кэшированной таблице)
+        if self._table is None:
+            self._table = _FilterTable((ord(char), ord(char)) for char in self.get_elements())
+        return text.translate(self._table)
+
+    def filter_stream(self, chunks):
+        # Фильтрует поток строк (например, файл, читаемый блоками) без склейки в одну строку
+        for chunk in chunks:
+            yield self.filter_text(chunk)
+
+    @property
+    def size(self):
+        return self.bits.bit_count()
+
+    @property
+    def max_size(self):
+        return self.capacity
+
+
 def display_menu():
     print("\nМеню:")
     print("1. Добавить символ")
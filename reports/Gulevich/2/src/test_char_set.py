@@ -0,0 +1,64 @@
+import importlib.util
+import os
+
+import pytest
+
+_SPEC = importlib.util.spec_from_file_location("lab2_1", os.path.join(os.path.dirname(__file__), "lab2.1.py"))
+lab2_1 = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(lab2_1)
+
+
+@pytest.mark.parametrize(
+    "capacity,first_chars,second_chars",
+    [
+        (10, "abcxyz", "bzq"),
+        (3, "abcdef", "fed"),
+        (5, "", "abc"),
+        (20, "Hello, World!", "lo W"),
+    ],
+)
+def test_bit_set_matches_char_set(capacity, first_chars, second_chars):
+    first = lab2_1.LimitedCharSet(capacity, first_chars)
+    second = lab2_1.LimitedCharSet(capacity, second_chars)
+    first_bits = lab2_1.LimitedCharBitSet(capacity, first_chars)
+    second_bits = lab2_1.LimitedCharBitSet(capacity, second_chars)
+    assert sorted(first_bits.get_elements()) == sorted(first.get_elements())
+    assert first_bits.size == first.size
+    assert sorted(first_bits.union(second_bits).get_elements()) == sorted(first.union(second).get_elements())
+    assert (first_bits == second_bits) == (first == second)
+
+
+def test_capacity_limit(capsys):
+    # Как и LimitedCharSet, множество не бросает исключений, а печатает сообщение
+    chars = lab2_1.LimitedCharBitSet(2, "abc")
+    assert chars.get_elements() == ["a", "b"]
+    assert "превышена мощность" in capsys.readouterr().out
+    chars.add("ab")
+    chars.remove("z")
+    output = capsys.readouterr().out
+    assert "не является символом" in output and "нет в множестве" in output
+    assert chars.get_elements() == ["a", "b"]
+
+
+def test_union_over_capacity():
+    first = lab2_1.LimitedCharBitSet(3, "abc")
+    second = lab2_1.LimitedCharBitSet(2, "de")
+    union = first.union(second)
+    assert union.size == 3
+    assert sorted(union.get_elements()) == sorted(first.union(first).get_elements())
+
+
+def test_different_ranges():
+    latin = lab2_1.LimitedCharBitSet(26, "abc", first=ord("a"), last=ord("z") + 1)
+    ascii_set = lab2_1.LimitedCharBitSet(26, "bcd")
+    assert latin.intersection(ascii_set).get_elements() == ["b", "c"]
+    assert ascii_set.intersection(latin).get_elements() == ["b", "c"]
+    assert latin.union(ascii_set).get_elements() == ["a", "b", "c", "d"]
+    assert latin == lab2_1.LimitedCharBitSet(3, "cba")
+
+
+def test_filter_text_and_stream():
+    chars = lab2_1.LimitedCharBitSet(10, "ab ")
+    assert chars.filter_text("a cab, bad!") == "a ab ba"
+    chars.remove(" ")
+    assert "".join(chars.filter_stream(["a cab", ", bad!"])) == "aabba"
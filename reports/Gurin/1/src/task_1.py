@@ -1,13 +1,271 @@
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CONTAINER_BITS: int = 1 << 16
+ARRAY_CONTAINER_LIMIT: int = 4096
+DENSE_CHUNK: int = 1 << 20
+MAX_VALUE: int = 2**63
+# Measured memory: a container with its dict entry and key costs about 200 bytes on top of its data,
+# a set of ints about 40-75 bytes per value (slot plus int object)
+CONTAINER_BYTES: int = 200
+SET_ENTRY_BYTES: int = 40
+ARRAY_HEADER_BYTES: int = 0 if np is None else sys.getsizeof(np.empty(0, dtype=np.uint8))
+
+
 def find_unique_numbers(numbers_list: list):
     if not isinstance(numbers_list, list):
         raise TypeError("Input must be a list.")
 
-    for num in numbers_list:
-        if not isinstance(num, int):
+    # Check each distinct element type once instead of every element
+    for kind in set(map(type, numbers_list)):
+        if not issubclass(kind, int):
             raise TypeError("All elements in the list must be integers.")
     return set(numbers_list)
 
 
+def _to_bitmap(lows):
+    mask = np.zeros(CONTAINER_BITS, dtype=bool)
+    mask[lows] = True
+    return np.packbits(mask, bitorder="little").view("<u8")
+
+
+def _to_array(words):
+    return np.flatnonzero(np.unpackbits(words.view(np.uint8), bitorder="little")).astype(np.uint16)
+
+
+def _is_bitmap(container) -> bool:
+    return container.dtype.itemsize == 8
+
+
+def _cardinality(container) -> int:
+    if _is_bitmap(container):
+        return int(np.unpackbits(container.view(np.uint8)).sum(dtype=np.int64))
+    return len(container)
+
+
+def _make_container(lows):
+    # Sorted unique low 16 bits: a small sorted array or a 2**16-bit bitmap, whichever is smaller
+    return _to_bitmap(lows) if len(lows) > ARRAY_CONTAINER_LIMIT else lows
+
+
+def _union(first, second):
+    if not _is_bitmap(first) and not _is_bitmap(second):
+        return _make_container(np.union1d(first, second))
+    first = first if _is_bitmap(first) else _to_bitmap(first)
+    second = second if _is_bitmap(second) else _to_bitmap(second)
+    return np.bitwise_or(first, second)
+
+
+def _intersection(first, second):
+    if not _is_bitmap(first) and not _is_bitmap(second):
+        result = np.intersect1d(first, second, assume_unique=True)
+    elif _is_bitmap(first) and _is_bitmap(second):
+        words = np.bitwise_and(first, second)
+        if _cardinality(words) > ARRAY_CONTAINER_LIMIT:
+            return words
+        result = _to_array(words)
+    else:
+        words, lows = (first, second) if _is_bitmap(first) else (second, first)
+        bits = (words[lows >> 6] >> (lows & 63).astype(np.uint64)) & np.uint64(1)
+        result = lows[bits.astype(bool)]
+    return result if result.size else None
+
+
+def _key_span(values):
+    # First 16-bit key and the number of values the keys from the minimum to the maximum cover
+    first_key = int(values.min()) >> 16
+    return first_key, ((int(values.max()) >> 16) - first_key + 1) * CONTAINER_BITS
+
+
+def _is_dense(span: int, size: int) -> bool:
+    # A 64-bit word bitmap over the span takes span / 8 bytes: at most 2 bytes per value
+    return span <= 16 * size
+
+
+def _sorted_unique(values):
+    unique = np.sort(values)  # sort and drop repeats: np.unique's hash path is several times slower
+    return unique[np.concatenate(([True], unique[1:] != unique[:-1]))]
+
+
+def _fill_sparse(bitmap, unique) -> None:
+    bounds = np.flatnonzero(np.diff(unique >> 16)) + 1
+    for segment in np.split(unique, bounds):
+        bitmap.containers[int(segment[0]) >> 16] = _make_container((segment & 0xFFFF).astype(np.uint16))
+
+
+class RoaringBitmap:
+    def __init__(self) -> None:
+        # High bits of a value -> container with its low 16 bits
+        self.containers: dict = {}
+
+    @classmethod
+    def from_array(cls, values) -> "RoaringBitmap":
+        if np is None:
+            raise ImportError("NumPy is required for RoaringBitmap.")
+        values = np.asarray(values)
+        bitmap = cls()
+        if values.size == 0:
+            return bitmap  # an empty list has no integer dtype, but it is still a valid input
+        if values.dtype.kind not in "iu":
+            raise TypeError("All elements must be integers.")
+        if values.min() < 0 or values.max() >= MAX_VALUE:
+            raise ValueError("Only integers in [0, 2**63) are supported.")
+        values = values.astype(np.int64, copy=False)
+
+        first_key, span = _key_span(values)
+        if _is_dense(span, values.size):
+            # Dense data: set bits in 64-bit words, no sorting needed. The words take span / 8 bytes,
+            # an eighth of a bool mask, and the values are shifted chunk by chunk
+            words = np.zeros(span // 64, dtype="<u8")
+            for start in range(0, values.size, DENSE_CHUNK):
+                offsets = values[start : start + DENSE_CHUNK] - (first_key << 16)
+                np.bitwise_or.at(words, offsets >> 6, np.left_shift(np.uint64(1), (offsets & 63).astype(np.uint64)))
+            rows = words.reshape(-1, CONTAINER_BITS // 64)
+            for index in np.flatnonzero(rows.any(axis=1)).tolist():
+                row = rows[index]
+                container = row.copy() if _cardinality(row) > ARRAY_CONTAINER_LIMIT else _to_array(row)
+                bitmap.containers[first_key + index] = container
+        else:
+            _fill_sparse(bitmap, _sorted_unique(values))
+        return bitmap
+
+    def add(self, value: int) -> None:
+        if not 0 <= value < MAX_VALUE:
+            raise ValueError("Only integers in [0, 2**63) are supported.")
+        key, low = value >> 16, value & 0xFFFF
+        container = self.containers.get(key)
+        if container is None:
+            self.containers[key] = np.array([low], dtype=np.uint16)
+        elif _is_bitmap(container):
+            container[low >> 6] |= np.uint64(1 << (low & 63))
+        elif value not in self:
+            self.containers[key] = _make_container(np.insert(container, np.searchsorted(container, low), low))
+
+    def __contains__(self, value: int) -> bool:
+        container = self.containers.get(value >> 16) if value >= 0 else None
+        if container is None:
+            return False
+        low = value & 0xFFFF
+        if _is_bitmap(container):
+            return bool((int(container[low >> 6]) >> (low & 63)) & 1)
+        position = int(np.searchsorted(container, low))
+        return position < len(container) and container[position] == low
+
+    def __iter__(self):
+        # Values in ascending order, one container at a time
+        for key in sorted(self.containers):
+            container = self.containers[key]
+            lows = _to_array(container) if _is_bitmap(container) else container
+            yield from ((key << 16) + lows.astype(np.int64)).tolist()
+
+    def __len__(self) -> int:
+        return sum(_cardinality(container) for container in self.containers.values())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return self.containers.keys() == other.containers.keys() and all(
+            np.array_equal(container, other.containers[key]) for key, container in self.containers.items()
+        )
+
+    def union(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        result = RoaringBitmap()
+        for key in self.containers.keys() | other.containers.keys():
+            if key not in other.containers:
+                result.containers[key] = self.containers[key].copy()
+            elif key not in self.containers:
+                result.containers[key] = other.containers[key].copy()
+            else:
+                result.containers[key] = _union(self.containers[key], other.containers[key])
+        return result
+
+    def intersection(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        result = RoaringBitmap()
+        for key in self.containers.keys() & other.containers.keys():
+            container = _intersection(self.containers[key], other.containers[key])
+            if container is not None:
+                result.containers[key] = container
+        return result
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        return self.union(other)
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        return self.intersection(other)
+
+    @property
+    def nbytes(self) -> int:
+        # The whole footprint: the dict, the int keys and the array objects, not only the container data
+        return sys.getsizeof(self.containers) + sum(
+            sys.getsizeof(key) + ARRAY_HEADER_BYTES + container.nbytes for key, container in self.containers.items()
+        )
+
+    def to_array(self):
+        parts = []
+        for key in sorted(self.containers):
+            container = self.containers[key]
+            lows = _to_array(container) if _is_bitmap(container) else container
+            parts.append((key << 16) + lows.astype(np.int64))
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def save(self, path: str) -> None:
+        keys = sorted(self.containers)
+        arrays = [self.containers[key] for key in keys if not _is_bitmap(self.containers[key])]
+        bitmaps = [self.containers[key] for key in keys if _is_bitmap(self.containers[key])]
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                keys=np.array(keys, dtype=np.int64),
+                is_bitmap=np.array([_is_bitmap(self.containers[key]) for key in keys], dtype=bool),
+                lengths=np.array([len(container) for container in arrays], dtype=np.int64),
+                arrays=np.concatenate(arrays) if arrays else np.empty(0, dtype=np.uint16),
+                bitmaps=np.stack(bitmaps) if bitmaps else np.empty((0, 1024), dtype="<u8"),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "RoaringBitmap":
+        bitmap = cls()
+        with np.load(path) as data:
+            arrays = np.split(data["arrays"], np.cumsum(data["lengths"])[:-1]) if len(data["lengths"]) else []
+            bitmaps = list(data["bitmaps"])
+            array_index = bitmap_index = 0
+            for key, is_bitmap in zip(data["keys"].tolist(), data["is_bitmap"].tolist()):
+                if is_bitmap:
+                    bitmap.containers[key] = bitmaps[bitmap_index].copy()
+                    bitmap_index += 1
+                else:
+                    bitmap.containers[key] = arrays[array_index].copy()
+                    array_index += 1
+        return bitmap
+
+
+def unique_numbers(values):
+    # A RoaringBitmap for dense IDs, a plain set for sparse or huge-range data: with fewer than
+    # CONTAINER_BYTES / SET_ENTRY_BYTES values per 2**16 block the containers would take more memory than a set
+    if np is None:
+        return find_unique_numbers(list(values))
+    array = np.asarray(values)
+    if array.size == 0 or array.dtype.kind not in "iu":
+        # Empty input, Python ints beyond 64 bits; non-integers raise TypeError there
+        return find_unique_numbers(list(values))
+    if array.min() < 0 or array.max() >= MAX_VALUE:
+        return set(array.tolist())
+    array = array.astype(np.int64, copy=False)
+    if _is_dense(_key_span(array)[1], array.size):
+        return RoaringBitmap.from_array(array)
+    unique = _sorted_unique(array)
+    keys = np.count_nonzero(np.diff(unique >> 16)) + 1
+    if keys * CONTAINER_BYTES > unique.size * SET_ENTRY_BYTES:
+        return set(unique.tolist())
+    bitmap = RoaringBitmap()
+    _fill_sparse(bitmap, unique)
+    return bitmap
+
+
 if __name__ == "__main__":
     amount_of_numbers: int = int(input("Enter amount of numbers: "))
     user_numbers: list = []
@@ -1,5 +1,5 @@
 import pytest
-from task_1 import find_unique_numbers
+from task_1 import RoaringBitmap, find_unique_numbers, unique_numbers
 
 
 def test_trivial_cases():
@@ -26,3 +26,87 @@ def test_list_with_non_numeric_input():
 def test_list_with_mixed_types():
     with pytest.raises(TypeError):
         find_unique_numbers([1, 2.5, 3])
+
+
+def test_roaring_bitmap_dense_and_sparse():
+    np = pytest.importorskip("numpy")
+    for values in ([5, 1, 5, 70000, 3], list(range(0, 200000, 7)), [0, 2**40, 2**40 + 1]):
+        bitmap = RoaringBitmap.from_array(np.array(values))
+        assert len(bitmap) == len(set(values))
+        assert bitmap.to_array().tolist() == sorted(set(values))
+        assert all(value in bitmap for value in values)
+        assert 4 not in bitmap
+
+
+def test_roaring_bitmap_set_algebra():
+    np = pytest.importorskip("numpy")
+    first = list(range(0, 100000, 3))
+    second = list(range(0, 100000, 5)) + [10**9]
+    union = RoaringBitmap.from_array(np.array(first)) | RoaringBitmap.from_array(np.array(second))
+    intersection = RoaringBitmap.from_array(np.array(first)) & RoaringBitmap.from_array(np.array(second))
+    assert union.to_array().tolist() == sorted(set(first) | set(second))
+    assert intersection.to_array().tolist() == sorted(set(first) & set(second))
+
+
+def test_roaring_bitmap_save_load(tmp_path):
+    np = pytest.importorskip("numpy")
+    bitmap = RoaringBitmap.from_array(np.array(list(range(10000)) + [123456789]))
+    bitmap.save(str(tmp_path / "ids.npz"))
+    assert RoaringBitmap.load(str(tmp_path / "ids.npz")) == bitmap
+
+
+def test_roaring_bitmap_invalid_input():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        RoaringBitmap.from_array(np.array([1, -2]))
+    with pytest.raises(TypeError):
+        RoaringBitmap.from_array(np.array([1.5]))
+
+
+def test_unique_numbers_dense_returns_bitmap():
+    np = pytest.importorskip("numpy")
+    for values in (list(range(100000)), np.arange(256, dtype=np.uint8), list(range(0, 10**7, 50))):
+        result = unique_numbers(values)
+        assert isinstance(result, RoaringBitmap)
+        assert list(result) == sorted(set(np.asarray(values).tolist()))
+
+
+def test_unique_numbers_sparse_returns_set():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    spread = rng.integers(0, 2**40, 100000)
+    result = unique_numbers(spread)
+    assert isinstance(result, set) and result == set(spread.tolist())
+    # For these values the bitmap really is larger than the set
+    assert RoaringBitmap.from_array(spread).nbytes > 4 * len(result) * 40
+    assert unique_numbers([1, 2, 2, 10**12]) == {1, 2, 10**12}
+    assert unique_numbers(np.array([3, 3, 1], dtype=np.uint8)) == {1, 3}
+    assert unique_numbers([]) == set()
+    assert unique_numbers([-1, -1, 3]) == {-1, 3}
+    assert unique_numbers([2**70, 5, 5]) == {2**70, 5}
+    with pytest.raises(TypeError):
+        unique_numbers([1.5, 2.0])
+
+
+def test_roaring_bitmap_add_range():
+    pytest.importorskip("numpy")
+    bitmap = RoaringBitmap()
+    bitmap.add(2**63 - 1)
+    bitmap.add(0)
+    assert list(bitmap) == [0, 2**63 - 1]
+    assert bitmap.to_array().tolist() == [0, 2**63 - 1]
+    for value in (2**63, 2**64, -1):
+        with pytest.raises(ValueError):
+            bitmap.add(value)
+    assert len(bitmap) == 2
+
+
+def test_roaring_bitmap_iter_ascending():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(0)
+    # Dense data with bitmap and array containers, then sparse data across many keys
+    for values in (rng.integers(0, 15 * 20000, 20000), rng.integers(0, 2**40, 1000), np.array([70000, 5, 1])):
+        bitmap = RoaringBitmap.from_array(values)
+        assert list(bitmap) == sorted(set(values.tolist()))
+        assert list(bitmap) == bitmap.to_array().tolist()
+    assert not list(RoaringBitmap())
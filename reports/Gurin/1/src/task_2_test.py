@@ -1,5 +1,5 @@
 import pytest
-from task_2 import binary_addition
+from task_2 import batch_binary_op, binary_addition, format_binary, parse_binary_strings
 
 
 def test_trivial_cases():
@@ -30,3 +30,50 @@ def test_empty_input():
 def test_float_input():
     with pytest.raises(TypeError):
         binary_addition(1.5, 2)
+
+
+def test_batch_operations():
+    pytest.importorskip("numpy")
+    left = ["101", "1" * 64, "0", "1" * 70]
+    right = ["11", "1", "0", "1"]
+    numbers = [(int(a, 2), int(b, 2)) for a, b in zip(left, right)]
+    assert format_binary(batch_binary_op(left, right, "add")) == [binary_addition(a, b) for a, b in numbers]
+    assert format_binary(batch_binary_op(left, right, "sub")) == [bin(a - b)[2:] for a, b in numbers]
+    assert format_binary(batch_binary_op(left, right, "xor")) == [bin(a ^ b)[2:] for a, b in numbers]
+
+
+def test_batch_packed_buffers():
+    pytest.importorskip("numpy")
+    packed = parse_binary_strings(["1", "11111111"])
+    assert packed.tobytes() == b"\x01\xff"
+    assert batch_binary_op(packed.tobytes(), b"\x01\x01", "add", width=1).tolist() == [[0, 2], [1, 0]]
+
+
+def test_batch_invalid_input():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        parse_binary_strings(["102"])
+    with pytest.raises(ValueError):
+        batch_binary_op(["1"], ["10"], "sub")
+    with pytest.raises(ValueError):
+        batch_binary_op(["1"], ["1"], "mul")
+
+
+def test_batch_empty():
+    pytest.importorskip("numpy")
+    for operation in ("add", "sub", "xor"):
+        assert batch_binary_op([], [], operation).shape[0] == 0
+    assert not format_binary(batch_binary_op([], [], "add"))
+    assert batch_binary_op(b"", b"", "add", width=2).shape == (0, 2)
+
+
+def test_batch_long_carry_chain():
+    pytest.importorskip("numpy")
+    left = ["1" * 100, "1" + "0" * 99, "1" * 80 + "0" * 20]
+    right = ["1", "1", "1" * 20]
+    assert format_binary(batch_binary_op(left, right, "add")) == [
+        bin(int(a, 2) + int(b, 2))[2:] for a, b in zip(left, right)
+    ]
+    assert format_binary(batch_binary_op(left, right, "sub")) == [
+        bin(int(a, 2) - int(b, 2))[2:] for a, b in zip(left, right)
+    ]
@@ -1,17 +1,153 @@
-def rep(start_val, end_val, step_val):
+import math
+from collections.abc import Sequence
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для Progression.to_numpy
+    np = None
+
+
+class Progression(Sequence):
+    """
+    Ленивая арифметическая прогрессия start, start + step, ... (меньше stop при step > 0).
+    Аналог range для int, float и Decimal: элементы не хранятся, а вычисляются как start + k * step,
+    поэтому память O(1), а len, индексация, срезы и проверка вхождения выполняются за O(1).
+    """
+
+    __slots__ = ("start", "step", "_length")
+
+    def __init__(self, start_val, stop_val, step_val=1):
+        """
+        :param start_val: первый элемент
+        :param stop_val: граница (не входит в прогрессию)
+        :param step_val: шаг, не равный нулю
+        """
+        if step_val == 0:
+            raise ValueError("шаг не может быть равен нулю")
+        self.start = start_val
+        self.step = step_val
+        self._length = self._count(start_val, stop_val, step_val)
+
+    @staticmethod
+    def _count(first, bound, delta):
+        """Количество k >= 0, для которых first + k * delta лежит до bound."""
+        if isinstance(first, int) and isinstance(bound, int) and isinstance(delta, int):
+            return max(0, -((first - bound) // delta))
+        length = max(0, math.ceil((bound - first) / delta))
+        # Поправка на ошибку округления при делении чисел с плавающей точкой
+        while length and (first + (length - 1) * delta - bound) * delta >= 0:
+            length -= 1
+        while (first + length * delta - bound) * delta < 0:
+            length += 1
+        return length
+
+    @classmethod
+    def _from_length(cls, first, delta, length):
+        progression = cls.__new__(cls)
+        progression.start = first
+        progression.step = delta
+        progression._length = length
+        return progression
+
+    @property
+    def stop(self):
+        """Граница, следующая сразу за последним элементом."""
+        return self.start + self._length * self.step
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(self._length)[index]
+            return self._from_length(
+                self.start + positions.start * self.step, positions.step * self.step, len(positions)
+            )
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("индекс прогрессии вне диапазона")
+        return self.start + index * self.step
+
+    def __iter__(self):
+        first, delta = self.start, self.step
+        for k in range(self._length):
+            yield first + k * delta
+
+    def _position(self, value):
+        """Номер элемента, равного value, или None."""
+        try:
+            k = (value - self.start) / self.step
+        except TypeError:
+            return None
+        if isinstance(k, float) and not math.isfinite(k):
+            return None
+        k = round(k)
+        if 0 <= k < self._length and self.start + k * self.step == value:
+            return k
+        return None
+
+    def __contains__(self, value):
+        return self._position(value) is not None
+
+    def index(self, value, start=0, stop=None):
+        k = self._position(value)
+        if k is None or not start <= k < (self._length if stop is None else stop):
+            raise ValueError(f"{value!r} нет в прогрессии")
+        return k
+
+    def count(self, value):
+        return int(value in self)
+
+    def __eq__(self, other):
+        if not isinstance(other, Progression):
+            return NotImplemented
+        if self._length != other._length:
+            return False
+        if self._length == 0:
+            return True
+        return self.start == other.start and (self._length == 1 or self.step == other.step)
+
+    def __hash__(self):
+        return hash((self._length, self.start if self._length else None, self.step if self._length > 1 else None))
+
+    def __repr__(self):
+        return f"Progression({self.start!r}, {self.stop!r}, {self.step!r})"
+
+    def to_numpy(self, dtype=None):
+        """
+        Выгрузка в массив numpy целиком.
+        Целые дают результат как np.arange, дробные - как np.linspace между первым и последним
+        элементом (без накопления ошибки), Decimal приводится к float64.
+        """
+        if np is None:
+            raise ImportError("Для to_numpy необходим numpy")
+        if self._length == 0:
+            return np.empty(0, dtype=dtype or np.float64)
+        if all(isinstance(value, int) for value in (self.start, self.step)):
+            return np.arange(self.start, self.stop, self.step, dtype=dtype)
+        first, last = self.start, self.start + (self._length - 1) * self.step
+        if isinstance(first, Decimal):
+            first, last = float(first), float(last)
+        return np.linspace(first, last, self._length, dtype=dtype or np.float64)
+
+
+def rep(start_val, end_val, step_val, lazy=False):
+    if step_val == 0:
+        raise ValueError("шаг не может быть равен нулю")
+    if step_val < 0:
+        raise ValueError("шаг должен быть положительным")
     if start_val >= end_val:
         raise ValueError("start должен быть меньше end")
 
-    sequence = []
-    current = start_val
-    while current < end_val:
-        sequence.append(current)
-        current += step_val
-
-    return sequence
+    # Элементы считаются как start + k * step, без накопления ошибки: rep(0, 1, 0.1) дает 10 элементов
+    # (0.0 ... 0.9), а не 11, как прежний цикл с current += step, дописывавший 0.9999999999999999
+    sequence = Progression(start_val, end_val, step_val)
+    return sequence if lazy else list(sequence)
 
 
-if __name__ == "__main__":
+def main():
     try:
         start = int(input("Введите начало последовательности (start): "))
         end = int(input("Введите конец последовательности (end): "))
@@ -22,3 +158,7 @@ if __name__ == "__main__":
 
     except ValueError as e:
         print("Ошибка:", e)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,143 @@
-def is_palindrome(input_str: str) -> bool:
-    cleaned = "".join(char.lower() for char in input_str if char.isalnum())
-    return cleaned == cleaned[::-1]
+import mmap
+import os
+
+BLOCK_SIZE = 1 << 16
+
+
+def _normalize(text: str) -> str:
+    """Оставляет только буквы и цифры в нижнем регистре."""
+    cleaned = "".join(filter(str.isalnum, text))
+    if "Σ" in cleaned:
+        # str.lower превращает Σ в конце слова в ς, а посимвольно - всегда в σ
+        return "".join(map(str.lower, cleaned))
+    return cleaned.lower()
+
+
+def _utf8_boundary(data, pos: int, forward: bool) -> int:
+    """Сдвигает позицию к началу символа UTF-8 (пропуская байты продолжения) вперёд или назад."""
+    step = 1 if forward else -1
+    while 0 < pos < len(data) and data[pos] & 0xC0 == 0x80:
+        pos += step
+    return pos
+
+
+def _no_align(_data, pos: int, _forward: bool) -> int:
+    return pos
+
+
+def _scan(data, read, align, block_size: int) -> bool:
+    """
+    Два указателя, идущие навстречу блоками: слева и справа нормализуется не больше
+    одного блока за раз, поэтому память O(block_size) независимо от длины данных.
+    Конец левого блока выравнивается вперёд, начало правого - назад, поэтому каждый
+    блок непустой и указатели всегда сдвигаются.
+    """
+    left, right = 0, len(data)
+    front = back = ""  # ещё не сравнённые символы слева и справа (back - в обратном порядке)
+    while left < right:
+        if not front:
+            end = align(data, min(left + block_size, right), True)
+            front = _normalize(read(data, left, end))
+            left = end
+        elif not back:
+            start = align(data, max(right - block_size, left), False)
+            back = _normalize(read(data, start, right))[::-1]
+            right = start
+        else:
+            common = min(len(front), len(back))
+            if front[:common] != back[:common]:
+                return False
+            front, back = front[common:], back[common:]
+    middle = front + back[::-1]
+    return middle == middle[::-1]
+
+
+def is_palindrome(input_str: str, block_size: int = BLOCK_SIZE) -> bool:
+    if not isinstance(input_str, str):
+        raise TypeError("Входные данные должны быть строкой")
+    if block_size < 1:
+        raise ValueError("Размер блока должен быть не меньше 1")
+    return _scan(input_str, lambda text, start, end: text[start:end], _no_align, block_size)
+
+
+def is_palindrome_file(path, encoding: str = "utf-8", block_size: int = 1 << 20) -> bool:
+    """
+    Проверяет, является ли палиндромом весь текст файла, не загружая его в память:
+    файл отображается через mmap и читается блоками с обоих концов.
+    Для однобайтовых кодировок граница символа совпадает с границей байта, для UTF-8
+    блоки выравниваются по началу символа, поэтому блок не может быть меньше 4 байт
+    (максимальная длина символа UTF-8).
+    """
+    if block_size < 4:
+        raise ValueError("Размер блока должен быть не меньше 4 байт")
+    if os.path.getsize(path) == 0:
+        return True
+    align = _utf8_boundary if encoding.lower().replace("_", "-") in ("utf-8", "utf8") else _no_align
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return _scan(data, lambda buf, start, end: buf[start:end].decode(encoding), align, block_size)
+
+
+def is_palindrome_batch(strings) -> list:
+    """Проверяет сразу много коротких строк, без проверок типа и разбиения на блоки."""
+    normalized = [_normalize(text) for text in strings]
+    return [text == text[::-1] for text in normalized]
+
+
+def palindromic_records(path, encoding: str = "utf-8", batch_size: int = 10000):
+    """Построчно просматривает файл и выдаёт (номер строки, запись) для записей-палиндромов."""
+    with open(path, encoding=encoding) as file:
+        batch = []
+        number = 0
+        for number, line in enumerate(file, 1):
+            batch.append(line.rstrip("\r\n"))
+            if len(batch) == batch_size:
+                yield from _batch_records(batch, number - len(batch) + 1)
+                batch = []
+        yield from _batch_records(batch, number - len(batch) + 1)
+
+
+def _batch_records(batch, first_number):
+    for offset, matched in enumerate(is_palindrome_batch(batch)):
+        if matched:
+            yield first_number + offset, batch[offset]
+
+
+def longest_palindromic_substring(text: str, normalize: bool = False) -> str:
+    """
+    Самая длинная подстрока-палиндром (алгоритм Манакера, O(n)).
+    При normalize=True сравниваются только буквы и цифры без учёта регистра,
+    а возвращается соответствующий фрагмент исходной строки.
+    """
+    if normalize:
+        positions = [index for index, char in enumerate(text) if char.isalnum()]
+        chars = [text[index].lower() for index in positions]
+    else:
+        positions = None
+        chars = text
+    if not chars:
+        return ""
+    # Чередуем символы с разделителем None, чтобы чётные палиндромы стали нечётными
+    extended = [None] * (2 * len(chars) + 1)
+    extended[1::2] = chars
+    radius = [0] * len(extended)
+    center = right = 0
+    for index in range(1, len(extended)):
+        current = min(right - index, radius[2 * center - index]) if index < right else 0
+        while (
+            index - current - 1 >= 0
+            and index + current + 1 < len(extended)
+            and extended[index - current - 1] == extended[index + current + 1]
+        ):
+            current += 1
+        radius[index] = current
+        if index + current > right:
+            center, right = index, index + current
+    best = max(range(len(extended)), key=radius.__getitem__)
+    start = (best - radius[best]) // 2
+    end = start + radius[best]
+    if positions is None:
+        return text[start:end]
+    return text[positions[start] : positions[end - 1] + 1]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+import importlib.util
+import os
+from decimal import Decimal
+
+import pytest
+
+_SPEC = importlib.util.spec_from_file_location("spp1_1", os.path.join(os.path.dirname(__file__), "SPP1-1.py"))
+spp1_1 = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(spp1_1)
+
+
+def test_float_step_has_no_accumulated_error():
+    """Тест: rep(0, 1, 0.1) дает 10 элементов без 0.9999999999999999 в конце"""
+    result = spp1_1.rep(0, 1, 0.1)
+    assert len(result) == 10
+    assert result == [k * 0.1 for k in range(10)]
+    assert result[-1] < 0.95
+
+
+@pytest.mark.parametrize(
+    "start,end,step",
+    [(1, 5, 1), (-5, -1, 1), (1, 3, 2), (0, 10**6, 7), (0.5, 3.0, 0.25), (Decimal("0"), Decimal("1"), Decimal("0.1"))],
+)
+def test_matches_range_semantics(start, end, step):
+    """Тест: ленивая и списочная версии совпадают и не выходят за end"""
+    result = spp1_1.rep(start, end, step)
+    lazy = spp1_1.rep(start, end, step, lazy=True)
+    assert list(lazy) == result
+    assert len(lazy) == len(result)
+    assert all(value < end for value in result)
+    assert result[-1] + step >= end
+    if isinstance(start, int):
+        assert result == list(range(start, end, step))
+
+
+@pytest.mark.parametrize("start,end,step", [(1, 5, 0), (1, 5, -1), (5, 1, 1), (5, 5, 1)])
+def test_invalid_arguments(start, end, step):
+    """Тест: неположительный шаг и start >= end"""
+    with pytest.raises(ValueError):
+        spp1_1.rep(start, end, step)
+
+
+def test_progression_access():
+    """Тест: индексация, срезы и проверка вхождения без хранения элементов"""
+    progression = spp1_1.rep(0, 10**12, 3, lazy=True)
+    assert len(progression) == (10**12 + 2) // 3
+    assert progression[-1] == 10**12 - 1
+    assert progression[10:20:2] == spp1_1.Progression(30, 60, 6)
+    assert 999 in progression and 1000 not in progression
+    assert progression.index(300) == 100
@@ -0,0 +1,46 @@
+import importlib.util
+import os
+
+import pytest
+
+_SPEC = importlib.util.spec_from_file_location("spp1_2", os.path.join(os.path.dirname(__file__), "SPP1-2.py"))
+spp1_2 = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(spp1_2)
+
+
+def _reference(text):
+    cleaned = "".join(char.lower() for char in text if char.isalnum())
+    return cleaned == cleaned[::-1]
+
+
+@pytest.mark.parametrize("text", ["abba", "А роза упала на лапу Азора", "Σ 1. BςσB.,ЖσBж", "ab", "", "Жж ж"])
+@pytest.mark.parametrize("block_size", [1, 2, 3, 7])
+def test_small_blocks(text, block_size):
+    """Тест строк с блоками меньше длины текста"""
+    assert spp1_2.is_palindrome(text, block_size) is _reference(text)
+
+
+@pytest.mark.parametrize("text", ["Σ 1. BςσB.,ЖσBж", "Аргентина манит негра", "жЖ", "abcba", "ab"])
+@pytest.mark.parametrize("block_size", [4, 5, 6])
+def test_file_multibyte_small_blocks(tmp_path, text, block_size):
+    """Тест файла с многобайтовыми символами UTF-8 и минимальными блоками"""
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding="utf-8")
+    assert spp1_2.is_palindrome_file(str(path), block_size=block_size) is _reference(text)
+
+
+def test_invalid_block_size(tmp_path):
+    """Тест слишком маленького размера блока"""
+    path = tmp_path / "text.txt"
+    path.write_text("Σ 1. BςσB.,ЖσBж", encoding="utf-8")
+    with pytest.raises(ValueError):
+        spp1_2.is_palindrome_file(str(path), block_size=1)
+    with pytest.raises(ValueError):
+        spp1_2.is_palindrome("abba", 0)
+
+
+def test_longest_palindromic_substring():
+    """Тест поиска самой длинной подстроки-палиндрома"""
+    assert spp1_2.longest_palindromic_substring("babad") in ("bab", "aba")
+    assert spp1_2.longest_palindromic_substring("cbbd") == "bb"
+    assert spp1_2.longest_palindromic_substring("Xa, b A!", normalize=True) == "a, b A"
@@ -1,4 +1,11 @@
 import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для TriangleBatch
+    np = None
 
 
 class Triangle:
@@ -71,6 +78,89 @@ class Triangle:
         return math.isclose(self._a, other._a) and math.isclose(self._b, other._b) and math.isclose(self._c, other._c)
 
 
+class TriangleBatch:
+    """
+    Набор из N равносторонних треугольников в трёх массивах numpy a, b, c (структура массивов).
+    Правила те же, что у Triangle: строки, которые не принял бы Triangle, отклоняются конструктором,
+    а периметры, площади и сравнение считаются одним вызовом для всего набора.
+    """
+
+    # Допуск равенства сторон: math.isclose в Triangle.set_sides и Triangle.__eq__
+    REL_TOL = 1e-9
+
+    def __init__(self, sides):
+        """
+        :param sides: массив N x 3 длин сторон (порядок сторон сохраняется, как в Triangle)
+        """
+        sides = np.asarray(sides, dtype=np.float64)
+        if sides.ndim != 2 or sides.shape[1] != 3:
+            raise ValueError("Ожидается массив формы N x 3")
+        a, b, c = sides.T
+        equilateral = np.isclose(a, b, rtol=self.REL_TOL, atol=0) & np.isclose(a, c, rtol=self.REL_TOL, atol=0)
+        bad = np.flatnonzero(~equilateral)
+        if bad.size:
+            raise ValueError(f"Треугольник должен быть равносторонним (все стороны равны), строки {bad[:10].tolist()}")
+        bad = np.flatnonzero(~np.all(sides > 0, axis=1))
+        if bad.size:
+            raise ValueError(f"Длины сторон должны быть положительными числами (строки {bad[:10].tolist()})")
+        self.a, self.b, self.c = (np.ascontiguousarray(column) for column in (a, b, c))
+
+    @classmethod
+    def from_triangles(cls, triangles):
+        """Набор из готовых объектов Triangle"""
+        return cls([(t.a, t.b, t.c) for t in triangles])
+
+    def __len__(self):
+        return len(self.a)
+
+    def perimeter(self):
+        """Периметры всех треугольников"""
+        return self.a + self.b + self.c
+
+    def area(self):
+        """Площади по формуле Герона, как в Triangle.area"""
+        p = self.perimeter() / 2
+        return np.sqrt(p * (p - self.a) * (p - self.b) * (p - self.c))
+
+    def is_valid(self):
+        """
+        Маска треугольников, удовлетворяющих неравенству треугольника
+        (для равносторонних с положительными сторонами - всегда True, как в Triangle)
+        """
+        return (self.a + self.b > self.c) & (self.a + self.c > self.b) & (self.b + self.c > self.a)
+
+    def equals(self, other):
+        """
+        Попарное сравнение с другим набором той же длины, как Triangle.__eq__ (стороны по порядку)
+        :return: маска, True там, где треугольники равны
+        """
+        if len(self) != len(other):
+            raise ValueError("Наборы должны быть одной длины")
+        return (
+            np.isclose(self.a, other.a, rtol=self.REL_TOL, atol=0)
+            & np.isclose(self.b, other.b, rtol=self.REL_TOL, atol=0)
+            & np.isclose(self.c, other.c, rtol=self.REL_TOL, atol=0)
+        )
+
+
+def benchmark(count=10**6):
+    """Сравнение TriangleBatch с созданием count объектов Triangle"""
+    sides = np.repeat(np.random.default_rng(0).uniform(1, 100, count)[:, None], 3, axis=1)
+
+    start = time.perf_counter()
+    triangles = [Triangle(a, b, c) for a, b, c in sides.tolist()]
+    areas = [t.area() for t in triangles]
+    perimeters = [t.perimeter() for t in triangles]
+    print(f"{count} объектов Triangle: {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    batch = TriangleBatch(sides)
+    batch_areas = batch.area()
+    batch_perimeters = batch.perimeter()
+    print(f"TriangleBatch: {time.perf_counter() - start:.3f} с")
+    assert np.allclose(areas, batch_areas) and np.allclose(perimeters, batch_perimeters)
+
+
 def validate_input(prompt):
     """Функция для валидации ввода чисел"""
     while True:
@@ -122,4 +212,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,51 @@
+import importlib.util
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+_SPEC = importlib.util.spec_from_file_location("spp2_1", os.path.join(os.path.dirname(__file__), "SPP2-1.py"))
+spp2_1 = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(spp2_1)
+
+SIDES = [1.0, 2.5, 1e-3, 1e6, 7.0]
+
+
+def test_matches_triangle_objects():
+    """Тест площадей, периметров и неравенства треугольника против объектов Triangle"""
+    triangles = [spp2_1.Triangle(side, side, side) for side in SIDES]
+    batch = spp2_1.TriangleBatch.from_triangles(triangles)
+    assert len(batch) == len(SIDES)
+    assert batch.is_valid().tolist() == [t.is_valid() for t in triangles]
+    assert np.allclose(batch.perimeter(), [t.perimeter() for t in triangles], rtol=1e-12)
+    assert np.allclose(batch.area(), [t.area() for t in triangles], rtol=1e-12)
+
+
+def test_not_equilateral_rejected():
+    """Тест: набор, как и Triangle, принимает только равносторонние треугольники"""
+    with pytest.raises(ValueError):
+        spp2_1.Triangle(3, 4, 5)
+    with pytest.raises(ValueError, match=r"равносторонним.*\[1, 2\]"):
+        spp2_1.TriangleBatch([(2, 2, 2), (3, 4, 5), (2, 2, 3)])
+
+
+def test_equality_within_tolerance():
+    """Тест: стороны, отличающиеся меньше чем на REL_TOL, считаются равными, как в Triangle"""
+    side = 3.0
+    close = side * (1 + spp2_1.TriangleBatch.REL_TOL / 10)
+    assert spp2_1.Triangle(side, close, side) == spp2_1.Triangle(side, side, side)
+    batch = spp2_1.TriangleBatch([(side, close, side), (side, side, side)])
+    other = spp2_1.TriangleBatch([(side, side, side), (side * 1.001, side * 1.001, side * 1.001)])
+    assert batch.equals(other).tolist() == [True, False]
+    assert batch.a.tolist() == [side, side] and batch.b.tolist() == [close, side]
+
+
+def test_non_positive_sides():
+    """Тест неположительных сторон: ошибка и у класса, и у набора"""
+    with pytest.raises(ValueError):
+        spp2_1.Triangle(0, 0, 0)
+    with pytest.raises(ValueError, match=r"положительными.*\[1\]"):
+        spp2_1.TriangleBatch([(1, 1, 1), (0, 0, 0)])
+    with pytest.raises(ValueError):
+        spp2_1.TriangleBatch([1, 1, 1])
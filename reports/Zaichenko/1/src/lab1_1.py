@@ -1,3 +1,13 @@
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def find_the_max(arr):
     arr.sort()
     arr_list = {}
@@ -14,16 +24,135 @@ def find_the_max(arr):
     return arr_list
 
 
+def _bucket_size(low, high, n):
+    # Разрыв внутри корзины меньше среднего разрыва (high - low) / (n - 1),
+    # поэтому максимальный разрыв всегда лежит между соседними непустыми корзинами
+    if isinstance(low, int) and isinstance(high, int):
+        return max(1, (high - low) // (n - 1))
+    return (high - low) / (n - 1)
+
+
+def max_gap(values):
+    # Максимальный разрыв между соседними значениями в порядке возрастания за O(n) без сортировки.
+    # Возвращает (разрыв, меньшее значение, большее значение)
+    if np is not None and isinstance(values, np.ndarray):
+        return _max_gap_numpy(values)
+    n = len(values)
+    if n < 2:
+        raise ValueError("Нужно хотя бы два числа")
+    low, high = min(values), max(values)
+    if low == high:
+        return 0, low, high
+
+    size = _bucket_size(low, high, n)
+    count = int((high - low) // size) + 1
+    bucket_min = [None] * count
+    bucket_max = [None] * count
+    for value in values:
+        index = int((value - low) // size)
+        current = bucket_min[index]
+        if current is None:
+            bucket_min[index] = bucket_max[index] = value
+        elif value < current:
+            bucket_min[index] = value
+        elif value > bucket_max[index]:
+            bucket_max[index] = value
+
+    best = (0, low, low)
+    previous = None
+    for smallest, largest in zip(bucket_min, bucket_max):
+        if smallest is None:
+            continue
+        if previous is not None and smallest - previous > best[0]:
+            best = (smallest - previous, previous, smallest)
+        previous = largest
+    return best
+
+
+def _widen(values):
+    # Разности считаются в 64-битном типе: в int8 разрыв между -100 и 100 переполнился бы до -56
+    if values.dtype.kind == "u":
+        return values.astype(np.uint64, copy=False)
+    if values.dtype.kind in "bi":
+        return values.astype(np.int64, copy=False)
+    return values.astype(np.float64, copy=False)
+
+
+def _max_gap_numpy(values):
+    values = _widen(values)
+    n = len(values)
+    if n < 2:
+        raise ValueError("Нужно хотя бы два числа")
+    low, high = values.min().item(), values.max().item()
+    if low == high:
+        return 0, low, high
+
+    size = _bucket_size(low, high, n)
+    if values.dtype.kind in "iu":
+        indexes = (values.astype(np.int64) - low) // size
+    else:
+        indexes = ((values - low) // size).astype(np.int64)
+    count = int(indexes.max()) + 1
+    bucket_min = np.full(count, high, dtype=values.dtype)
+    bucket_max = np.full(count, low, dtype=values.dtype)
+    filled = np.zeros(count, dtype=bool)
+    np.minimum.at(bucket_min, indexes, values)
+    np.maximum.at(bucket_max, indexes, values)
+    filled[indexes] = True
+    return _largest_gap(bucket_min[filled], bucket_max[filled])
+
+
+def _largest_gap(lower_bounds, upper_bounds):
+    gaps = lower_bounds[1:] - upper_bounds[:-1]
+    index = int(np.argmax(gaps))
+    return gaps[index].item(), upper_bounds[index].item(), lower_bounds[index + 1].item()
+
+
+def max_gap_sorted(arr):
+    # Для уже отсортированного массива достаточно diff и argmax
+    arr = _widen(np.asarray(arr))
+    if len(arr) < 2:
+        raise ValueError("Нужно хотя бы два числа")
+    return _largest_gap(arr, arr)
+
+
+def benchmark(size=10**7):
+    arr = [random.randrange(10**12) for _ in range(size)]
+
+    start = time.perf_counter()
+    find_the_max(sorted(arr))
+    print(f"Двойная сортировка и словарь: {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    expected = max_gap(arr)
+    print(f"max_gap (корзины, список):    {time.perf_counter() - start:.3f} с")
+
+    if np is not None:
+        array = np.array(arr)
+        start = time.perf_counter()
+        result = max_gap(array)
+        print(f"max_gap (корзины, numpy):     {time.perf_counter() - start:.3f} с")
+        assert result[0] == expected[0]
+
+        array.sort()
+        start = time.perf_counter()
+        result = max_gap_sorted(array)
+        print(f"max_gap_sorted (diff/argmax): {time.perf_counter() - start:.3f} с")
+        assert result[0] == expected[0]
+
+
 def main():
     arr = list(map(int, input("Введите последовательность: ").split()))
-    sorted_arr = sorted(arr)
-    res_list = find_the_max(sorted_arr)
+    res_list = find_the_max(arr)  # сортирует arr на месте, вторая сортировка не нужна
     max_key = max(res_list, key=res_list.get)
     if res_list[max_key] == 1:
-        print(*sorted_arr)
+        print(*arr)
         return
-    print(sorted_arr[max_key])
+    print(arr[max_key])
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        main()
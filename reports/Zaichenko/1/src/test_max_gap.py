@@ -0,0 +1,64 @@
+import random
+
+import pytest
+from lab1_1 import max_gap, max_gap_sorted
+
+np = pytest.importorskip("numpy")
+
+
+def brute_force(values):
+    ordered = sorted(values)
+    gaps = [b - a for a, b in zip(ordered, ordered[1:])]
+    index = gaps.index(max(gaps))
+    return gaps[index], ordered[index], ordered[index + 1]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, 2],
+        [5, 1, 9, 2],
+        [3, 3, 3, 10, 10, 0],
+        [7, 7],
+        [-10, 4, -3, 100, 42],
+        [0.5, 2.25, -1.0, 2.25, 10.0],
+        [10**12, 1, 5 * 10**11],
+    ],
+)
+def test_matches_brute_force(values):
+    expected = brute_force(values)
+    assert max_gap(values) == expected
+    assert max_gap(np.array(values)) == expected
+    assert max_gap_sorted(np.sort(np.array(values))) == expected
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.int32, np.uint8, np.uint16, np.float16, np.float32])
+def test_small_dtypes_do_not_wrap(dtype):
+    info = np.iinfo(dtype) if np.issubdtype(dtype, np.integer) else np.finfo(dtype)
+    values = np.array([info.min, info.max, 0, 1, 1], dtype=dtype)
+    expected = brute_force([value.item() for value in values])
+    assert max_gap(values) == expected
+    assert max_gap_sorted(np.sort(values)) == expected
+    assert max_gap(np.array([-100, 100], dtype=np.int8)) == (200, -100, 100)
+
+
+def test_random_with_duplicates():
+    rng = random.Random(1)
+    for _ in range(200):
+        values = [rng.randint(-50, 50) for _ in range(rng.randint(2, 30))]
+        if len(set(values)) == 1:
+            assert max_gap(values) == (0, values[0], values[0])
+            continue
+        expected = brute_force(values)
+        assert max_gap(values) == expected
+        assert max_gap(np.array(values, dtype=np.int8)) == expected
+        assert max_gap_sorted(np.sort(np.array(values, dtype=np.int8))) == expected
+
+
+def test_too_short():
+    with pytest.raises(ValueError):
+        max_gap([1])
+    with pytest.raises(ValueError):
+        max_gap(np.array([1]))
+    with pytest.raises(ValueError):
+        max_gap_sorted([])
@@ -44,6 +44,105 @@ class SymbolSet:
             self.add(val)
 
 
+class _FilterTable(dict):
+    def __missing__(self, code):
+        self[code] = None
+
+
+class SymbolBitSet:
+    # В отличие от SymbolSet хранит только одиночные символы из [first, last):
+    # add для других значений бросает ValueError, remove и contains их просто пропускают
+    def __init__(self, initial_values=None, first=0, last=128):
+        if not 0 <= first < last:
+            raise ValueError("Некорректный диапазон символов")
+        self.first = first
+        self.last = last
+        self.bits = 0
+        self._table = None
+        for val in initial_values or ():
+            self.add(val)
+
+    def _index(self, value):
+        if not isinstance(value, str) or len(value) != 1 or not self.first <= ord(value) < self.last:
+            raise ValueError(f"'{value}' не является символом из диапазона множества")
+        return ord(value) - self.first
+
+    def add(self, value):
+        self.bits |= 1 << self._index(value)
+        self._table = None
+
+    def remove(self, value):
+        if self.contains(value):
+            self.bits &= ~(1 << self._index(value))
+            self._table = None
+
+    def contains(self, value):
+        try:
+            return bool(self.bits >> self._index(value) & 1)
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _aligned_bits(other, first, last):
+        shift = other.first - first
+        bits = other.bits << shift if shift >= 0 else other.bits >> -shift
+        return bits & ((1 << (last - first)) - 1)
+
+    def _with_bits(self, bits, first, last):
+        result = SymbolBitSet(first=first, last=last)
+        result.bits = bits
+        return result
+
+    def intersect(self, other):
+        return self._with_bits(self.bits & self._aligned_bits(other, self.first, self.last), self.first, self.last)
+
+    def union(self, other):
+        first, last = min(self.first, other.first), max(self.last, other.last)
+        bits = self._aligned_bits(self, first, last) | self._aligned_bits(other, first, last)
+        return self._with_bits(bits, first, last)
+
+    def filter_text(self, text):
+        if self._table is None:
+            self._table = _FilterTable((ord(char), ord(char)) for char in self._elements())
+        return text.translate(self._table)
+
+    def _elements(self):
+        elements = []
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            elements.append(chr(self.first + low.bit_length() - 1))
+            bits ^= low
+        return elements
+
+    def __len__(self):
+        return self.bits.bit_count()
+
+    def __str__(self):
+        return "{" + ", ".join(self._elements()) + "}"
+
+    def __eq__(self, other):
+        if not isinstance(other, SymbolBitSet):
+            return False
+        if (self.first, self.last) == (other.first, other.last):
+            return self.bits == other.bits
+        return self.elements == other.elements
+
+    def display(self):
+        print("Множество:", self)
+
+    @property
+    def elements(self):
+        return self._elements()
+
+    @elements.setter
+    def elements(self, values):
+        self.bits = 0
+        self._table = None
+        for val in values:
+            self.add(val)
+
+
 def create_set_from_input():
     elements = input("Введите элементы множества через пробел: ").split()
     symbol_set = SymbolSet(elements)
@@ -0,0 +1,60 @@
+import pytest
+from lab2_1 import SymbolBitSet, SymbolSet
+
+
+@pytest.mark.parametrize(
+    "first_values,second_values",
+    [
+        ("abcxyz", "bzq"),
+        ("", "abc"),
+        ("Hello, World!", "lo W"),
+        ("0123456789", "13579"),
+    ],
+)
+def test_bit_set_matches_symbol_set(first_values, second_values):
+    first, second = SymbolSet(first_values), SymbolSet(second_values)
+    first_bits, second_bits = SymbolBitSet(first_values), SymbolBitSet(second_values)
+    assert sorted(first_bits.elements) == sorted(first.elements)
+    assert sorted(first_bits.intersect(second_bits).elements) == sorted(first.intersect(second).elements)
+    assert set(first_bits.union(second_bits).elements) == set(first_values) | set(second_values)
+    assert (first_bits == second_bits) == (first == second)
+
+
+def test_add_remove_contains():
+    symbols = SymbolBitSet("ab")
+    symbols.add("c")
+    symbols.add("a")
+    symbols.remove("b")
+    symbols.remove("z")
+    assert symbols.elements == ["a", "c"]
+    assert symbols.contains("a") and not symbols.contains("b")
+    assert len(symbols) == 2
+
+
+def test_values_outside_range():
+    # SymbolSet хранит любые значения, SymbolBitSet - только символы из [first, last)
+    symbols = SymbolBitSet("ab")
+    with pytest.raises(ValueError):
+        symbols.add("ab")
+    with pytest.raises(ValueError):
+        symbols.add("я")
+    symbols.remove("ab")
+    symbols.remove("я")
+    assert not symbols.contains("ab")
+    assert symbols.elements == ["a", "b"]
+
+
+def test_different_ranges():
+    latin = SymbolBitSet("abc", first=ord("a"), last=ord("z") + 1)
+    ascii_set = SymbolBitSet("bcd")
+    assert latin.intersect(ascii_set).elements == ["b", "c"]
+    assert ascii_set.intersect(latin).elements == ["b", "c"]
+    assert latin.union(ascii_set).elements == ["a", "b", "c", "d"]
+    assert latin == SymbolBitSet("cba")
+
+
+def test_filter_text():
+    symbols = SymbolBitSet("ab ")
+    assert symbols.filter_text("a cab, bad!") == "a ab ba"
+    symbols.add("d")
+    assert symbols.filter_text("a cab, bad!") == "a ab bad"
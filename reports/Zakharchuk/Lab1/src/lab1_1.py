@@ -1,21 +1,128 @@
-# Ввод чисел от пользователя
-nums = input("Введите числа через пробел: ")
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
-# Преобразуем строку в список чисел
-nums = list(map(int, nums.split()))
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для массивов и двоичных файлов
+    np = None
 
-# Находим среднее значение
-average = sum(nums) / len(nums)
 
-# Подсчитываем, сколько чисел больше среднего
-count = 0
-for num in nums:
-    if num > average:
-        count += 1
+def above_average_percent(numbers):
+    """Возвращает среднее значение и процент чисел, больших среднего (для numpy-массивов - векторно)."""
+    if len(numbers) == 0:
+        raise ValueError("Список чисел не может быть пустым")
+    if np is not None and isinstance(numbers, np.ndarray):
+        average = _chunk_sum(numbers) / numbers.size
+        count = int(np.count_nonzero(numbers > average))
+        return average, count / numbers.size * 100
+    average = sum(numbers) / len(numbers)
+    count = sum(1 for num in numbers if num > average)
+    return average, count / len(numbers) * 100
 
-# Вычисляем процент
-percent = (count / len(nums)) * 100
 
-# Вывод результата
-print(f"Среднее значение: {average}")
-print(f"Процент чисел больше среднего: {percent:.2f}%")
+def _chunk_sum(chunk):
+    """Точная сумма куска: целые складываются в int64, только если переполнение невозможно."""
+    if chunk.dtype.kind in "iu":
+        bound = max(abs(int(chunk.max())), abs(int(chunk.min()))) * chunk.size if chunk.size else 0
+        return int(chunk.sum(dtype=np.int64)) if bound < 2**63 else sum(chunk.tolist())
+    return float(chunk.sum(dtype=np.float64))
+
+
+def _text_chunks(path, chunk_lines):
+    """Читает числа из текстового файла кусками по chunk_lines строк."""
+    with open(path, encoding="utf-8") as file:
+        while True:
+            lines = list(islice(file, chunk_lines))
+            if not lines:
+                return
+            tokens = " ".join(lines).split()
+            try:
+                yield [int(token) for token in tokens]
+            except ValueError:
+                yield [float(token) for token in tokens]
+
+
+def _binary_chunks(path, dtype, chunk_size):
+    """Возвращает куски двоичного файла, отображённого в память."""
+    data = np.memmap(path, dtype=dtype, mode="r")
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+def above_average_percent_file(path, dtype=None, chunk_size=1 << 20):
+    """
+    Считает статистику по файлу в два прохода кусками, так что память не растёт с размером файла.
+
+    Если указан dtype, файл читается как двоичный массив чисел (через memmap),
+    иначе - как текст с числами, разделёнными пробелами или переводами строк
+    (тогда chunk_size - число строк в куске).
+    """
+    if dtype is not None and np is None:
+        raise ImportError("Для двоичных файлов необходим numpy")
+
+    def chunks():
+        return _binary_chunks(path, dtype, chunk_size) if dtype is not None else _text_chunks(path, chunk_size)
+
+    total = count = 0
+    for chunk in chunks():
+        total += _chunk_sum(chunk) if dtype is not None else sum(chunk)
+        count += len(chunk)
+    if count == 0:
+        raise ValueError("Список чисел не может быть пустым")
+
+    average = total / count
+    above = 0
+    for chunk in chunks():
+        if dtype is not None:
+            above += int(np.count_nonzero(chunk > average))
+        else:
+            above += sum(1 for num in chunk if num > average)
+    return average, above / count * 100
+
+
+def _sum_range(args):
+    path, dtype, start, stop = args
+    chunk = np.memmap(path, dtype=dtype, mode="r")[start:stop]
+    return _chunk_sum(chunk), len(chunk)
+
+
+def _count_range(args):
+    path, dtype, start, stop, average = args
+    chunk = np.memmap(path, dtype=dtype, mode="r")[start:stop]
+    return int(np.count_nonzero(chunk > average))
+
+
+def above_average_percent_parallel(path, dtype, processes=None, chunk_size=1 << 24):
+    """То же для двоичного файла в пуле процессов: суммы и количества по кускам сводятся в главном процессе."""
+    if np is None:
+        raise ImportError("Для двоичных файлов необходим numpy")
+    size = len(np.memmap(path, dtype=dtype, mode="r"))
+    if size == 0:
+        raise ValueError("Список чисел не может быть пустым")
+    bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        sums = list(executor.map(_sum_range, [(path, dtype, start, stop) for start, stop in bounds]))
+        average = sum(total for total, _ in sums) / size
+        above = sum(executor.map(_count_range, [(path, dtype, start, stop, average) for start, stop in bounds]))
+    return average, above / size * 100
+
+
+def main():
+    """Основная функция для ввода и вывода."""
+    # Ввод чисел от пользователя
+    nums = input("Введите числа через пробел: ")
+
+    # Преобразуем строку в список чисел
+    nums = list(map(int, nums.split()))
+
+    # Находим среднее значение и процент чисел больше среднего
+    average, percent = above_average_percent(nums)
+
+    # Вывод результата
+    print(f"Среднее значение: {average}")
+    print(f"Процент чисел больше среднего: {percent:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
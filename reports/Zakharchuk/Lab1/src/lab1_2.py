@@ -1,19 +1,155 @@
-# Ввод количества строк
-num = int(input("Введите количество строк: "))
+import math
 
-# Создаем список для хранения треугольника Паскаля
-triangle = []
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для pascal_rows_numpy
+    np = None
 
-# Заполняем треугольник
-for i in range(num):
-    row = [1] * (i + 1)  # Создаем строку из 1 (например, [1], [1, 1], [1, 1, 1] и т. д.)
 
-    # Заполняем середину строки (если в ней больше 2 элементов)
-    for j in range(1, i):
-        row[j] = triangle[i - 1][j - 1] + triangle[i - 1][j]  # Складываем два числа сверху
+def iter_pascal_rows(num_rows):
+    """Возвращает строки треугольника Паскаля по одной, храня только предыдущую строку."""
+    if num_rows < 0:
+        raise ValueError("Количество строк не может быть отрицательным")
+    row = []
+    for _ in range(num_rows):
+        # Складываем два числа сверху, по краям строки остаются единицы
+        row = [1] + [left + right for left, right in zip(row, row[1:])] + [1] if row else [1]
+        yield row
 
-    triangle.append(row)  # Добавляем строку в треугольник
 
-# Выводим треугольник Паскаля
-for row in triangle:
-    print(row)
+def generate_pascal_triangle(num_rows):
+    """Генерирует треугольник Паскаля с заданным количеством строк."""
+    return list(iter_pascal_rows(num_rows))
+
+
+def pascal_row(n):
+    """Вычисляет n-ю строку (нумерация с нуля) по мультипликативной формуле C(n, k) = C(n, k - 1) * (n - k + 1) / k."""
+    if n < 0:
+        raise ValueError("Номер строки не может быть отрицательным")
+    half = [1]
+    for k in range(1, n // 2 + 1):
+        half.append(half[-1] * (n - k + 1) // k)
+    # Строка симметрична: вторая половина - зеркальное отражение первой (без середины при чётном n)
+    return half + (half[-2::-1] if n % 2 == 0 else half[::-1])
+
+
+def _binomial_mod_small(n, k, p):
+    """C(n, k) mod p для n < p (p - простое)."""
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    numerator = denominator = 1
+    for i in range(k):
+        numerator = numerator * (n - i) % p
+        denominator = denominator * (i + 1) % p
+    return numerator * pow(denominator, p - 2, p) % p
+
+
+def binomial_mod(n, k, p):
+    """Вычисляет C(n, k) mod p для простого p по теореме Люка, n может быть сколь угодно большим."""
+    if k < 0 or k > n:
+        return 0
+    result = 1
+    while n or k:
+        n, n_digit = divmod(n, p)
+        k, k_digit = divmod(k, p)
+        if k_digit > n_digit:
+            return 0
+        result = result * _binomial_mod_small(n_digit, k_digit, p) % p
+    return result
+
+
+def _factorial_tables(size, p):
+    """Таблицы i! и (i!)^-1 по модулю простого p для i < size <= p."""
+    factorials = [1] * size
+    for i in range(1, size):
+        factorials[i] = factorials[i - 1] * i % p
+    inverse_factorials = [1] * size
+    inverse_factorials[-1] = pow(factorials[-1], -1, p)
+    for i in range(size - 1, 0, -1):
+        inverse_factorials[i - 1] = inverse_factorials[i] * i % p
+    return factorials, inverse_factorials
+
+
+def pascal_row_mod(n, p):
+    """
+    Лениво возвращает элементы n-й строки по модулю простого p.
+
+    При p > n все k! обратимы, и строка строится последовательно по формуле
+    C(n, k) = C(n, k - 1) * (n - k + 1) / k с обратным к k по модулю p - O(n log p) на строку.
+    При p <= n по теореме Люка, но C(a, b) для цифр a, b < p берутся из таблиц факториалов
+    длины max(n_i) + 1, где n_i - цифры n в системе с основанием p.
+    """
+    if n < 0:
+        raise ValueError("Номер строки не может быть отрицательным")
+    if p > n:
+        value = 1
+        yield value
+        for k in range(1, n + 1):
+            value = value * (n - k + 1) % p * pow(k, -1, p) % p
+            yield value
+        return
+    # Цифры n в системе счисления с основанием p: C(n_i, k_i) нужны только для n_i <= max(n_i),
+    # поэтому таблицы факториалов строятся до max(n_i), а не до p
+    n_digits = []
+    rest_n = n
+    while rest_n:
+        rest_n, n_digit = divmod(rest_n, p)
+        n_digits.append(n_digit)
+    factorials, inverse_factorials = _factorial_tables(max(n_digits) + 1, p)
+    for k in range(n + 1):
+        result, rest_k = 1, k
+        for n_digit in n_digits:
+            if not rest_k or not result:
+                break
+            rest_k, k_digit = divmod(rest_k, p)
+            if k_digit > n_digit:
+                result = 0
+            else:
+                digit = factorials[n_digit] * inverse_factorials[k_digit] * inverse_factorials[n_digit - k_digit]
+                result = result * digit % p
+        yield result
+
+
+def pascal_rows_numpy(num_rows, modulus=None, dtype="int64"):
+    """
+    Возвращает строки треугольника как срезы одного массива numpy фиксированной ширины num_rows.
+
+    Массив переиспользуется: каждая следующая строка вычисляется на месте,
+    поэтому полученную строку нужно скопировать, если она понадобится позже.
+    Без modulus значения должны помещаться в dtype, иначе - OverflowError.
+    """
+    if np is None:
+        raise ImportError("Для pascal_rows_numpy необходим numpy")
+    if num_rows < 0:
+        raise ValueError("Количество строк не может быть отрицательным")
+    limit = np.iinfo(dtype).max
+    if modulus is None:
+        if num_rows and math.comb(num_rows - 1, (num_rows - 1) // 2) > limit:
+            raise OverflowError(f"Строки треугольника не помещаются в {dtype}, укажите modulus")
+    elif not 0 < modulus <= limit // 2:
+        raise ValueError("modulus должен быть положительным и не превышать половины максимума dtype")
+
+    row = np.zeros(num_rows, dtype=dtype)
+    for i in range(num_rows):
+        if i == 0:
+            row[0] = 1
+        else:
+            row[1 : i + 1] += row[:i]
+            if modulus is not None:
+                np.remainder(row[: i + 1], modulus, out=row[: i + 1])
+        yield row[: i + 1]
+
+
+def main():
+    """Основная функция для ввода и вывода."""
+    try:
+        num = int(input("Введите количество строк: "))
+        for row in iter_pascal_rows(num):
+            print(row)
+    except ValueError as e:
+        print(f"Ошибка: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+from lab1_1 import above_average_percent, above_average_percent_file, above_average_percent_parallel
+
+np = pytest.importorskip("numpy")
+
+
+def original(nums):
+    """Исходный вариант лабораторной: среднее и процент чисел больше среднего."""
+    average = sum(nums) / len(nums)
+    count = 0
+    for num in nums:
+        if num > average:
+            count += 1
+    return average, (count / len(nums)) * 100
+
+
+def datasets():
+    rng = random.Random(0)
+    return [
+        [5],
+        [7, 7, 7, 7],
+        [1, 2, 3, 4, 100],
+        [rng.randint(-1000, 1000) for _ in range(1001)],
+        # Сумма не помещается в int64: проверка точной суммы кусков
+        [2**62, 2**62, 2**62, 1, -5, 3],
+    ]
+
+
+@pytest.mark.parametrize("nums", datasets())
+def test_list_and_array_match_original(nums):
+    """Список и массив int64 дают тот же результат, что и исходный код."""
+    expected = original(nums)
+    assert above_average_percent(nums) == expected
+    assert above_average_percent(np.array(nums, dtype=np.int64)) == expected
+
+
+@pytest.mark.parametrize("nums", datasets())
+def test_files_match_original(nums, tmp_path):
+    """Текстовый и двоичный файлы, в том числе куски меньше файла, и пул процессов."""
+    expected = original(nums)
+    text = tmp_path / "numbers.txt"
+    text.write_text("\n".join(" ".join(map(str, nums[i : i + 4])) for i in range(0, len(nums), 4)), encoding="utf-8")
+    binary = tmp_path / "numbers.bin"
+    np.array(nums, dtype=np.int64).tofile(binary)
+    for chunk_size in (1, 3, 1 << 20):
+        assert above_average_percent_file(str(text), chunk_size=chunk_size) == expected
+        assert above_average_percent_file(str(binary), dtype=np.int64, chunk_size=chunk_size) == expected
+    assert above_average_percent_parallel(str(binary), np.int64, processes=2, chunk_size=100) == expected
+
+
+def test_float_data(tmp_path):
+    """Дробные числа: среднее совпадает с точностью до округления, процент - точно."""
+    rng = random.Random(1)
+    nums = [rng.uniform(-1, 1) for _ in range(5000)]
+    average, percent = original(nums)
+    binary = tmp_path / "numbers.bin"
+    np.array(nums).tofile(binary)
+    text = tmp_path / "numbers.txt"
+    text.write_text("\n".join(map(repr, nums)), encoding="utf-8")
+    results = [
+        above_average_percent(nums),
+        above_average_percent(np.array(nums)),
+        above_average_percent_file(str(text), chunk_size=700),
+        above_average_percent_file(str(binary), dtype=np.float64, chunk_size=700),
+        above_average_percent_parallel(str(binary), np.float64, processes=2, chunk_size=700),
+    ]
+    for result_average, result_percent in results:
+        assert result_average == pytest.approx(average, rel=1e-12, abs=1e-15)
+        assert result_percent == percent
+
+
+def test_empty_input(tmp_path):
+    """Пустые список, массив и файлы отклоняются."""
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        above_average_percent([])
+    with pytest.raises(ValueError):
+        above_average_percent(np.array([], dtype=np.int64))
+    with pytest.raises(ValueError):
+        above_average_percent_file(str(empty))
+    with pytest.raises(ValueError):
+        above_average_percent_parallel(str(empty), np.int64)
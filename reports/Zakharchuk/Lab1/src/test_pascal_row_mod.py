@@ -0,0 +1,35 @@
+import math
+
+import pytest
+from lab1_2 import binomial_mod, pascal_row_mod
+
+
+@pytest.mark.parametrize("p", [2, 3, 5, 7, 13, 61, 1_000_000_007])
+def test_pascal_row_mod_matches_comb(p):
+    """Тестирование строк по модулю для p > n и p <= n."""
+    for n in range(70):
+        assert list(pascal_row_mod(n, p)) == [math.comb(n, k) % p for k in range(n + 1)]
+
+
+def test_pascal_row_mod_large_row():
+    """Тестирование длинной строки против теоремы Люка поэлементно."""
+    n = 5000
+    for p in (3, 101, 4999, 5003):
+        assert list(pascal_row_mod(n, p)) == [binomial_mod(n, k, p) for k in range(n + 1)]
+
+
+def test_pascal_row_mod_negative():
+    """Тестирование отрицательного номера строки."""
+    with pytest.raises(ValueError):
+        list(pascal_row_mod(-1, 7))
+
+
+def test_pascal_row_mod_large_prime_small_digits():
+    """Тестирование p <= n с большим p: таблицы строятся только до максимальной цифры n."""
+    p = 1_000_003
+    for n in (p, p + 3, 2 * p + 1):
+        row = list(pascal_row_mod(n, p))
+        assert len(row) == n + 1
+        for k in sorted({0, 1, 2, p - 1, p, n // 2, n - 1, n}):
+            assert row[k] == binomial_mod(n, k, p)
+        assert row[:3] == [math.comb(n, k) % p for k in range(3)]
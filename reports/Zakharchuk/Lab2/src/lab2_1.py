@@ -1,4 +1,12 @@
 import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для TriangleBatch
+    np = None
+
 
 class IsoscelesTriangle:
     def __init__(self, a, b, c):
@@ -33,17 +41,95 @@ class IsoscelesTriangle:
         return f"Равнобедренный треугольник со сторонами: {self.a}, {self.b}, {self.c}"
 
 
-# Ввод сторон треугольника
-side1 = float(input("Введите первую сторону треугольника: "))
-side2 = float(input("Введите вторую сторону треугольника: "))
-side3 = float(input("Введите третью сторону треугольника: "))
+class TriangleBatch:
+    """N равнобедренных треугольников в трёх массивах numpy a <= b <= c с правилами IsoscelesTriangle."""
 
-# Проверка на равнобедренность
-try:
-    triangle = IsoscelesTriangle(side1, side2, side3)
-    print(triangle)
-    if triangle.exists():
-        print("Периметр:", triangle.perimeter())
-        print("Площадь:", triangle.area())
-except ValueError as e:
-    print(e)
+    def __init__(self, sides):
+        """Проверка равнобедренности всех строк, как в конструкторе IsoscelesTriangle."""
+        sides = np.asarray(sides, dtype=np.float64)
+        if sides.ndim != 2 or sides.shape[1] != 3:
+            raise ValueError("Ожидается массив формы N x 3")
+        ordered = np.sort(sides, axis=1)
+        a, b, c = (np.ascontiguousarray(ordered[:, i]) for i in range(3))
+        # Точное сравнение, как в классе; после сортировки равные стороны стоят рядом
+        bad = np.flatnonzero((a != b) & (b != c))
+        if bad.size:
+            raise ValueError(
+                f"Для равнобедренного треугольника две стороны должны быть равны (строки {bad[:10].tolist()})"
+            )
+        # Неположительные стороны класс не отклоняет, такие треугольники просто не существуют
+        self.a, self.b, self.c = a, b, c
+
+    @classmethod
+    def from_triangles(cls, triangles):
+        """Набор из готовых объектов IsoscelesTriangle."""
+        return cls([(t.a, t.b, t.c) for t in triangles])
+
+    def __len__(self):
+        return len(self.a)
+
+    def exists(self):
+        """Маска существующих треугольников (для упорядоченных сторон хватает одного неравенства)."""
+        return self.a + self.b > self.c
+
+    def perimeter(self):
+        """Периметры; nan там, где IsoscelesTriangle.perimeter возвращает None."""
+        return np.where(self.exists(), self.a + self.b + self.c, np.nan)
+
+    def area(self):
+        """Площади по устойчивой форме формулы Герона; nan там, где IsoscelesTriangle.area возвращает None."""
+        a, b, c = self.a, self.b, self.c
+        product = (c + (b + a)) * (a - (c - b)) * (a + (c - b)) * (c + (b - a))
+        return np.where(self.exists(), 0.25 * np.sqrt(np.maximum(product, 0)), np.nan)
+
+    def equals(self, other):
+        """Попарное точное сравнение отсортированных сторон, как IsoscelesTriangle.__eq__."""
+        if len(self) != len(other):
+            raise ValueError("Наборы должны быть одной длины")
+        return (self.a == other.a) & (self.b == other.b) & (self.c == other.c)
+
+
+def benchmark(count=10**6):
+    """Сравнение скорости: count объектов IsoscelesTriangle и один TriangleBatch."""
+    rng = np.random.default_rng(0)
+    legs = rng.integers(1, 50, count).astype(np.float64)
+    sides = np.column_stack((legs, legs, rng.integers(1, 100, count).astype(np.float64)))
+
+    start = time.perf_counter()
+    triangles = [IsoscelesTriangle(a, b, c) for a, b, c in sides.tolist()]
+    existing = [t for t in triangles if t.exists()]
+    areas = [t.area() for t in existing]
+    perimeters = [t.perimeter() for t in existing]
+    print(f"{count} объектов IsoscelesTriangle: {time.perf_counter() - start:.3f} с")
+
+    start = time.perf_counter()
+    batch = TriangleBatch(sides)
+    mask = batch.exists()
+    batch_areas = batch.area()[mask]
+    batch_perimeters = batch.perimeter()[mask]
+    print(f"TriangleBatch: {time.perf_counter() - start:.3f} с")
+    assert np.allclose(areas, batch_areas) and np.allclose(perimeters, batch_perimeters)
+
+
+def main():
+    """Ввод сторон треугольника и вывод его характеристик."""
+    side1 = float(input("Введите первую сторону треугольника: "))
+    side2 = float(input("Введите вторую сторону треугольника: "))
+    side3 = float(input("Введите третью сторону треугольника: "))
+
+    # Проверка на равнобедренность
+    try:
+        triangle = IsoscelesTriangle(side1, side2, side3)
+        print(triangle)
+        if triangle.exists():
+            print("Периметр:", triangle.perimeter())
+            print("Площадь:", triangle.area())
+    except ValueError as e:
+        print(e)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,49 @@
+import pytest
+
+from lab2_1 import IsoscelesTriangle, TriangleBatch
+
+np = pytest.importorskip("numpy")
+
+# Равные стороны на разных местах, вырожденный (2, 2, 4) и несуществующие (1, 1, 5), (0, 0, 3) треугольники
+SIDES = [(5, 5, 8), (3, 3, 3), (5, 8, 5), (8, 5, 5), (2, 2, 4), (1, 1, 5), (0.5, 0.5, 0.1), (0, 0, 3)]
+
+
+def as_float(value):
+    """None у объекта соответствует nan у набора."""
+    return np.nan if value is None else value
+
+
+def test_batch_matches_objects():
+    """Маска существования, периметры и площади совпадают с IsoscelesTriangle."""
+    triangles = [IsoscelesTriangle(*sides) for sides in SIDES]
+    batch = TriangleBatch.from_triangles(triangles)
+    assert batch.exists().tolist() == [t.exists() for t in triangles]
+    assert np.allclose(batch.perimeter(), [as_float(t.perimeter()) for t in triangles], equal_nan=True)
+    assert np.allclose(batch.area(), [as_float(t.area()) for t in triangles], equal_nan=True)
+
+
+def test_not_isosceles_rejected():
+    """Строки без двух точно равных сторон отклоняются, как конструктором IsoscelesTriangle."""
+    for sides in [(3, 4, 5), (0.3, 0.1 + 0.2, 0.5)]:
+        with pytest.raises(ValueError):
+            IsoscelesTriangle(*sides)
+    with pytest.raises(ValueError, match=r"две стороны должны быть равны.*\[1, 2\]"):
+        TriangleBatch([(5, 5, 8), (3, 4, 5), (0.3, 0.1 + 0.2, 0.5)])
+
+
+def test_non_positive_sides_do_not_exist():
+    """Неположительные стороны класс принимает, а треугольник не существует: у набора nan."""
+    triangle = IsoscelesTriangle(-1, -1, 1)
+    assert not triangle.exists()
+    batch = TriangleBatch([(-1, -1, 1), (0, 0, 3), (1, 1, 0)])
+    assert not batch.exists().any()
+    assert np.isnan(batch.area()).all() and np.isnan(batch.perimeter()).all()
+
+
+def test_equals_ignores_order():
+    """Сравнение по отсортированным сторонам, как IsoscelesTriangle.__eq__."""
+    pairs = [((5, 5, 8), (8, 5, 5)), ((5, 5, 8), (5, 8, 8)), ((2, 2, 3), (2, 3, 2))]
+    left = TriangleBatch([first for first, _ in pairs])
+    right = TriangleBatch([second for _, second in pairs])
+    expected = [IsoscelesTriangle(*first) == IsoscelesTriangle(*second) for first, second in pairs]
+    assert left.equals(right).tolist() == expected == [True, False, True]
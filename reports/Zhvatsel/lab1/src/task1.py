@@ -1,5 +1,18 @@
 """Module for counting digit distribution in a sequence of numbers."""
 
+import math
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: without it the pure Python fallback is used
+    np = None
+
+LOG10_2 = math.log10(2)
+
+# 10**1 .. 10**19: every uint64 value (and int64 magnitude) is covered
+POWERS_OF_TEN = None if np is None else np.array([10**i for i in range(1, 20)], dtype=np.uint64)
+
 
 def count_digits_distribution(sequence):
     """Count the number of digits in each number of the sequence.
@@ -17,15 +30,135 @@ def count_digits_distribution(sequence):
     return distribution
 
 
-print("Введите количество чисел в последовательности:")
-n = int(input())
+def digit_length(num):
+    """Count the digits of an arbitrarily large integer without converting it to a string.
+
+    Args:
+        num (int): An integer.
+
+    Returns:
+        int: The number of decimal digits in abs(num).
+    """
+    num = abs(num)
+    if num < 10:
+        return 1
+    # The bit length bounds log10(num); the estimate is corrected by at most one step
+    exponent = int((num.bit_length() - 1) * LOG10_2)
+    while 10**exponent > num:
+        exponent -= 1
+    while 10 ** (exponent + 1) <= num:
+        exponent += 1
+    return exponent + 1
+
+
+def digit_lengths(values):
+    """Compute digit lengths of an int64 or uint64 array arithmetically.
+
+    Args:
+        values (array-like): Integers that fit into int64, or an unsigned integer array.
+
+    Returns:
+        numpy.ndarray: The number of decimal digits of each value.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == "u":
+        # Unsigned values up to 2**64 - 1 must not go through int64, where they would wrap
+        return np.searchsorted(POWERS_OF_TEN, values.astype(np.uint64), side="right") + 1
+    values = np.asarray(values, dtype=np.int64)
+    magnitudes = values.astype(np.uint64)
+    negative = values < 0
+    # Negation in uint64 wraps around, which gives the magnitude even for the int64 minimum
+    magnitudes[negative] = -magnitudes[negative]
+    return np.searchsorted(POWERS_OF_TEN, magnitudes, side="right") + 1
+
+
+def _add_chunk(totals, distribution, chunk):
+    """Add the digit lengths of one chunk to the running counts."""
+    if np is not None:
+        try:
+            lengths = digit_lengths(chunk)
+        except (OverflowError, ValueError):
+            pass  # Python big ints in the chunk: fall through to the exact fallback
+        else:
+            counts = np.bincount(lengths, minlength=len(totals))
+            totals += counts
+            return
+    for num in chunk:
+        digits = digit_length(int(num))
+        distribution[digits] = distribution.get(digits, 0) + 1
+
+
+def count_digits_distribution_chunks(chunks):
+    """Count the digit distribution over an iterable of chunks without materializing them.
+
+    Args:
+        chunks (iterable): Lists or NumPy arrays of integers.
+
+    Returns:
+        dict: A dictionary mapping the number of digits to their frequency.
+    """
+    totals = np.zeros(21, dtype=np.int64) if np is not None else None
+    distribution = {}
+    for chunk in chunks:
+        _add_chunk(totals, distribution, chunk)
+    if totals is not None:
+        for digits in np.flatnonzero(totals).tolist():
+            distribution[digits] = distribution.get(digits, 0) + int(totals[digits])
+    return distribution
+
+
+def count_digits_distribution_fast(sequence):
+    """Count the digit distribution of an array or list of integers in one vectorized call.
+
+    Args:
+        sequence (list or numpy.ndarray): Integers (Python big ints are supported).
+
+    Returns:
+        dict: A dictionary mapping the number of digits to their frequency.
+    """
+    return count_digits_distribution_chunks([sequence])
+
+
+def read_chunks(path, chunk_lines=1 << 20):
+    """Read whitespace-separated integers from a text file chunk by chunk.
+
+    Args:
+        path (str): Path to the file.
+        chunk_lines (int): Number of lines per chunk.
+
+    Yields:
+        list: Tokens of the next chunk as strings.
+    """
+    with open(path, encoding="utf-8") as file:
+        while True:
+            lines = list(islice(file, chunk_lines))
+            if not lines:
+                return
+            yield " ".join(lines).split()
+
+
+def count_digits_distribution_file(path, chunk_lines=1 << 20):
+    """Count the digit distribution of the integers stored in a text file.
+
+    Args:
+        path (str): Path to the file with whitespace-separated integers.
+        chunk_lines (int): Number of lines processed at a time.
+
+    Returns:
+        dict: A dictionary mapping the number of digits to their frequency.
+    """
+    return count_digits_distribution_chunks(read_chunks(path, chunk_lines))
+
+
+if __name__ == "__main__":
+    print("Введите количество чисел в последовательности:")
+    n = int(input())
 
-input_sequence = []
-print(f"Введите {n} целых чисел (каждое на новой строке):")
-for _ in range(n):
-    input_num = int(input())
-    input_sequence.append(input_num)
+    input_sequence = []
+    print(f"Введите {n} целых чисел (каждое на новой строке):")
+    for _ in range(n):
+        input_num = int(input())
+        input_sequence.append(input_num)
 
-result = count_digits_distribution(input_sequence)
-for num_digits, count in sorted(result.items()):
-    print(f"Чисел с {num_digits} цифрой(ами): {count}")
+    result = count_digits_distribution(input_sequence)
+    for num_digits, count in sorted(result.items()):
+        print(f"Чисел с {num_digits} цифрой(ами): {count}")
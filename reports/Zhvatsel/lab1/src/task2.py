@@ -1,5 +1,13 @@
 """Module for calculating the Hamming weight of positive integers."""
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: popcount_bytes works without it
+    np = None
+
+# Number of set bits in every possible byte value
+BYTE_WEIGHTS = bytes(bin(i).count("1") for i in range(256))
+
 
 def hamming_weight(n):
     """Calculate the Hamming weight (number of 1s in binary) of a number.
@@ -13,10 +21,88 @@ def hamming_weight(n):
     return bin(n).count("1")
 
 
-print("Введите количество тестов:")
-t = int(input())
+def popcount_bytes(buffer, chunk_size=1 << 20):
+    """Calculate per-byte and total Hamming weights of a raw buffer chunk by chunk.
+
+    The buffer is never copied as a whole: each chunk is looked up in the byte
+    weight table (with NumPy when it is installed, bytes.translate otherwise)
+    straight into the output array.
+
+    Args:
+        buffer (bytes-like): Raw data (bytes, bytearray, memoryview, mmap).
+        chunk_size (int): Number of bytes processed per step.
+
+    Returns:
+        tuple: Per-byte weights as a bytearray and the total population count.
+    """
+    view = memoryview(buffer).cast("B")
+    weights = bytearray(len(view))
+    total = 0
+    if np is not None:
+        table = np.frombuffer(BYTE_WEIGHTS, dtype=np.uint8)
+        out = np.frombuffer(weights, dtype=np.uint8)
+        for start in range(0, len(view), chunk_size):
+            chunk_weights = out[start : start + chunk_size]
+            np.take(table, np.frombuffer(view[start : start + chunk_size], dtype=np.uint8), out=chunk_weights)
+            total += int(chunk_weights.sum(dtype=np.uint64))
+        return weights, total
+    for start in range(0, len(view), chunk_size):
+        chunk_weights = bytes(view[start : start + chunk_size]).translate(BYTE_WEIGHTS)
+        weights[start : start + len(chunk_weights)] = chunk_weights
+        total += sum(chunk_weights)
+    return weights, total
+
+
+def _as_unsigned(array):
+    """View signed integers as unsigned ones of the same width (two's complement bits)."""
+    if array.dtype.kind == "i":
+        return array.view(array.dtype.str.replace("i", "u"))
+    return array
+
+
+def _bitwise_count_weights(array):
+    return np.bitwise_count(array)
+
+
+def _lookup_weights(array):
+    # Older NumPy: look up every byte and add the bytes of each element together
+    table = np.frombuffer(BYTE_WEIGHTS, dtype=np.uint8)
+    byte_view = np.ascontiguousarray(array).view(np.uint8).reshape(-1, array.dtype.itemsize)
+    return table[byte_view].sum(axis=1, dtype=np.uint8).reshape(array.shape)
+
+
+def hamming_weights(values, dtype="uint64"):
+    """Calculate Hamming weights of all elements of an integer array or raw buffer.
+
+    Signed elements are counted in two's complement, so -1 as int64 has weight 64.
+
+    Args:
+        values (numpy.ndarray or bytes-like): Integer array, or a raw buffer
+            interpreted as elements of the given dtype.
+        dtype (str): Element type used for raw buffers.
+
+    Returns:
+        tuple: Per-element weights (numpy.ndarray of uint8) and the total population count.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for hamming_weights, use popcount_bytes instead")
+    if isinstance(values, np.ndarray):
+        array = values
+    else:
+        array = np.frombuffer(values, dtype=dtype)
+    if array.dtype.kind not in "iu":
+        raise TypeError(f"Integer elements are expected, got {array.dtype}")
+
+    array = _as_unsigned(array)
+    weights = _bitwise_count_weights(array) if hasattr(np, "bitwise_count") else _lookup_weights(array)
+    return weights, int(weights.sum(dtype=np.uint64))
+
+
+if __name__ == "__main__":
+    print("Введите количество тестов:")
+    t = int(input())
 
-print(f"Введите {t} положительных целых чисел (каждое на новой строке):")
-for _ in range(t):
-    input_n = int(input())
-    print(f"Input: n = {input_n}, Output: {hamming_weight(input_n)}")
+    print(f"Введите {t} положительных целых чисел (каждое на новой строке):")
+    for _ in range(t):
+        input_n = int(input())
+        print(f"Input: n = {input_n}, Output: {hamming_weight(input_n)}")
@@ -0,0 +1,29 @@
+"""Module for testing the vectorized digit-length helpers."""
+
+import pytest
+
+import task1
+
+np = pytest.importorskip("numpy")
+
+
+def test_uint64_values_do_not_wrap():
+    """Test that uint64 values above the int64 range keep their digit count."""
+    values = np.array([2**64 - 1, 2**63, 2**63 - 1, 0, 9, 10], dtype=np.uint64)
+    assert task1.digit_lengths(values).tolist() == [20, 19, 19, 1, 1, 2]
+    assert task1.count_digits_distribution_fast(np.array([2**64 - 1], dtype=np.uint64)) == {20: 1}
+
+
+def test_signed_and_unsigned_match_reference():
+    """Test every integer dtype against the string-based counter."""
+    for dtype in (np.int8, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64):
+        info = np.iinfo(dtype)
+        values = np.array([info.min, info.max, 0, 1, info.max // 3], dtype=dtype)
+        expected = task1.count_digits_distribution([int(value) for value in values])
+        assert task1.count_digits_distribution_fast(values) == expected
+
+
+def test_big_python_ints_fall_back():
+    """Test that Python ints beyond 64 bits use the exact fallback."""
+    values = [2**64 - 1, -(2**63), 10**30]
+    assert task1.count_digits_distribution_fast(values) == task1.count_digits_distribution(values)
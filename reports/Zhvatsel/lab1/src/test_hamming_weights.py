@@ -0,0 +1,44 @@
+"""Module for testing the bulk popcount helpers."""
+
+import pytest
+
+import task2
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("lookup_table", [False, True])
+def test_signed_values_counted_as_twos_complement(monkeypatch, lookup_table):
+    """Test that bitwise_count and the lookup-table fallback agree on negative values."""
+    if lookup_table:
+        monkeypatch.delattr(np, "bitwise_count", raising=False)
+    elif not hasattr(np, "bitwise_count"):
+        pytest.skip("NumPy without bitwise_count")
+    weights, total = task2.hamming_weights(np.array([-1, 5, -8], dtype=np.int64))
+    assert weights.tolist() == [64, 2, 61]
+    assert total == 127
+
+
+def test_signed_narrow_and_big_endian_types():
+    """Test signed dtypes of other widths and byte orders."""
+    assert task2.hamming_weights(np.array([-1, -128], dtype=np.int8))[0].tolist() == [8, 1]
+    assert task2.hamming_weights(np.array([-1, 3], dtype=">i4"))[0].tolist() == [32, 2]
+
+
+def test_raw_buffer_matches_hamming_weight():
+    """Test that a raw buffer is interpreted with the given dtype."""
+    values = np.arange(1000, dtype=np.uint32)
+    weights, total = task2.hamming_weights(values.tobytes(), dtype="uint32")
+    assert weights.tolist() == [task2.hamming_weight(int(value)) for value in values]
+    assert total == sum(weights.tolist())
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_popcount_bytes_in_chunks(monkeypatch, use_numpy):
+    """Test chunked per-byte weights with and without NumPy."""
+    if not use_numpy:
+        monkeypatch.setattr(task2, "np", None)
+    data = bytes(range(256)) * 3 + b"\xff"
+    weights, total = task2.popcount_bytes(memoryview(data), chunk_size=100)
+    assert bytes(weights) == bytes(bin(byte).count("1") for byte in data)
+    assert total == sum(bin(byte).count("1") for byte in data)
@@ -0,0 +1,106 @@
+"""Module for testing the sorted-array ToleranceRealNumberSet."""
+
+import random
+
+import pytest
+
+import task1
+
+pytestmark = pytest.mark.usefixtures("backend")
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run every test with NumPy and with the pure Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(task1, "np", None)
+    return request.param
+
+
+def _near(value, others, tolerance):
+    return any(abs(value - other) <= tolerance for other in others)
+
+
+def test_tolerance_dedup():
+    """Test that values within tolerance of a kept value are dropped."""
+    numbers = task1.ToleranceRealNumberSet([1.0, 1.05, 1.15, 1.2, 3.0, 2.95], tolerance=0.1)
+    assert numbers.elements == [1.0, 1.15, 2.95]
+    assert not numbers.add_element(1.09)
+    assert numbers.add_element(1.5)
+    assert 3.0 in numbers and 3.06 not in numbers
+    assert numbers.remove_element(3.04)
+    assert numbers.elements == [1.0, 1.15, 1.5]
+
+
+def test_update_keeps_existing_elements():
+    """Test that a bulk update never replaces an element already in the set."""
+    numbers = task1.ToleranceRealNumberSet([1.0, 1.15], tolerance=0.1)
+    numbers.update([0.92])
+    assert numbers.elements == [1.0, 1.15]
+    assert not numbers.add_element(0.92)
+    numbers.update([0.85, 0.8, 1.3, 1.32])
+    assert numbers.elements == [0.8, 1.0, 1.15, 1.3]
+
+
+def test_bulk_matches_add_element():
+    """Test that update and union agree with add_element called in ascending order."""
+    rng = random.Random(3)
+    tolerance = 0.1
+    for _ in range(50):
+        initial = [rng.randint(0, 300) / 100 for _ in range(10)]
+        incoming = [rng.randint(0, 300) / 100 for _ in range(20)]
+        expected = task1.ToleranceRealNumberSet(initial, tolerance)
+        for value in sorted(incoming):
+            expected.add_element(value)
+        updated = task1.ToleranceRealNumberSet(initial, tolerance)
+        updated.update(incoming)
+        assert updated.elements == expected.elements
+        other = task1.ToleranceRealNumberSet(incoming, tolerance)
+        expected = task1.ToleranceRealNumberSet(initial, tolerance)
+        for value in other:
+            expected.add_element(value)
+        assert task1.ToleranceRealNumberSet(initial, tolerance).union(other).elements == expected.elements
+
+
+def test_union_merges_near_values():
+    """Test that the union keeps values of both sets and merges near-equal ones."""
+    first = task1.ToleranceRealNumberSet([1.0, 2.0, 5.0], tolerance=0.1)
+    second = task1.ToleranceRealNumberSet([0.5, 2.05, 4.0, 5.0], tolerance=0.1)
+    assert first.union(second).elements == [0.5, 1.0, 2.0, 4.0, 5.0]
+    plain = task1.RealNumberSet([6.0, 1.02])
+    assert first.union(plain).elements == [1.0, 2.0, 5.0, 6.0]
+
+
+def test_intersection_matches_within_tolerance():
+    """Test that the intersection keeps the values of this set that have a near match."""
+    first = task1.ToleranceRealNumberSet([1.0, 2.0, 3.0, 4.0], tolerance=0.1)
+    second = task1.ToleranceRealNumberSet([0.95, 2.5, 3.08, 9.0], tolerance=0.1)
+    assert first.intersection(second).elements == [1.0, 3.0]
+    assert first.intersection(task1.RealNumberSet([4.05])).elements == [4.0]
+    assert len(first.intersection(task1.ToleranceRealNumberSet(tolerance=0.1))) == 0
+
+
+def test_random_sets_match_reference():
+    """Test union and intersection of random sets against a brute-force check."""
+    rng = random.Random(7)
+    tolerance = 0.05
+    for _ in range(50):
+        first = task1.ToleranceRealNumberSet([rng.randint(0, 400) / 100 for _ in range(30)], tolerance)
+        second = task1.ToleranceRealNumberSet([rng.randint(0, 400) / 100 for _ in range(30)], tolerance)
+        common = first.intersection(second).elements
+        assert common == [value for value in first if _near(value, second.elements, tolerance)]
+        union = first.union(second).elements
+        assert union == sorted(union)
+        assert all(b - a > tolerance for a, b in zip(union, union[1:]))
+        assert all(_near(value, union, tolerance) for value in first.elements + second.elements)
+
+
+def test_invalid_operand():
+    """Test that set operations reject objects that are not sets of real numbers."""
+    numbers = task1.ToleranceRealNumberSet([1.0])
+    with pytest.raises(ValueError):
+        numbers.union([1.0])
+    with pytest.raises(ValueError):
+        numbers.intersection({1.0})